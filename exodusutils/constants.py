@@ -1,48 +1,109 @@
 """Constants used by the Python Exodus Utilities library."""
 
-from typing import NewType
+import sys
+from array import array
+from enum import IntEnum
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Final  # Python 3.8+, only needed by type checkers
+    from typing import TypeAlias  # Python 3.10+, only needed by type checkers
+
+# Names exported by ``from .constants import *``. The lazily built numpy tables (the *_TABLE names and SIDE_NODES)
+# are left out, since listing them here would build them all on a star import. Import them by name.
+__all__ = [
+    "LIB_NAME",
+    # side to node tables and helpers
+    "tri_table", "tri3_table", "quad_table", "shell_table", "tetra_table", "wedge6_table", "wedge12_table",
+    "wedge15_table", "wedge20_table", "wedge21_table", "wedge18_table", "hex_table", "hex16_table", "pyramid_table",
+    "table", "side_nodes_for", "numba_side_tables",
+    # name formatting and I/O settings
+    "NC", "fmt", "IO_HINTS", "IO_FILTERS",
+    # types
+    "ObjectType", "VariableType", "ElementTopography",
+    # object and variable types
+    "ELEMBLOCK", "NODESET", "SIDESET", "GLOBAL_VAR", "NODAL_VAR", "ELEMENTAL_VAR", "NODESET_VAR", "SIDESET_VAR",
+    # element topologies
+    "CIRCLE", "SPHERE", "QUAD", "TRIANGLE", "SHELL", "HEX", "TETRA", "WEDGE", "PYRAMID", "BEAM", "TRUSS", "BAR",
+    "EDGE", "NULL", "UNKNOWN",
+    # NetCDF entity names
+    "ATT_TITLE", "ATT_MAX_NAME_LENGTH", "DIM_NAME_LENGTH", "ATT_API_VER", "ATT_API_VER_OLD", "ATT_VERSION",
+    "DIM_STRING_LENGTH", "DIM_LINE_LENGTH", "ATT_FILE_SIZE", "ATT_64BIT_INT", "ATT_WORD_SIZE", "ATT_WORD_SIZE_OLD",
+    "DIM_NUM_INFO", "VAR_INFO", "DIM_NUM_QA", "DIM_FOUR", "VAR_QA", "DIM_NUM_DIM", "VAR_COORD", "VAR_COORD_X",
+    "VAR_COORD_Y", "VAR_COORD_Z", "VAR_COORD_NAMES", "DIM_NUM_NODES", "DIM_NUM_ELEM", "DIM_NUM_EB", "DIM_NUM_NS",
+    "DIM_NUM_SS", "VAR_NS_NAMES", "VAR_SS_NAMES", "VAR_EB_NAMES", "VAR_ELEM_ORDER_MAP", "VAR_NODE_ID_MAP",
+    "VAR_ELEM_ID_MAP", "VAR_NS_ID_MAP", "VAR_SS_ID_MAP", "VAR_EB_ID_MAP", "DIM_NUM_TIME_STEP", "VAR_TIME_WHOLE",
+    "DIM_NUM_GLO_VAR", "DIM_NUM_NOD_VAR", "DIM_NUM_ELEM_VAR", "DIM_NUM_NS_VAR", "DIM_NUM_SS_VAR",
+    "VAR_VALS_NOD_VAR_SMALL", "VAR_VALS_NOD_VAR_LARGE", "VAR_VALS_GLO_VAR", "VAR_ELEM_TAB", "VAR_NS_TAB",
+    "VAR_SS_TAB", "VAR_VALS_ELEM_VAR", "VAR_VALS_NS_VAR", "VAR_VALS_SS_VAR", "VAR_NAME_GLO_VAR", "VAR_NAME_NOD_VAR",
+    "VAR_NAME_ELEM_VAR", "VAR_NAME_NS_VAR", "VAR_NAME_SS_VAR", "DIM_NUM_NODE_NS", "VAR_NODE_NS", "VAR_DF_NS",
+    "VAR_ELEM_SS", "DIM_NUM_SIDE_SS", "VAR_SIDE_SS", "DIM_NUM_DF_SS", "VAR_DF_SS", "DIM_NUM_NOD_PER_EL",
+    "DIM_NUM_EL_IN_BLK", "DIM_NUM_ATT_IN_BLK", "VAR_CONNECT", "ATTR_ELEM_TYPE", "VAR_ELEM_ATTRIB",
+    "VAR_ELEM_ATTRIB_NAME", "VAR_NS_PROP", "VAR_SS_PROP", "VAR_EB_PROP", "ATTR_NAME", "VAR_NS_STATUS",
+    "VAR_SS_STATUS", "VAR_EB_STATUS",
+]
 
 LIB_NAME = "Python Exodus Utilities"
 
-# Types
-ObjectType = NewType('ObjectType', str)
-VariableType = NewType('VariableType', str)
-ElementTopography = NewType('ElementTopography', str)
+# Types (plain aliases of str, so they cost nothing at runtime)
+ObjectType: "TypeAlias" = str
+VariableType: "TypeAlias" = str
+ElementTopography: "TypeAlias" = str
 
 # Constants
-ELEMBLOCK = ObjectType("elblock")
+ELEMBLOCK: "Final[ObjectType]" = sys.intern("elblock")
 """Represents an element block."""
-NODESET = ObjectType("nodeset")
+NODESET: "Final[ObjectType]" = sys.intern("nodeset")
 """Represents a node set."""
-SIDESET = ObjectType("sideset")
+SIDESET: "Final[ObjectType]" = sys.intern("sideset")
 """Represents a side set."""
 
-GLOBAL_VAR = VariableType("global")
+GLOBAL_VAR: "Final[VariableType]" = sys.intern("global")
 """Represents global variables."""
-NODAL_VAR = VariableType("node")
+NODAL_VAR: "Final[VariableType]" = sys.intern("node")
 """Represents nodal variables."""
-ELEMENTAL_VAR = VariableType("elem")
+ELEMENTAL_VAR: "Final[VariableType]" = sys.intern("elem")
 """Represents elemental variables."""
-NODESET_VAR = VariableType("nodeset")
+NODESET_VAR: "Final[VariableType]" = sys.intern("nodeset")
 """Represents node set variables."""
-SIDESET_VAR = VariableType("sideset")
+SIDESET_VAR: "Final[VariableType]" = sys.intern("sideset")
 """Represents side set variables."""
 
-CIRCLE = ElementTopography("CIRCLE")
-SPHERE = ElementTopography("SPHERE")
-QUAD = ElementTopography("QUAD")
-TRIANGLE = ElementTopography("TRIANGLE")
-SHELL = ElementTopography("SHELL")
-HEX = ElementTopography("HEX")
-TETRA = ElementTopography("TETRA")
-WEDGE = ElementTopography("WEDGE")
-PYRAMID = ElementTopography("PYRAMID")
-BEAM = ElementTopography("BEAM")
-TRUSS = ElementTopography("TRUSS")
-BAR = ElementTopography("BAR")
-EDGE = ElementTopography("EDGE")
-NULL = ElementTopography("NULL")  # This isn't officially supported by this library
-UNKNOWN = ElementTopography("UNKNOWN")
+
+class _VarKind(IntEnum):
+    """Integer tags for the variable types. FOR INTERNAL USE ONLY!"""
+    GLOBAL = 0
+    NODAL = 1
+    ELEM = 2
+    NS = 3
+    SS = 4
+
+
+# Maps the public variable type strings to their internal tags
+_STR_TO_KIND = {
+    GLOBAL_VAR: _VarKind.GLOBAL,
+    NODAL_VAR: _VarKind.NODAL,
+    ELEMENTAL_VAR: _VarKind.ELEM,
+    NODESET_VAR: _VarKind.NS,
+    SIDESET_VAR: _VarKind.SS,
+}
+
+CIRCLE: "Final[ElementTopography]" = sys.intern("CIRCLE")
+SPHERE: "Final[ElementTopography]" = sys.intern("SPHERE")
+QUAD: "Final[ElementTopography]" = sys.intern("QUAD")
+TRIANGLE: "Final[ElementTopography]" = sys.intern("TRIANGLE")
+SHELL: "Final[ElementTopography]" = sys.intern("SHELL")
+HEX: "Final[ElementTopography]" = sys.intern("HEX")
+TETRA: "Final[ElementTopography]" = sys.intern("TETRA")
+WEDGE: "Final[ElementTopography]" = sys.intern("WEDGE")
+PYRAMID: "Final[ElementTopography]" = sys.intern("PYRAMID")
+BEAM: "Final[ElementTopography]" = sys.intern("BEAM")
+TRUSS: "Final[ElementTopography]" = sys.intern("TRUSS")
+BAR: "Final[ElementTopography]" = sys.intern("BAR")
+EDGE: "Final[ElementTopography]" = sys.intern("EDGE")
+NULL: "Final[ElementTopography]" = sys.intern("NULL")  # This isn't officially supported by this library
+UNKNOWN: "Final[ElementTopography]" = sys.intern("UNKNOWN")
 
 # Side to node translation tables
 # triangle
@@ -171,84 +232,243 @@ pyramid_table = [
       [1, 4, 3, 2, 9, 8, 7, 6, 14]     # side 5 (quad)
   ]
 
+
+def _freeze(table):
+    """Returns a side to node table as a read-only int8 array."""
+    import numpy as np
+    arr = np.asarray(table, dtype=np.int8)
+    arr.flags.writeable = False
+    return arr
+
+
+# Side to node tables by topology name
+_TABLES = (("TRI", tri_table), ("TRI3", tri3_table), ("QUAD", quad_table), ("SHELL", shell_table),
+           ("TETRA", tetra_table), ("WEDGE6", wedge6_table), ("WEDGE12", wedge12_table), ("WEDGE15", wedge15_table),
+           ("WEDGE20", wedge20_table), ("WEDGE21", wedge21_table), ("WEDGE18", wedge18_table), ("HEX", hex_table),
+           ("HEX16", hex16_table), ("PYRAMID", pyramid_table))
+
+# All of the tables packed row by row into one int8 buffer. _TABLES_INDEX maps topology -> (offset, rows, columns).
+# This is a plain array.array so importing constants doesn't import numpy. The numpy forms below are views of it,
+# made the first time they are used.
+_TABLES_INDEX = {}
+_TABLES_FLAT = array('b')
+for _topo, _table in _TABLES:
+    _TABLES_INDEX[_topo] = (len(_TABLES_FLAT), len(_table), len(_table[0]))
+    for _row in _table:
+        _TABLES_FLAT.extend(_row)
+del _topo, _table, _row
+
+
+@lru_cache(maxsize=None)
+def table(topo):
+    """
+    Returns the side to node table of a topology as a read-only int8 array.
+
+    :param topo: topology name, e.g. "HEX" or "WEDGE15"
+    :return: 2-D view (sides x nodes) into the shared table buffer, 1-based and padded with 0
+    """
+    import numpy as np
+    offset, rows, cols = _TABLES_INDEX[topo]
+    arr = np.frombuffer(_TABLES_FLAT, dtype=np.int8)[offset:offset + rows * cols].reshape(rows, cols)
+    arr.flags.writeable = False
+    return arr
+
+
+@lru_cache(maxsize=None)
+def side_nodes_for(topo):
+    """
+    Returns the 0-based side to node table of a topology.
+
+    Indexing a block's connectivity with it gathers the nodes of every side of every element at once, e.g.
+    ``connect[:, side_nodes_for("HEX")]`` is (elements x sides x nodes). Entries that were padding are -1 and must be
+    masked off by the caller.
+
+    :param topo: topology name, e.g. "HEX" or "WEDGE15"
+    :return: read-only (sides x nodes) int8 array
+    """
+    arr = table(topo) - 1
+    arr.flags.writeable = False
+    return arr
+
+
+@lru_cache(maxsize=None)
+def numba_side_tables():
+    """
+    Returns the 0-based side to node tables in a numba typed dict, for use inside numba-compiled kernels.
+
+    numba is optional and slow to import, so it is only imported on the first call.
+
+    :return: ``numba.typed.Dict`` of topology name -> (sides x nodes) int8 array, or None if numba is not installed
+    """
+    try:
+        from numba import types
+        from numba.typed import Dict
+    except ImportError:
+        return None
+    tables = Dict.empty(key_type=types.unicode_type, value_type=types.int8[:, :])
+    for topo in _TABLES_INDEX:
+        # numba types read-only arrays differently, so store writable copies
+        tables[topo] = side_nodes_for(topo).copy()
+    return tables
+
+
+def _side_nodes():
+    side_nodes = {}
+    for topo, tbl in _TABLES:
+        for side, row in enumerate(tbl):
+            side_nodes[(topo, side)] = _freeze([n - 1 for n in row if n != 0])
+    return side_nodes
+
+
+# Names that need numpy, built by __getattr__ the first time they are used (PEP 562).
+# The *_TABLE names are the array forms of the side to node tables. Rows can be sliced, e.g. HEX_TABLE[side, 0:4] - 1
+# gives the 0-based connectivity indices of the first four nodes of a hex side.
+# SIDE_NODES maps (topology, 0-based side) -> 0-based connectivity indices of every node on that side, with the 0
+# padding removed. Topologies are the same as for table(), e.g. SIDE_NODES[("HEX", 0)] are the nodes of side 1 of a hex.
+_LAZY = {topo + "_TABLE": (lambda topo=topo: table(topo)) for topo in _TABLES_INDEX}
+_LAZY["SIDE_NODES"] = _side_nodes
+
+
+def __getattr__(name):
+    try:
+        make = _LAZY[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name)) from None
+    value = make()
+    # Cache the value so later lookups don't come back through here
+    globals()[name] = value
+    return value
+
+
 # NetCDF entity names
-ATT_TITLE = "title"
-ATT_MAX_NAME_LENGTH = "maximum_name_length"
-DIM_NAME_LENGTH = "len_name"
-ATT_API_VER = "api_version"
-ATT_API_VER_OLD = "api version"
-ATT_VERSION = "version"
-DIM_STRING_LENGTH = "len_string"
-DIM_LINE_LENGTH = "len_line"
-ATT_FILE_SIZE = "file_size"
-ATT_64BIT_INT = "int64_status"
-ATT_WORD_SIZE = "floating_point_word_size"
-ATT_WORD_SIZE_OLD = "floating point word size"
-DIM_NUM_INFO = "num_info"
-VAR_INFO = "info_records"
-DIM_NUM_QA = "num_qa_rec"
-DIM_FOUR = "four"
-VAR_QA = "qa_records"
-DIM_NUM_DIM = "num_dim"
-VAR_COORD = "coord"
-VAR_COORD_X = "coordx"
-VAR_COORD_Y = "coordy"
-VAR_COORD_Z = "coordz"
-VAR_COORD_NAMES = "coor_names"
-DIM_NUM_NODES = "num_nodes"
-DIM_NUM_ELEM = "num_elem"
-DIM_NUM_EB = "num_el_blk"
-DIM_NUM_NS = "num_node_sets"
-DIM_NUM_SS = "num_side_sets"
-VAR_NS_NAMES = "ns_names"
-VAR_SS_NAMES = "ss_names"
-VAR_EB_NAMES = "eb_names"
-VAR_ELEM_ORDER_MAP = "elem_map"
-VAR_NODE_ID_MAP = "node_num_map"
-VAR_ELEM_ID_MAP = "elem_num_map"
-VAR_NS_ID_MAP = "ns_prop1"
-VAR_SS_ID_MAP = "ss_prop1"
-VAR_EB_ID_MAP = "eb_prop1"
-DIM_NUM_TIME_STEP = "time_step"
-VAR_TIME_WHOLE = "time_whole"
-DIM_NUM_GLO_VAR = "num_glo_var"
-DIM_NUM_NOD_VAR = "num_nod_var"
-DIM_NUM_ELEM_VAR = "num_elem_var"
-DIM_NUM_NS_VAR = "num_nset_var"
-DIM_NUM_SS_VAR = "num_sset_var"
-VAR_VALS_NOD_VAR_SMALL = "vals_nod_var"
-VAR_VALS_NOD_VAR_LARGE = "vals_nod_var%d"
-VAR_VALS_GLO_VAR = "vals_glo_var"
-VAR_ELEM_TAB = "elem_var_tab"
-VAR_NS_TAB = "nset_var_tab"
-VAR_SS_TAB = "sset_var_tab"
-VAR_VALS_ELEM_VAR = "vals_elem_var%deb%d"
-VAR_VALS_NS_VAR = "vals_nset_var%dns%d"
-VAR_VALS_SS_VAR = "vals_sset_var%dss%d"
-VAR_NAME_GLO_VAR = "name_glo_var"
-VAR_NAME_NOD_VAR = "name_nod_var"
-VAR_NAME_ELEM_VAR = "name_elem_var"
-VAR_NAME_NS_VAR = "name_nset_var"
-VAR_NAME_SS_VAR = "name_sset_var"
-DIM_NUM_NODE_NS = "num_nod_ns%d"
-VAR_NODE_NS = "node_ns%d"
-VAR_DF_NS = "dist_fact_ns%d"
-VAR_ELEM_SS = "elem_ss%d"
-DIM_NUM_SIDE_SS = "num_side_ss%d"
-VAR_SIDE_SS = "side_ss%d"
-DIM_NUM_DF_SS = "num_df_ss%d"
-VAR_DF_SS = "dist_fact_ss%d"
-DIM_NUM_NOD_PER_EL = "num_nod_per_el%d"
-DIM_NUM_EL_IN_BLK = "num_el_in_blk%d"
-DIM_NUM_ATT_IN_BLK = "num_att_in_blk%d"
-VAR_CONNECT = "connect%d"
-ATTR_ELEM_TYPE = "elem_type"
-VAR_ELEM_ATTRIB = "attrib%d"
-VAR_ELEM_ATTRIB_NAME = "attrib_name%d"
-VAR_NS_PROP = "ns_prop%d"
-VAR_SS_PROP = "ss_prop%d"
-VAR_EB_PROP = "eb_prop%d"
-ATTR_NAME = "name"
-VAR_NS_STATUS = "ns_status"
-VAR_SS_STATUS = "ss_status"
-VAR_EB_STATUS = "eb_status"
+ATT_TITLE: "Final[str]" = "title"
+ATT_MAX_NAME_LENGTH: "Final[str]" = "maximum_name_length"
+DIM_NAME_LENGTH: "Final[str]" = "len_name"
+ATT_API_VER: "Final[str]" = "api_version"
+ATT_API_VER_OLD: "Final[str]" = "api version"
+ATT_VERSION: "Final[str]" = "version"
+DIM_STRING_LENGTH: "Final[str]" = "len_string"
+DIM_LINE_LENGTH: "Final[str]" = "len_line"
+ATT_FILE_SIZE: "Final[str]" = "file_size"
+ATT_64BIT_INT: "Final[str]" = "int64_status"
+ATT_WORD_SIZE: "Final[str]" = "floating_point_word_size"
+ATT_WORD_SIZE_OLD: "Final[str]" = "floating point word size"
+DIM_NUM_INFO: "Final[str]" = "num_info"
+VAR_INFO: "Final[str]" = "info_records"
+DIM_NUM_QA: "Final[str]" = "num_qa_rec"
+DIM_FOUR: "Final[str]" = "four"
+VAR_QA: "Final[str]" = "qa_records"
+DIM_NUM_DIM: "Final[str]" = "num_dim"
+VAR_COORD: "Final[str]" = "coord"
+VAR_COORD_X: "Final[str]" = "coordx"
+VAR_COORD_Y: "Final[str]" = "coordy"
+VAR_COORD_Z: "Final[str]" = "coordz"
+VAR_COORD_NAMES: "Final[str]" = "coor_names"
+DIM_NUM_NODES: "Final[str]" = "num_nodes"
+DIM_NUM_ELEM: "Final[str]" = "num_elem"
+DIM_NUM_EB: "Final[str]" = "num_el_blk"
+DIM_NUM_NS: "Final[str]" = "num_node_sets"
+DIM_NUM_SS: "Final[str]" = "num_side_sets"
+VAR_NS_NAMES: "Final[str]" = "ns_names"
+VAR_SS_NAMES: "Final[str]" = "ss_names"
+VAR_EB_NAMES: "Final[str]" = "eb_names"
+VAR_ELEM_ORDER_MAP: "Final[str]" = "elem_map"
+VAR_NODE_ID_MAP: "Final[str]" = "node_num_map"
+VAR_ELEM_ID_MAP: "Final[str]" = "elem_num_map"
+VAR_NS_ID_MAP: "Final[str]" = "ns_prop1"
+VAR_SS_ID_MAP: "Final[str]" = "ss_prop1"
+VAR_EB_ID_MAP: "Final[str]" = "eb_prop1"
+DIM_NUM_TIME_STEP: "Final[str]" = "time_step"
+VAR_TIME_WHOLE: "Final[str]" = "time_whole"
+DIM_NUM_GLO_VAR: "Final[str]" = "num_glo_var"
+DIM_NUM_NOD_VAR: "Final[str]" = "num_nod_var"
+DIM_NUM_ELEM_VAR: "Final[str]" = "num_elem_var"
+DIM_NUM_NS_VAR: "Final[str]" = "num_nset_var"
+DIM_NUM_SS_VAR: "Final[str]" = "num_sset_var"
+VAR_VALS_NOD_VAR_SMALL: "Final[str]" = "vals_nod_var"
+VAR_VALS_NOD_VAR_LARGE: "Final[str]" = "vals_nod_var%d"
+VAR_VALS_GLO_VAR: "Final[str]" = "vals_glo_var"
+VAR_ELEM_TAB: "Final[str]" = "elem_var_tab"
+VAR_NS_TAB: "Final[str]" = "nset_var_tab"
+VAR_SS_TAB: "Final[str]" = "sset_var_tab"
+VAR_VALS_ELEM_VAR: "Final[str]" = "vals_elem_var%deb%d"
+VAR_VALS_NS_VAR: "Final[str]" = "vals_nset_var%dns%d"
+VAR_VALS_SS_VAR: "Final[str]" = "vals_sset_var%dss%d"
+VAR_NAME_GLO_VAR: "Final[str]" = "name_glo_var"
+VAR_NAME_NOD_VAR: "Final[str]" = "name_nod_var"
+VAR_NAME_ELEM_VAR: "Final[str]" = "name_elem_var"
+VAR_NAME_NS_VAR: "Final[str]" = "name_nset_var"
+VAR_NAME_SS_VAR: "Final[str]" = "name_sset_var"
+# Variable name variables indexed by _VarKind
+_VAR_NAME_BY_KIND = (VAR_NAME_GLO_VAR, VAR_NAME_NOD_VAR, VAR_NAME_ELEM_VAR, VAR_NAME_NS_VAR, VAR_NAME_SS_VAR)
+DIM_NUM_NODE_NS: "Final[str]" = "num_nod_ns%d"
+VAR_NODE_NS: "Final[str]" = "node_ns%d"
+VAR_DF_NS: "Final[str]" = "dist_fact_ns%d"
+VAR_ELEM_SS: "Final[str]" = "elem_ss%d"
+DIM_NUM_SIDE_SS: "Final[str]" = "num_side_ss%d"
+VAR_SIDE_SS: "Final[str]" = "side_ss%d"
+DIM_NUM_DF_SS: "Final[str]" = "num_df_ss%d"
+VAR_DF_SS: "Final[str]" = "dist_fact_ss%d"
+DIM_NUM_NOD_PER_EL: "Final[str]" = "num_nod_per_el%d"
+DIM_NUM_EL_IN_BLK: "Final[str]" = "num_el_in_blk%d"
+DIM_NUM_ATT_IN_BLK: "Final[str]" = "num_att_in_blk%d"
+VAR_CONNECT: "Final[str]" = "connect%d"
+ATTR_ELEM_TYPE: "Final[str]" = "elem_type"
+VAR_ELEM_ATTRIB: "Final[str]" = "attrib%d"
+VAR_ELEM_ATTRIB_NAME: "Final[str]" = "attrib_name%d"
+VAR_NS_PROP: "Final[str]" = "ns_prop%d"
+VAR_SS_PROP: "Final[str]" = "ss_prop%d"
+VAR_EB_PROP: "Final[str]" = "eb_prop%d"
+ATTR_NAME: "Final[str]" = "name"
+VAR_NS_STATUS: "Final[str]" = "ns_status"
+VAR_SS_STATUS: "Final[str]" = "ss_status"
+VAR_EB_STATUS: "Final[str]" = "eb_status"
+
+
+class _NC:
+    """Read-only namespace holding the NetCDF entity names above, e.g. ``NC.VAR_CONNECT``."""
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError("NetCDF entity names are read-only")
+
+
+for _name, _value in list(globals().items()):
+    if _name.startswith(("ATT_", "ATTR_", "DIM_", "VAR_")) and isinstance(_value, str):
+        setattr(_NC, _name, _value)
+del _name, _value
+
+NC = _NC()
+
+
+@lru_cache(maxsize=8192)
+def fmt(template: str, *args: int) -> str:
+    """
+    Fills a printf-style NetCDF name template with integer arguments, e.g. fmt(VAR_CONNECT, 1) == "connect1".
+
+    Results are cached, so looking up the same numbered variable again does not build a new string.
+    """
+    return template % args
+
+
+# Chunking and compression used when writing NetCDF4 files, looked up by variable name prefix.
+# Exodus readers usually want one time step of a variable for every node/element, so variables with a time dimension
+# are chunked one time step at a time. chunksizes_fn takes the variable's shape and returns its chunk shape.
+# Chunking is always applied. The zlib settings are only used when a write asks for the "zlib" filter, by default
+# variables are written uncompressed.
+IO_HINTS = {
+    VAR_VALS_NOD_VAR_SMALL: dict(chunksizes_fn=lambda shape: (1,) + tuple(min(n, 65536) for n in shape[1:]),
+                                 zlib=True, shuffle=True, complevel=4),
+    "vals_elem_var": dict(chunksizes_fn=lambda shape: (1,) + tuple(min(n, 65536) for n in shape[1:]),
+                          zlib=True, shuffle=True, complevel=4),
+    VAR_COORD: dict(zlib=True, shuffle=True, complevel=1),
+    "connect": dict(chunksizes_fn=lambda shape: (min(shape[0], 8192),) + tuple(shape[1:])),
+}
+
+# Filters a write can compress the variables IO_HINTS has zlib settings for with, as createVariable keyword arguments.
+# "zlib" uses the settings from IO_HINTS. Bitshuffle packs the same bit of every value together before LZ4
+# compression, which suits floating point data.
+IO_FILTERS = {
+    "zlib": dict(),
+    "bitshuffle": dict(compression="blosc_lz4", blosc_shuffle=2),
+}
@@ -215,6 +215,11 @@ class ElemLedger:
 
     # Returns faces of skinned mesh of form [(intern id, face number)]
     def skin_block(self, block_id, tri='shell'):
+        el_arr, face_arr = self.skin_block_arrays(block_id, tri)
+        return list(zip(el_arr.tolist(), face_arr.tolist()))
+
+    # Returns faces of skinned mesh as two parallel arrays (element ids, face numbers)
+    def skin_block_arrays(self, block_id, tri='shell'):
         block = self.find_element_block(block_id)
 
         i = 1
@@ -223,29 +228,21 @@ class ElemLedger:
             shift += self.blocks[i - 1].num_el_in_blk
             i += 1
 
-        unique_faces = block.skin_block(shift, tri)
+        rel_eids, face_nos = block.skin_block_arrays(shift, tri)
 
         # we have the internal id's, need the elem_num_map id's instead
-        converted_unique_faces = []
-        for i in unique_faces:
-            e, f = i
-            e = self.elem_num_map[e]
-            converted_unique_faces.append((e, f))
-
-        return converted_unique_faces
+        return np.asarray(self.elem_num_map)[rel_eids], face_nos
 
     def skin(self, tri='shell'):
         faces = []
         for i in range(len(self.blocks)):
             faces += self.skin_block(self.eb_prop1[i], tri=tri)
 
-        el_list = []
-        face_list = []
-        for i in faces:
-            el_list.append(i[0])
-            face_list.append(i[1])
+        if not faces:
+            return [], []
+        el_list, face_list = zip(*faces)
 
-        return el_list, face_list
+        return list(el_list), list(face_list)
 
     # Writes out element dimension data to the new dataset
     def write_dimensions(self, data):
@@ -272,7 +269,7 @@ class ElemLedger:
 
 
     # Writes out element variable data to the new dataset
-    def write_variables(self, data):
+    def write_variables(self, data, filter=None):
         names = []
         eb_status = []
         for i in self.blocks:
@@ -299,10 +296,11 @@ class ElemLedger:
         for block in self.blocks:
             blk_num = block.get_blk_num()
             connectX = block.get_connect_title()
-            data.createVariable(connectX, "int32", dimensions=("num_el_in_blk" + str(blk_num),
-                                                               "num_nod_per_el" + str(blk_num)))
-            data[connectX].setncattr('elem_type', block.get_elem_type())
-            data[connectX][:] = np.array(block.elements)
+            dimensions = ("num_el_in_blk" + str(blk_num), "num_nod_per_el" + str(blk_num))
+            connect = data.createVariable(connectX, "int32", dimensions=dimensions,
+                                          **util.io_hints(data, connectX, dimensions, filter))
+            connect.setncattr('elem_type', block.get_elem_type())
+            connect[:] = np.array(block.elements)
 
         # name_elem_var
         data.createVariable("name_elem_var", "|S1", dimensions=("num_elem_var", "len_name"), fill_value=b'\x00')
@@ -313,8 +311,10 @@ class ElemLedger:
             num = block.get_blk_num()
             for variable in block.variables:
                 var_data = block.variables[variable]
-                data.createVariable(variable, "float64", dimensions=("time_step", "num_el_in_blk{}".format(num)))
-                data[variable][:] = np.array(var_data)
+                dimensions = ("time_step", "num_el_in_blk{}".format(num))
+                vals = data.createVariable(variable, "float64", dimensions=dimensions,
+                                           **util.io_hints(data, variable, dimensions, filter))
+                vals[:] = np.array(var_data)
 
         # IF no blocks are variables, don't write out elem_var_tab (can't fit size (x, 0)) 
         if data.dimensions['num_el_blk'].size > 0 and data.dimensions['num_elem_var'].size > 0:
@@ -69,29 +69,30 @@ class ElementBlock:
 
 	# Returns a list of the unique faces of the form [(ndx, face_number)]
 	def skin_block(self, shift, tri='shell'):
-		all_faces = [] # size (num elements, faces in element)
+		rel_eids, face_nos = self.skin_block_arrays(shift, tri)
+		return list(zip(rel_eids.tolist(), face_nos.tolist()))
+
+	# Same faces as skin_block, as two parallel arrays of (shifted) element index and 1-based face number
+	def skin_block_arrays(self, shift, tri='shell'):
 		elem_iterator = element_types.get_element_type(self.elem_type, tri)
-		for i in range(len(self.elements)):
-			all_faces.append(elem_iterator.iterate_element_faces(self.elements[i]))
-
-		face_count_sorted = {} # str(face): count
-		for elem in all_faces:
-			for face in elem:
-				sort_face_str = str(sorted(face))
-				if sort_face_str in face_count_sorted:
-					face_count_sorted[str(sort_face_str)] += 1
-				else:
-					face_count_sorted[str(sort_face_str)] = 1
-		
-		unique_faces = [] # (rel_eid, face_no)
-		rel_eid = 0
-		while rel_eid < len(all_faces):
-			face_no = 1
-			while face_no <= len(all_faces[0]):
-				sorted_face_str = str(sorted(all_faces[rel_eid][face_no - 1]))
-				if face_count_sorted[sorted_face_str] == 1:
-					unique_faces.append((rel_eid + shift, face_no))
-				face_no += 1
-			rel_eid += 1
-
-		return unique_faces
\ No newline at end of file
+		elements = np.asarray(self.elements)
+		if len(elements) == 0:
+			return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+		if elements.ndim != 2 or elements.shape[1] != elem_iterator.num_nodes:
+			raise TypeError("Element type {} should have {} nodes, but elements in block {} have {} nodes"
+				.format(elem_iterator.type, elem_iterator.num_nodes, self.blk_num, elements.shape[-1]))
+
+		# Gather every face of every element at once. Faces with different node counts can never match, so faces
+		# are grouped by size and each group's sorted node lists are counted with np.unique.
+		face_indices = elem_iterator.face_indices()
+		unique = np.zeros((len(elements), len(face_indices)), dtype=bool) # (num elements, faces in element)
+		for size in set(len(indices) for indices in face_indices):
+			face_nos = [i for i, indices in enumerate(face_indices) if len(indices) == size]
+			faces = elements[:, [face_indices[i] for i in face_nos]] # (num elements, faces of this size, size)
+			faces = np.sort(faces, axis=2).reshape(-1, size)
+			_, inverse, counts = np.unique(faces, axis=0, return_inverse=True, return_counts=True)
+			unique[:, face_nos] = (counts[np.ravel(inverse)] == 1).reshape(len(elements), len(face_nos))
+
+		# nonzero walks elements first, then faces, which is the order faces are reported in
+		rel_eids, face_nos = np.nonzero(unique)
+		return rel_eids + shift, face_nos + 1
\ No newline at end of file
@@ -18,14 +18,17 @@ class ElementType(ABC):
 				.format(self.type, self.num_nodes, len(element), element))
 
 		faces = []
-		for face_no in range(1, len(self.face_map) + 1):
-			indices = self.list_to_indices(self.face_map[face_no])
-			new_face = []
-			for ndx in indices:
-				new_face.append(element[ndx])
-			faces.append(new_face)
+		for indices in self.face_indices():
+			faces.append([element[ndx] for ndx in indices])
 		return faces
 
+	# 0-based node indices of each face, converted once per element type instead of once per element
+	def face_indices(self):
+		if not hasattr(self, '_face_indices'):
+			self._face_indices = [self.list_to_indices(self.face_map[face_no])
+				for face_no in range(1, len(self.face_map) + 1)]
+		return self._face_indices
+
 
 
 class CIRCLE(ElementType):
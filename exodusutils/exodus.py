@@ -12,6 +12,11 @@ import numpy
 from .ledger import Ledger
 from . import util
 from .constants import *
+from .constants import _VarKind, _STR_TO_KIND, _VAR_NAME_BY_KIND
+# the side to node tables are made on first use, so they are not included in the * import
+from .constants import (TRI_TABLE, TRI3_TABLE, QUAD_TABLE, SHELL_TABLE, TETRA_TABLE, WEDGE6_TABLE, WEDGE12_TABLE,
+                        WEDGE15_TABLE, WEDGE20_TABLE, WEDGE21_TABLE, WEDGE18_TABLE, HEX_TABLE, HEX16_TABLE,
+                        PYRAMID_TABLE)
 
 
 @dataclass
@@ -161,6 +166,17 @@ class Exodus:
         # important for storing names in numpy arrays
         self._MAX_NAME_LENGTH_T = 'U%s' % self.max_allowed_name_length
 
+        # time values are read once and reused by step_at_time, along with whether they are sorted
+        self._times = None
+        self._times_sorted = False
+        # user-defined id -> internal id tables, built on first lookup in read mode
+        self._id_lookup = {}
+        # truth tables and property names by object type, read once in read mode (selectors ask for them repeatedly)
+        self._truth_tables = {}
+        self._property_names = {}
+        # (object type, internal id) -> params tuple, read once in read mode
+        self._object_params = {}
+
     def to_float(self, n):
         """Returns ``n`` converted to the floating-point type stored in the database."""
         # Convert a number to the floating point type the database is using
@@ -523,10 +539,7 @@ class Exodus:
     def get_reverse_node_id_dict(self):
         """Returns a dictionary with user-defined IDs as the keys and internal IDs as the values."""
         nim = self.get_node_id_map()
-        u2i_map = {}
-        for i in range(self.num_nodes):
-            u2i_map[nim[i]] = i + 1
-        return u2i_map
+        return dict(zip(numpy.ma.getdata(nim).tolist(), range(1, len(nim) + 1)))
 
     def get_partial_node_id_map(self, start, count):
         """
@@ -556,10 +569,7 @@ class Exodus:
     def get_reverse_elem_id_dict(self):
         """Returns a dictionary with user-defined IDs as the keys and internal IDs as the values."""
         eim = self.get_elem_id_map()
-        u2i_map = {}
-        for i in range(self.num_elem):
-            u2i_map[eim[i]] = i + 1
-        return u2i_map
+        return dict(zip(numpy.ma.getdata(eim).tolist(), range(1, len(eim) + 1)))
 
     def get_partial_elem_id_map(self, start, count):
         """
@@ -589,12 +599,11 @@ class Exodus:
         if self.num_elem_blk == 0:
             raise KeyError("There are no element blocks in this database!")
         internal_id = self._lookup_id(ELEMBLOCK, obj_id)
-        num_elem, _, _, _ = self._int_get_elem_block_params(obj_id, internal_id)
+        num_elem = self._int_get_num_elem_in_block(obj_id, internal_id)
         offset = 0
         emap = self.get_elem_id_map()
         for i in range(1, internal_id):
-            n, _, _, _ = self._int_get_elem_block_params(emap[i - 1], i)
-            offset += n
+            offset += self._int_get_num_elem_in_block(emap[i - 1], i)
         return self.get_partial_elem_id_map(offset + 1, num_elem)
 
     def get_node_set_id_map(self):
@@ -629,15 +638,14 @@ class Exodus:
             raise KeyError("Element block id map is missing from this database!".format(type))
         return table
 
-    def _lookup_id(self, obj_type: ObjectType, num):
+    def _int_get_id_table(self, obj_type: ObjectType):
         """
-        Returns the internal ID of a set or block of the given type and user-defined ID.
+        Returns the id map for sets or blocks of the given type.
 
         FOR INTERNAL USE ONLY!
 
-        :param obj_type: type of object this id refers to
-        :param num: user-defined ID (aka number) of the set/block
-        :return: internal ID
+        :param obj_type: type of object
+        :return: array of user-defined ids ordered by internal ID
         """
         if obj_type == NODESET:
             table = self.get_node_set_id_map()
@@ -650,23 +658,49 @@ class Exodus:
             table = self.get_elem_block_id_map()
         else:
             raise ValueError("{} is not a valid set/block type!".format(obj_type))
+        return table
+
+    def _lookup_id(self, obj_type: ObjectType, num):
+        """
+        Returns the internal ID of a set or block of the given type and user-defined ID.
+
+        FOR INTERNAL USE ONLY!
+
+        :param obj_type: type of object this id refers to
+        :param num: user-defined ID (aka number) of the set/block
+        :return: internal ID
+        """
         # The C library caches information about sets including whether its sequential, so it can skip a lot of this
-        internal_id = 1
-        for table_id in table:
-            if table_id == num:
-                break
-            internal_id += 1
-        if internal_id > len(table):
+        if self.mode == 'r':
+            # A read only file never changes, so the id table only has to be built once
+            lookup = self._id_lookup.get(obj_type)
+            if lookup is None:
+                lookup = {}
+                table = self._int_get_id_table(obj_type)
+                for internal_id, table_id in enumerate(numpy.ma.getdata(table).tolist(), 1):
+                    lookup.setdefault(table_id, internal_id)
+                self._id_lookup[obj_type] = lookup
+            if isinstance(num, numpy.ndarray):
+                # ids read straight from a netCDF variable come back as 0-d arrays, which can't be hashed
+                num = num.item()
+            try:
+                return lookup[num]
+            except (KeyError, TypeError):
+                raise KeyError("Could not find set/block of type {} with id {}".format(obj_type, num)) from None
+        # The ledger can add or remove sets, so search its current table
+        table = self._int_get_id_table(obj_type)
+        matches = numpy.flatnonzero(numpy.asarray(table) == num)
+        if len(matches) == 0:
             raise KeyError("Could not find set/block of type {} with id {}".format(obj_type, num))
-        return internal_id
+        return builtins.int(matches[0]) + 1
         # The C library also does some crazy stuff with what might be the ns_status array
 
     def get_node_set_number(self, obj_id):
         """
         Returns the internal ID (1-based) of the node set with the user-defined ID.
 
-        Note that this function is O(n) complexity for n number of node sets. While useful for quick tests, you should
-        create an ID lookup table yourself if you plan to convert IDs often.
+        In read mode the ID lookup table is built on the first call and reused afterwards. In append and write mode
+        this function is O(n) complexity for n number of sets/blocks.
         """
         return self._lookup_id(NODESET, obj_id)
 
@@ -674,8 +708,8 @@ class Exodus:
         """
         Returns the internal ID (1-based) of the side set with the user-defined ID.
 
-        Note that this function is O(n) complexity for n number of node sets. While useful for quick tests, you should
-        create an ID lookup table yourself if you plan to convert IDs often.
+        In read mode the ID lookup table is built on the first call and reused afterwards. In append and write mode
+        this function is O(n) complexity for n number of sets/blocks.
         """
         return self._lookup_id(SIDESET, obj_id)
 
@@ -683,8 +717,8 @@ class Exodus:
         """
         Returns the internal ID (1-based) of the elem block with the user-defined ID.
 
-        Note that this function is O(n) complexity for n number of node sets. While useful for quick tests, you should
-        create an ID lookup table yourself if you plan to convert IDs often.
+        In read mode the ID lookup table is built on the first call and reused afterwards. In append and write mode
+        this function is O(n) complexity for n number of sets/blocks.
         """
         return self._lookup_id(ELEMBLOCK, obj_id)
 
@@ -762,7 +796,8 @@ class Exodus:
         else:
             # Each var to its own variable
             try:
-                result = self.data.variables[VAR_VALS_NOD_VAR_LARGE % var_index][start_time_step - 1:end_time_step, :]
+                var = self.data.variables[fmt(VAR_VALS_NOD_VAR_LARGE, var_index)]
+                result = var[start_time_step - 1:end_time_step, :]
             except KeyError:
                 raise KeyError("Could not find nodal variable {} in this database!".format(var_index))
         return result
@@ -869,7 +904,7 @@ class Exodus:
         if count < 0:
             raise ValueError("Count must be a positive integer")
         try:
-            result = self.data.variables[varname % (var_index, internal_id)][
+            result = self.data.variables[fmt(varname, var_index, internal_id)][
                      start_time_step - 1:end_time_step, start_index - 1:start_index + count - 1]
         except KeyError:
             raise KeyError("Could not find variables of type {} in this database!".format(obj_type))
@@ -892,7 +927,7 @@ class Exodus:
         # This method cannot simply call its partial version because we cannot know the number of elements to read
         #  without looking up the id first. This extra id lookup call is slow, so we get around it with a helper method.
         internal_id = self._lookup_id(ELEMBLOCK, obj_id)
-        size = self._int_get_elem_block_params(obj_id, internal_id)[0]
+        size = self._int_get_num_elem_in_block(obj_id, internal_id)
         return self._int_get_partial_object_var_across_times(ELEMBLOCK, internal_id, start_time_step, end_time_step,
                                                              var_index, 1, size)
 
@@ -979,6 +1014,9 @@ class Exodus:
         :param obj_type: type of object
         :return: truth table
         """
+        # A read only file never changes, so the table only has to be read once
+        if self.mode == 'r' and obj_type in self._truth_tables:
+            return self._truth_tables[obj_type].copy()
         if obj_type == ELEMBLOCK:
             tabname = VAR_ELEM_TAB
             valname = VAR_VALS_ELEM_VAR
@@ -1003,8 +1041,10 @@ class Exodus:
             result = numpy.zeros((num_entity, num_var), dtype=self.int)
             for e in range(num_entity):
                 for v in range(num_var):
-                    if valname % (v + 1, e + 1) in self.data.variables:
+                    if fmt(valname, v + 1, e + 1) in self.data.variables:
                         result[e, v] = 1
+        if self.mode == 'r':
+            self._truth_tables[obj_type] = result.copy()
         return result
 
     def get_elem_block_truth_table(self):
@@ -1019,6 +1059,21 @@ class Exodus:
         """Returns the variable truth table for side sets."""
         return self._get_truth_table(SIDESET)
 
+    @staticmethod
+    def _int_get_var_kind(var_type: VariableType):
+        """
+        Returns the internal tag for a variable type. FOR INTERNAL USE ONLY!
+
+        :param var_type: GLOBAL_VAR, NODAL_VAR, ELEMENTAL_VAR, NODESET_VAR, or SIDESET_VAR from `exodusutils.constants`
+        :return: the matching `_VarKind`
+        """
+        if isinstance(var_type, _VarKind):
+            return var_type
+        try:
+            return _STR_TO_KIND[var_type]
+        except (KeyError, TypeError):
+            raise ValueError("Invalid variable type {}!".format(var_type))
+
     def _get_var_names(self, var_type: VariableType):
         """
         Returns a list of variable names for objects of a given type.
@@ -1026,18 +1081,7 @@ class Exodus:
         :param var_type: the type of variable
         :return: a list of variable names
         """
-        if var_type == GLOBAL_VAR:
-            varname = VAR_NAME_GLO_VAR
-        elif var_type == NODAL_VAR:
-            varname = VAR_NAME_NOD_VAR
-        elif var_type == ELEMENTAL_VAR:
-            varname = VAR_NAME_ELEM_VAR
-        elif var_type == NODESET_VAR:
-            varname = VAR_NAME_NS_VAR
-        elif var_type == SIDESET_VAR:
-            varname = VAR_NAME_SS_VAR
-        else:
-            raise ValueError("Invalid variable type {}!".format(var_type))
+        varname = _VAR_NAME_BY_KIND[self._int_get_var_kind(var_type)]
         try:
             names = self.data.variables[varname][:]
         except KeyError:
@@ -1054,18 +1098,7 @@ class Exodus:
         :param var_type: GLOBAL_VAR, NODAL_VAR, ELEMENTAL_VAR, NODESET_VAR, or SIDESET_VAR from `exodusutils.constants`
         :return: True if this variable type has names defined, false otherwise
         """
-        if var_type == GLOBAL_VAR:
-            varname = VAR_NAME_GLO_VAR
-        elif var_type == NODAL_VAR:
-            varname = VAR_NAME_NOD_VAR
-        elif var_type == ELEMENTAL_VAR:
-            varname = VAR_NAME_ELEM_VAR
-        elif var_type == NODESET_VAR:
-            varname = VAR_NAME_NS_VAR
-        elif var_type == SIDESET_VAR:
-            varname = VAR_NAME_SS_VAR
-        else:
-            raise ValueError("Invalid variable type {}!".format(var_type))
+        varname = _VAR_NAME_BY_KIND[self._int_get_var_kind(var_type)]
         return varname in self.data.variables
 
     def get_global_var_names(self):
@@ -1141,9 +1174,10 @@ class Exodus:
         if count < 0:
             raise ValueError("Count must be a positive integer")
         try:
-            set = self.data.variables[VAR_NODE_NS % internal_id][start - 1:start + count - 1]
+            set = self.data.variables[fmt(VAR_NODE_NS, internal_id)][start - 1:start + count - 1]
         except KeyError:
-            raise KeyError("Failed to retrieve node set with id {} ('{}')".format(obj_id, VAR_NODE_NS % internal_id))
+            raise KeyError("Failed to retrieve node set with id {} ('{}')"
+                           .format(obj_id, fmt(VAR_NODE_NS, internal_id)))
         return set
 
     def _int_get_partial_node_set_df(self, obj_id, internal_id, start, count):
@@ -1166,7 +1200,7 @@ class Exodus:
         if count < 0:
             raise ValueError("Count must be a positive integer")
         if ('dist_fact_ns%d' % internal_id) in self.data.variables:
-            set = self.data.variables[VAR_DF_NS % internal_id][start - 1:start + count - 1]
+            set = self.data.variables[fmt(VAR_DF_NS, internal_id)][start - 1:start + count - 1]
         else:
             warnings.warn("This database does not contain dist factors for node set {}".format(obj_id))
             set = []
@@ -1186,18 +1220,23 @@ class Exodus:
         if num_sets == 0:
             raise KeyError("No node sets are stored in this database!")
         try:
-            num_entries = self.data.dimensions[DIM_NUM_NODE_NS % internal_id].size
+            num_entries = self.data.dimensions[fmt(DIM_NUM_NODE_NS, internal_id)].size
         except KeyError:
             raise KeyError("Failed to retrieve number of entries in node set with id {} ('{}')"
-                           .format(obj_id, DIM_NUM_NODE_NS % internal_id))
-        if (VAR_DF_NS % internal_id) in self.data.variables:
+                           .format(obj_id, fmt(DIM_NUM_NODE_NS, internal_id)))
+        if fmt(VAR_DF_NS, internal_id) in self.data.variables:
             num_df = num_entries
         else:
             num_df = 0
         return num_entries, num_df
 
     def get_node_set(self, identifier):
-        """Returns an array of the nodes contained in the node set with given ID."""
+        """
+        Returns an array of the nodes contained in the node set with given ID.
+
+        In append and write mode, node sets changed or added since the file was opened are returned as read-only
+        views; copy the array before changing it.
+        """
         if self.mode == 'w' or self.mode == 'a':
             return self.ledger.get_node_set(identifier)
 
@@ -1232,14 +1271,37 @@ class Exodus:
         internal_id = self._lookup_id(NODESET, obj_id)
         return self._int_get_partial_node_set_df(obj_id, internal_id, start, count)
 
+    def _cached_object_params(self, obj_type, obj_id, read_params):
+        """
+        Returns the params tuple for the object with given type and ID, reading it with ``read_params``.
+
+        In read mode the tuple is stored so repeated calls (e.g. from several selectors) skip the file.
+
+        FOR INTERNAL USE ONLY!
+
+        :param obj_type: type of the object (NODESET, SIDESET or ELEMBLOCK)
+        :param obj_id: EXTERNAL (user-defined) id
+        :param read_params: bound ``_int_get_*_params`` method taking (obj_id, internal_id)
+        :return: the params tuple
+        """
+        internal_id = self._lookup_id(obj_type, obj_id)
+        # keyed on the internal id: callers may pass numpy/masked scalars as obj_id, which don't hash
+        key = (obj_type, builtins.int(internal_id))
+        if self.mode == 'r' and key in self._object_params:
+            return self._object_params[key]
+        params = read_params(obj_id, internal_id)
+        if self.mode == 'r':
+            # tuples are immutable, so the cached value can be handed out directly
+            self._object_params[key] = params
+        return params
+
     def get_node_set_params(self, obj_id):
         """
         Returns a tuple containing the parameters for the node set with given ID.
 
         Returned tuple is of format (number of nodes, number of distribution factors).
         """
-        internal_id = self._lookup_id(NODESET, obj_id)
-        return self._int_get_node_set_params(obj_id, internal_id)
+        return self._cached_object_params(NODESET, obj_id, self._int_get_node_set_params)
 
     def _int_get_partial_side_set(self, obj_id, internal_id, start, count):
         """
@@ -1264,15 +1326,15 @@ class Exodus:
         if count < 0:
             raise ValueError("Count must be a positive integer")
         try:
-            elmset = self.data.variables[VAR_ELEM_SS % internal_id][start - 1:start + count - 1]
+            elmset = self.data.variables[fmt(VAR_ELEM_SS, internal_id)][start - 1:start + count - 1]
         except KeyError:
-            raise KeyError(
-                "Failed to retrieve elements of side set with id {} ('{}')".format(obj_id, VAR_ELEM_SS % internal_id))
+            raise KeyError("Failed to retrieve elements of side set with id {} ('{}')"
+                           .format(obj_id, fmt(VAR_ELEM_SS, internal_id)))
         try:
-            sset = self.data.variables[VAR_SIDE_SS % internal_id][start - 1:start + count - 1]
+            sset = self.data.variables[fmt(VAR_SIDE_SS, internal_id)][start - 1:start + count - 1]
         except KeyError:
-            raise KeyError(
-                "Failed to retrieve sides of side set with id {} ('{}')".format(obj_id, VAR_SIDE_SS % internal_id))
+            raise KeyError("Failed to retrieve sides of side set with id {} ('{}')"
+                           .format(obj_id, fmt(VAR_SIDE_SS, internal_id)))
         return elmset, sset
 
     def _int_get_partial_side_set_df(self, obj_id, internal_id, start, count):
@@ -1297,8 +1359,8 @@ class Exodus:
             raise ValueError("Start index must be greater than 0")
         if count < 0:
             raise ValueError("Count must be a positive integer")
-        if (VAR_DF_SS % internal_id) in self.data.variables:
-            set = self.data.variables[VAR_DF_SS % internal_id][start - 1:start + count - 1]
+        if fmt(VAR_DF_SS, internal_id) in self.data.variables:
+            set = self.data.variables[fmt(VAR_DF_SS, internal_id)][start - 1:start + count - 1]
         else:
             warnings.warn("This database does not contain dist factors for side set {}".format(obj_id))
             set = []
@@ -1321,12 +1383,12 @@ class Exodus:
         if num_sets == 0:
             raise KeyError("No side sets are stored in this database!")
         try:
-            num_entries = self.data.dimensions[DIM_NUM_SIDE_SS % internal_id].size
+            num_entries = self.data.dimensions[fmt(DIM_NUM_SIDE_SS, internal_id)].size
         except KeyError:
             raise KeyError("Failed to retrieve number of entries in side set with id {} ('{}')"
-                           .format(obj_id, DIM_NUM_SIDE_SS % internal_id))
-        if DIM_NUM_DF_SS % internal_id in self.data.dimensions:
-            num_df = self.data.dimensions[DIM_NUM_DF_SS % internal_id].size
+                           .format(obj_id, fmt(DIM_NUM_SIDE_SS, internal_id)))
+        if fmt(DIM_NUM_DF_SS, internal_id) in self.data.dimensions:
+            num_df = self.data.dimensions[fmt(DIM_NUM_DF_SS, internal_id)].size
         else:
             num_df = 0
         return num_entries, num_df
@@ -1450,7 +1512,7 @@ class Exodus:
 
             if elem > elem_ctr:
                 # We're doing this the C way because copying code from SEACAS saves development time
-                connect = numpy.ndarray.flatten(self.get_elem_block_connectivity(eb_params[param_idx].elem_blk_id))
+                connect = numpy.ravel(self.get_elem_block_connectivity(eb_params[param_idx].elem_blk_id))
                 elem_ctr = eb_params[param_idx].elem_ctr
 
             if connect is None:
@@ -1464,225 +1526,164 @@ class Exodus:
             connect_offset = num_nodes_per_elem * elem_num_pos
             side_num = side - 1
             node_pos = ss_elem_node_idx[elem_idx]
+            # connectivity of this element only; the side tables index into it
+            elem_connect = connect[connect_offset:connect_offset + num_nodes_per_elem]
+            elem_type = eb_params[param_idx].elem_type_val
 
-            if eb_params[param_idx].elem_type_val == CIRCLE or eb_params[param_idx].elem_type_val == SPHERE:
+            if elem_type == CIRCLE or elem_type == SPHERE:
                 node_list[node_pos] = connect[connect_offset]
-            elif eb_params[param_idx].elem_type_val == TRUSS:
+            elif elem_type == TRUSS:
                 node_list[node_pos] = connect[connect_offset + side_num]
-            elif eb_params[param_idx].elem_type_val == BEAM:
+            elif elem_type == BEAM:
                 for i in range(num_nodes_per_elem):
                     node_list[node_pos + i] = connect[connect_offset + i]
-            elif eb_params[param_idx].elem_type_val == TRIANGLE:
+            elif elem_type == TRIANGLE:
                 if ndim == 2:
                     if side_num + 1 < 1 or side_num + 1 > 3:
                         raise ValueError("Invalid triangle side number %d!" % (side_num + 1))
-                    node_list[node_pos] = connect[connect_offset + tri_table[side_num][0] - 1]
-                    node_list[node_pos + 1] = connect[connect_offset + tri_table[side_num][1] - 1]
+                    node_list[node_pos] = elem_connect[TRI_TABLE[side_num, 0] - 1]
+                    node_list[node_pos + 1] = elem_connect[TRI_TABLE[side_num, 1] - 1]
                     if num_nodes_per_elem > 3:
-                        node_list[node_pos + 2] = connect[connect_offset + tri_table[side_num][2] - 1]
+                        node_list[node_pos + 2] = elem_connect[TRI_TABLE[side_num, 2] - 1]
                 elif ndim == 3:
                     if side_num + 1 < 1 or side_num + 1 > 5:
                         raise ValueError("Invalid triangle side number %d!" % (side_num + 1))
-                    node_list[node_pos] = connect[connect_offset + tri3_table[side_num][0] - 1]
-                    node_list[node_pos + 1] = connect[connect_offset + tri3_table[side_num][1] - 1]
+                    node_list[node_pos] = elem_connect[TRI3_TABLE[side_num, 0] - 1]
+                    node_list[node_pos + 1] = elem_connect[TRI3_TABLE[side_num, 1] - 1]
                     if side_num + 1 <= 2:
                         if num_nodes_per_elem == 3:
-                            node_list[node_pos + 2] = connect[connect_offset + tri3_table[side_num][2] - 1]
+                            node_list[node_pos + 2] = elem_connect[TRI3_TABLE[side_num, 2] - 1]
                         elif num_nodes_per_elem == 4:
-                            node_list[node_pos + 2] = connect[connect_offset + tri3_table[side_num][2] - 1]
+                            node_list[node_pos + 2] = elem_connect[TRI3_TABLE[side_num, 2] - 1]
                             # This looks wrong, but it's what the C library does...
                             node_list[node_pos + 2] = connect[connect_offset + 4 - 1]
                         elif num_nodes_per_elem == 6:
-                            node_list[node_pos + 2] = connect[connect_offset + tri3_table[side_num][2] - 1]
-                            node_list[node_pos + 3] = connect[connect_offset + tri3_table[side_num][3] - 1]
-                            node_list[node_pos + 4] = connect[connect_offset + tri3_table[side_num][4] - 1]
-                            node_list[node_pos + 5] = connect[connect_offset + tri3_table[side_num][5] - 1]
+                            node_list[node_pos + 2:node_pos + 6] = elem_connect[TRI3_TABLE[side_num, 2:6] - 1]
                         elif num_nodes_per_elem == 7:
-                            node_list[node_pos + 2] = connect[connect_offset + tri3_table[side_num][2] - 1]
-                            node_list[node_pos + 3] = connect[connect_offset + tri3_table[side_num][3] - 1]
-                            node_list[node_pos + 4] = connect[connect_offset + tri3_table[side_num][4] - 1]
-                            node_list[node_pos + 5] = connect[connect_offset + tri3_table[side_num][5] - 1]
-                            node_list[node_pos + 6] = connect[connect_offset + tri3_table[side_num][6] - 1]
+                            node_list[node_pos + 2:node_pos + 7] = elem_connect[TRI3_TABLE[side_num, 2:7] - 1]
                         else:
                             raise ValueError("%d is an unsupported number of nodes for triangle elements!" %
                                              num_nodes_per_elem)
                     else:
                         if num_nodes_per_elem > 3:
-                            node_list[node_pos + 2] = connect[connect_offset + tri3_table[side_num][2] - 1]
-            elif eb_params[param_idx].elem_type_val == QUAD:
+                            node_list[node_pos + 2] = elem_connect[TRI3_TABLE[side_num, 2] - 1]
+            elif elem_type == QUAD:
                 if side_num + 1 < 1 or side_num + 1 > 4:
                     raise ValueError("Invalid quad side number %d!" % (side_num + 1))
-                node_list[node_pos + 0] = connect[connect_offset + quad_table[side_num][0] - 1]
-                node_list[node_pos + 1] = connect[connect_offset + quad_table[side_num][1] - 1]
+                node_list[node_pos:node_pos + 2] = elem_connect[QUAD_TABLE[side_num, 0:2] - 1]
                 if num_nodes_per_elem > 5:
-                    node_list[node_pos + 2] = connect[connect_offset + quad_table[side_num][2] - 1]
-            elif eb_params[param_idx].elem_type_val == SHELL:
+                    node_list[node_pos + 2] = elem_connect[QUAD_TABLE[side_num, 2] - 1]
+            elif elem_type == SHELL:
                 if side_num + 1 < 1 or side_num + 1 > 6:
                     raise ValueError("Invalid shell side number %d!" % (side_num + 1))
-                node_list[node_pos + 0] = connect[connect_offset + shell_table[side_num][0] - 1]
-                node_list[node_pos + 1] = connect[connect_offset + shell_table[side_num][1] - 1]
+                node_list[node_pos:node_pos + 2] = elem_connect[SHELL_TABLE[side_num, 0:2] - 1]
                 if num_nodes_per_elem > 2:
                     if side_num + 1 <= 2:
-                        node_list[node_pos + 2] = connect[connect_offset + shell_table[side_num][2] - 1]
-                        node_list[node_pos + 3] = connect[connect_offset + shell_table[side_num][3] - 1]
+                        node_list[node_pos + 2:node_pos + 4] = elem_connect[SHELL_TABLE[side_num, 2:4] - 1]
                 if num_nodes_per_elem == 8:
                     if side_num + 1 <= 2:
-                        node_list[node_pos + 4] = connect[connect_offset + shell_table[side_num][4] - 1]
-                        node_list[node_pos + 5] = connect[connect_offset + shell_table[side_num][5] - 1]
-                        node_list[node_pos + 6] = connect[connect_offset + shell_table[side_num][6] - 1]
-                        node_list[node_pos + 7] = connect[connect_offset + shell_table[side_num][7] - 1]
+                        node_list[node_pos + 4:node_pos + 8] = elem_connect[SHELL_TABLE[side_num, 4:8] - 1]
                     else:
-                        node_list[node_pos + 2] = connect[connect_offset + shell_table[side_num][2] - 1]
+                        node_list[node_pos + 2] = elem_connect[SHELL_TABLE[side_num, 2] - 1]
                 if num_nodes_per_elem == 9:
                     if side_num + 1 <= 2:
-                        node_list[node_pos + 4] = connect[connect_offset + shell_table[side_num][4] - 1]
-                        node_list[node_pos + 5] = connect[connect_offset + shell_table[side_num][5] - 1]
-                        node_list[node_pos + 6] = connect[connect_offset + shell_table[side_num][6] - 1]
-                        node_list[node_pos + 7] = connect[connect_offset + shell_table[side_num][7] - 1]
-                        node_list[node_pos + 8] = connect[connect_offset + shell_table[side_num][8] - 1]
+                        node_list[node_pos + 4:node_pos + 9] = elem_connect[SHELL_TABLE[side_num, 4:9] - 1]
                     else:
-                        node_list[node_pos + 2] = connect[connect_offset + shell_table[side_num][2] - 1]
-            elif eb_params[param_idx].elem_type_val == TETRA:
+                        node_list[node_pos + 2] = elem_connect[SHELL_TABLE[side_num, 2] - 1]
+            elif elem_type == TETRA:
                 if side_num + 1 < 1 or side_num + 1 > 4:
                     raise ValueError("Invalid tetra side number %d!" % (side_num + 1))
-                node_list[node_pos + 0] = connect[connect_offset + tetra_table[side_num][0] - 1]
-                node_list[node_pos + 1] = connect[connect_offset + tetra_table[side_num][1] - 1]
-                node_list[node_pos + 2] = connect[connect_offset + tetra_table[side_num][2] - 1]
+                node_list[node_pos:node_pos + 3] = elem_connect[TETRA_TABLE[side_num, 0:3] - 1]
                 if num_nodes_per_elem == 8:
-                    node_list[node_pos + 3] = connect[connect_offset + tetra_table[side_num][3] - 1]
+                    node_list[node_pos + 3] = elem_connect[TETRA_TABLE[side_num, 3] - 1]
                 elif num_nodes_per_elem > 8:
-                    node_list[node_pos + 3] = connect[connect_offset + tetra_table[side_num][3] - 1]
-                    node_list[node_pos + 4] = connect[connect_offset + tetra_table[side_num][4] - 1]
-                    node_list[node_pos + 5] = connect[connect_offset + tetra_table[side_num][5] - 1]
-            elif eb_params[param_idx].elem_type_val == WEDGE:
+                    node_list[node_pos + 3:node_pos + 6] = elem_connect[TETRA_TABLE[side_num, 3:6] - 1]
+            elif elem_type == WEDGE:
                 if side_num + 1 < 1 or side_num + 1 > 5:
                     raise ValueError("Invalid wedge side number %d!" % (side_num + 1))
                 if num_nodes_per_elem == 6 or num_nodes_per_elem == 7:
-                    node_list[node_pos + 0] = connect[connect_offset + wedge6_table[side_num][0] - 1]
-                    node_list[node_pos + 1] = connect[connect_offset + wedge6_table[side_num][1] - 1]
-                    node_list[node_pos + 2] = connect[connect_offset + wedge6_table[side_num][2] - 1]
+                    node_list[node_pos:node_pos + 3] = elem_connect[WEDGE6_TABLE[side_num, 0:3] - 1]
                     if side_num == 3 or side_num == 4:
                         pass
                     else:
-                        node_list[node_pos + 3] = connect[connect_offset + wedge6_table[side_num][3] - 1]
+                        node_list[node_pos + 3] = elem_connect[WEDGE6_TABLE[side_num, 3] - 1]
                 elif num_nodes_per_elem == 15 or num_nodes_per_elem == 16:
-                    node_list[node_pos + 0] = connect[connect_offset + wedge15_table[side_num][0] - 1]
-                    node_list[node_pos + 1] = connect[connect_offset + wedge15_table[side_num][1] - 1]
-                    node_list[node_pos + 2] = connect[connect_offset + wedge15_table[side_num][2] - 1]
-                    node_list[node_pos + 3] = connect[connect_offset + wedge15_table[side_num][3] - 1]
-                    node_list[node_pos + 4] = connect[connect_offset + wedge15_table[side_num][4] - 1]
-                    node_list[node_pos + 5] = connect[connect_offset + wedge15_table[side_num][5] - 1]
+                    node_list[node_pos:node_pos + 6] = elem_connect[WEDGE15_TABLE[side_num, 0:6] - 1]
                     if side_num == 3 or side_num == 4:
                         pass
                     else:
-                        node_list[node_pos + 6] = connect[connect_offset + wedge15_table[side_num][6] - 1]
-                        node_list[node_pos + 7] = connect[connect_offset + wedge15_table[side_num][7] - 1]
+                        node_list[node_pos + 6:node_pos + 8] = elem_connect[WEDGE15_TABLE[side_num, 6:8] - 1]
                 elif num_nodes_per_elem == 12:
-                    node_list[node_pos + 0] = connect[connect_offset + wedge12_table[side_num][0] - 1]
-                    node_list[node_pos + 1] = connect[connect_offset + wedge12_table[side_num][1] - 1]
-                    node_list[node_pos + 2] = connect[connect_offset + wedge12_table[side_num][2] - 1]
-                    node_list[node_pos + 3] = connect[connect_offset + wedge12_table[side_num][3] - 1]
-                    node_list[node_pos + 4] = connect[connect_offset + wedge12_table[side_num][4] - 1]
-                    node_list[node_pos + 5] = connect[connect_offset + wedge12_table[side_num][5] - 1]
+                    node_list[node_pos:node_pos + 6] = elem_connect[WEDGE12_TABLE[side_num, 0:6] - 1]
                 elif num_nodes_per_elem == 20:
-                    node_list[node_pos + 0] = connect[connect_offset + wedge20_table[side_num][0] - 1]
-                    node_list[node_pos + 1] = connect[connect_offset + wedge20_table[side_num][1] - 1]
-                    node_list[node_pos + 2] = connect[connect_offset + wedge20_table[side_num][2] - 1]
-                    node_list[node_pos + 3] = connect[connect_offset + wedge20_table[side_num][3] - 1]
-                    node_list[node_pos + 4] = connect[connect_offset + wedge20_table[side_num][4] - 1]
-                    node_list[node_pos + 5] = connect[connect_offset + wedge20_table[side_num][5] - 1]
-                    node_list[node_pos + 6] = connect[connect_offset + wedge20_table[side_num][6] - 1]
+                    node_list[node_pos:node_pos + 7] = elem_connect[WEDGE20_TABLE[side_num, 0:7] - 1]
                     if side_num == 3 or side_num == 4:
                         pass
                     else:
-                        node_list[node_pos + 7] = connect[connect_offset + wedge20_table[side_num][7] - 1]
-                        node_list[node_pos + 8] = connect[connect_offset + wedge20_table[side_num][8] - 1]
+                        node_list[node_pos + 7:node_pos + 9] = elem_connect[WEDGE20_TABLE[side_num, 7:9] - 1]
                 elif num_nodes_per_elem == 21:
-                    node_list[node_pos + 0] = connect[connect_offset + wedge21_table[side_num][0] - 1]
-                    node_list[node_pos + 1] = connect[connect_offset + wedge21_table[side_num][1] - 1]
-                    node_list[node_pos + 2] = connect[connect_offset + wedge21_table[side_num][2] - 1]
-                    node_list[node_pos + 3] = connect[connect_offset + wedge21_table[side_num][3] - 1]
-                    node_list[node_pos + 4] = connect[connect_offset + wedge21_table[side_num][4] - 1]
-                    node_list[node_pos + 5] = connect[connect_offset + wedge21_table[side_num][5] - 1]
-                    node_list[node_pos + 6] = connect[connect_offset + wedge21_table[side_num][6] - 1]
+                    node_list[node_pos:node_pos + 7] = elem_connect[WEDGE21_TABLE[side_num, 0:7] - 1]
                     if side_num == 3 or side_num == 4:
                         pass
                     else:
-                        node_list[node_pos + 7] = connect[connect_offset + wedge21_table[side_num][7] - 1]
-                        node_list[node_pos + 8] = connect[connect_offset + wedge21_table[side_num][8] - 1]
+                        node_list[node_pos + 7:node_pos + 9] = elem_connect[WEDGE21_TABLE[side_num, 7:9] - 1]
                 elif num_nodes_per_elem == 18:
-                    node_list[node_pos + 0] = connect[connect_offset + wedge18_table[side_num][0] - 1]
-                    node_list[node_pos + 1] = connect[connect_offset + wedge18_table[side_num][1] - 1]
-                    node_list[node_pos + 2] = connect[connect_offset + wedge18_table[side_num][2] - 1]
-                    node_list[node_pos + 3] = connect[connect_offset + wedge18_table[side_num][3] - 1]
-                    node_list[node_pos + 4] = connect[connect_offset + wedge18_table[side_num][4] - 1]
-                    node_list[node_pos + 5] = connect[connect_offset + wedge18_table[side_num][5] - 1]
+                    node_list[node_pos:node_pos + 6] = elem_connect[WEDGE18_TABLE[side_num, 0:6] - 1]
                     if side_num == 3 or side_num == 4:
                         pass
                     else:
-                        node_list[node_pos + 6] = connect[connect_offset + wedge18_table[side_num][6] - 1]
-                        node_list[node_pos + 7] = connect[connect_offset + wedge18_table[side_num][7] - 1]
-                        node_list[node_pos + 8] = connect[connect_offset + wedge18_table[side_num][8] - 1]
-            elif eb_params[param_idx].elem_type_val == PYRAMID:
+                        node_list[node_pos + 6:node_pos + 9] = elem_connect[WEDGE18_TABLE[side_num, 6:9] - 1]
+            elif elem_type == PYRAMID:
                 if side_num + 1 < 1 or side_num + 1 > 5:
                     raise ValueError("Invalid pyramid side number %d!" % (side_num + 1))
-                node_list[node_pos] = connect[connect_offset + pyramid_table[side_num][0] - 1]
+                node_list[node_pos] = elem_connect[PYRAMID_TABLE[side_num, 0] - 1]
                 node_pos += 1
-                node_list[node_pos] = connect[connect_offset + pyramid_table[side_num][1] - 1]
+                node_list[node_pos] = elem_connect[PYRAMID_TABLE[side_num, 1] - 1]
                 node_pos += 1
-                node_list[node_pos] = connect[connect_offset + pyramid_table[side_num][2] - 1]
+                node_list[node_pos] = elem_connect[PYRAMID_TABLE[side_num, 2] - 1]
                 node_pos += 1
-                if pyramid_table[side_num][3] == 0:
+                if PYRAMID_TABLE[side_num, 3] == 0:
                     pass  # this one even confuses the C library
                 else:
-                    node_list[node_pos] = connect[connect_offset + pyramid_table[side_num][3] - 1]
+                    node_list[node_pos] = elem_connect[PYRAMID_TABLE[side_num, 3] - 1]
                     node_pos += 1
                 if num_nodes_per_elem > 5:
-                    node_list[node_pos] = connect[connect_offset + pyramid_table[side_num][4] - 1]
+                    node_list[node_pos] = elem_connect[PYRAMID_TABLE[side_num, 4] - 1]
                     node_pos += 1
-                    node_list[node_pos] = connect[connect_offset + pyramid_table[side_num][5] - 1]
+                    node_list[node_pos] = elem_connect[PYRAMID_TABLE[side_num, 5] - 1]
                     node_pos += 1
-                    node_list[node_pos] = connect[connect_offset + pyramid_table[side_num][6] - 1]
+                    node_list[node_pos] = elem_connect[PYRAMID_TABLE[side_num, 6] - 1]
                     node_pos += 1
                     if side_num == 4:
-                        node_list[node_pos] = connect[connect_offset + pyramid_table[side_num][7] - 1]
+                        node_list[node_pos] = elem_connect[PYRAMID_TABLE[side_num, 7] - 1]
                         node_pos += 1
                         if num_nodes_per_elem >= 14:
-                            node_list[node_pos] = connect[connect_offset + pyramid_table[side_num][8] - 1]
+                            node_list[node_pos] = elem_connect[PYRAMID_TABLE[side_num, 8] - 1]
                             node_pos += 1
                     else:
                         if num_nodes_per_elem >= 18:
-                            node_list[node_pos] = connect[connect_offset + pyramid_table[side_num][8] - 1]
+                            node_list[node_pos] = elem_connect[PYRAMID_TABLE[side_num, 8] - 1]
                             node_pos += 1
-            elif eb_params[param_idx].elem_type_val == HEX:
+            elif elem_type == HEX:
                 if side_num + 1 < 1 or side_num + 1 > 6:
                     raise ValueError("Invalid hex side number %d!" % (side_num + 1))
                 if num_nodes_per_elem == 16:
-                    node_list[node_pos + 0] = connect[connect_offset + hex16_table[side_num][0] - 1]
-                    node_list[node_pos + 1] = connect[connect_offset + hex16_table[side_num][1] - 1]
-                    node_list[node_pos + 2] = connect[connect_offset + hex16_table[side_num][2] - 1]
-                    node_list[node_pos + 3] = connect[connect_offset + hex16_table[side_num][3] - 1]
+                    node_list[node_pos:node_pos + 4] = elem_connect[HEX16_TABLE[side_num, 0:4] - 1]
                     # I have no idea whats going on with these next two statements
-                    node_list[node_pos + 3] = connect[connect_offset + hex16_table[side_num][4] - 1]
-                    node_list[node_pos + 3] = connect[connect_offset + hex16_table[side_num][5] - 1]
+                    node_list[node_pos + 3] = elem_connect[HEX16_TABLE[side_num, 4] - 1]
+                    node_list[node_pos + 3] = elem_connect[HEX16_TABLE[side_num, 5] - 1]
                     if side_num + 1 == 5 or side_num + 1 == 6:
                         # Also no idea about these ones
-                        node_list[node_pos] = connect[connect_offset + hex16_table[side_num][6] - 1]
+                        node_list[node_pos] = elem_connect[HEX16_TABLE[side_num, 6] - 1]
                         node_pos += 1
-                        node_list[node_pos] = connect[connect_offset + hex16_table[side_num][7] - 1]
+                        node_list[node_pos] = elem_connect[HEX16_TABLE[side_num, 7] - 1]
                         node_pos += 1
                 else:
-                    node_list[node_pos + 0] = connect[connect_offset + hex_table[side_num][0] - 1]
-                    node_list[node_pos + 1] = connect[connect_offset + hex_table[side_num][1] - 1]
-                    node_list[node_pos + 2] = connect[connect_offset + hex_table[side_num][2] - 1]
-                    node_list[node_pos + 3] = connect[connect_offset + hex_table[side_num][3] - 1]
+                    node_list[node_pos:node_pos + 4] = elem_connect[HEX_TABLE[side_num, 0:4] - 1]
                     if num_nodes_per_elem > 12:
-                        node_list[node_pos + 4] = connect[connect_offset + hex_table[side_num][4] - 1]
-                        node_list[node_pos + 5] = connect[connect_offset + hex_table[side_num][5] - 1]
-                        node_list[node_pos + 6] = connect[connect_offset + hex_table[side_num][6] - 1]
-                        node_list[node_pos + 7] = connect[connect_offset + hex_table[side_num][7] - 1]
+                        node_list[node_pos + 4:node_pos + 8] = elem_connect[HEX_TABLE[side_num, 4:8] - 1]
                     if num_nodes_per_elem == 27:
-                        node_list[node_pos + 8] = connect[connect_offset + hex_table[side_num][8] - 1]
+                        node_list[node_pos + 8] = elem_connect[HEX_TABLE[side_num, 8] - 1]
             else:
                 raise ValueError("%s is an unsupported element type." % eb_params[param_idx].elem_type_str)
         return node_list, node_count_list
@@ -1718,8 +1719,7 @@ class Exodus:
 
         Returned tuple is of format (number of elements, number of distribution factors).
         """
-        internal_id = self._lookup_id(SIDESET, obj_id)
-        return self._int_get_side_set_params(obj_id, internal_id)
+        return self._cached_object_params(SIDESET, obj_id, self._int_get_side_set_params)
 
     ##################
     # Element blocks #
@@ -1744,8 +1744,8 @@ class Exodus:
 
         if self.mode == 'w' or self.mode == 'a':
             num_node_entry = self.ledger.get_num_nodes_per_el_block(obj_id)
-        elif (DIM_NUM_NOD_PER_EL % internal_id) in self.data.dimensions:
-            num_node_entry = self.data.dimensions[DIM_NUM_NOD_PER_EL % internal_id].size
+        elif fmt(DIM_NUM_NOD_PER_EL, internal_id) in self.data.dimensions:
+            num_node_entry = self.data.dimensions[fmt(DIM_NUM_NOD_PER_EL, internal_id)].size
         else:
             num_node_entry = 0
 
@@ -1754,39 +1754,50 @@ class Exodus:
                 if self.mode == 'w' or self.mode == 'a':
                     result = self.ledger.get_connectX(obj_id)[start - 1:start + count - 1]
                 else:
-                    result = self.data.variables[VAR_CONNECT % internal_id][start - 1:start + count - 1]
+                    result = self.data.variables[fmt(VAR_CONNECT, internal_id)][start - 1:start + count - 1]
 
             except KeyError:
                 raise KeyError("Failed to retrieve connectivity list of element block with id {} ('{}')"
-                               .format(obj_id, VAR_CONNECT % internal_id))
+                               .format(obj_id, fmt(VAR_CONNECT, internal_id)))
         else:
             result = []
         return result
 
-    def _int_get_elem_block_params(self, obj_id, internal_id):
+    def _int_get_num_elem_in_block(self, obj_id, internal_id):
         """
-        Returns a tuple containing the parameters for the element block with given ID.
+        Returns the number of elements in the element block with given ID.
 
         FOR INTERNAL USE ONLY
 
         :param obj_id: EXTERNAL (user-defined) id
         :param internal_id: INTERNAL (1-based) id
-        :return: (number of elements, nodes per element, topology, number of attributes)
+        :return: number of elements in the block
         """
-        # TODO this will be way faster with caching
         try:
             if self.mode == 'w' or self.mode == 'a':
-                num_entries = self.ledger.get_num_elem_in_block(obj_id)
-            else:
-                num_entries = self.data.dimensions[DIM_NUM_EL_IN_BLK % internal_id].size
+                return self.ledger.get_num_elem_in_block(obj_id)
+            return self.data.dimensions[fmt(DIM_NUM_EL_IN_BLK, internal_id)].size
         except KeyError:
             raise KeyError("Failed to retrieve number of elements in element block with id {} ('{}')"
-                           .format(obj_id, DIM_NUM_EL_IN_BLK % internal_id))
-        
+                           .format(obj_id, fmt(DIM_NUM_EL_IN_BLK, internal_id)))
+
+    def _int_get_elem_block_params(self, obj_id, internal_id):
+        """
+        Returns a tuple containing the parameters for the element block with given ID.
+
+        FOR INTERNAL USE ONLY
+
+        :param obj_id: EXTERNAL (user-defined) id
+        :param internal_id: INTERNAL (1-based) id
+        :return: (number of elements, nodes per element, topology, number of attributes)
+        """
+        # TODO this will be way faster with caching
+        num_entries = self._int_get_num_elem_in_block(obj_id, internal_id)
+
         if self.mode == 'w' or self.mode == 'a':
             num_node_entry = self.ledger.get_num_nodes_per_el_block(obj_id)
-        elif (DIM_NUM_NOD_PER_EL % internal_id) in self.data.dimensions:
-            num_node_entry = self.data.dimensions[DIM_NUM_NOD_PER_EL % internal_id].size
+        elif fmt(DIM_NUM_NOD_PER_EL, internal_id) in self.data.dimensions:
+            num_node_entry = self.data.dimensions[fmt(DIM_NUM_NOD_PER_EL, internal_id)].size
         else:
             num_node_entry = 0
 
@@ -1794,17 +1805,17 @@ class Exodus:
             if self.mode == 'w' or self.mode == 'a':
                 topology = self.ledger.get_elem_block_type(obj_id)
             if num_node_entry > 0:
-                connect = self.data.variables[VAR_CONNECT % internal_id]
+                connect = self.data.variables[fmt(VAR_CONNECT, internal_id)]
                 topology = connect.getncattr(ATTR_ELEM_TYPE)
             else:
                 topology = None
         except KeyError:
             raise KeyError("Failed to retrieve connectivity list of element block with id {} ('{}')"
-                           .format(obj_id, VAR_CONNECT % internal_id))
+                           .format(obj_id, fmt(VAR_CONNECT, internal_id)))
         
     # TODO: Add case for append mode if attributes added
-        if (DIM_NUM_ATT_IN_BLK % internal_id) in self.data.dimensions:
-            num_att_blk = self.data.dimensions[DIM_NUM_ATT_IN_BLK % internal_id].size
+        if fmt(DIM_NUM_ATT_IN_BLK, internal_id) in self.data.dimensions:
+            num_att_blk = self.data.dimensions[fmt(DIM_NUM_ATT_IN_BLK, internal_id)].size
         else:
             num_att_blk = 0
         return num_entries, num_node_entry, topology, num_att_blk
@@ -1812,7 +1823,7 @@ class Exodus:
     def get_elem_block_connectivity(self, obj_id):
         """Returns the connectivity list for the element block with given ID."""
         internal_id = self._lookup_id(ELEMBLOCK, obj_id)
-        size = self._int_get_elem_block_params(obj_id, internal_id)[0]
+        size = self._int_get_num_elem_in_block(obj_id, internal_id)
         return self._int_get_partial_elem_block_connectivity(obj_id, internal_id, 1, size)
 
     def get_partial_elem_block_connectivity(self, obj_id, start, count):
@@ -1830,8 +1841,7 @@ class Exodus:
 
         Returned tuple is of format (number of elements, nodes per element, topology, number of attributes).
         """
-        internal_id = self._lookup_id(ELEMBLOCK, obj_id)
-        return self._int_get_elem_block_params(obj_id, internal_id)
+        return self._cached_object_params(ELEMBLOCK, obj_id, self._int_get_elem_block_params)
 
     def _int_get_elem_block_param_object(self, obj_id, ndim) -> _ElemBlockParam:
         """Returns parameters used to describe an elem block."""
@@ -1840,15 +1850,17 @@ class Exodus:
         num_el, nod_el, topo, num_att = self.get_elem_block_params(obj_id)
         topo = topo.upper()
         num_nod_side = numpy.zeros(6, builtins.int)
-        if topo[:3] == CIRCLE[:3]:
+        # topologies are matched on their first three letters, so take that prefix once
+        prefix = topo[:3]
+        if prefix == CIRCLE[:3]:
             el_type = CIRCLE
             num_sides = 1
             num_nod_side[0] = 1
-        elif topo[:3] == SPHERE[:3]:
+        elif prefix == SPHERE[:3]:
             el_type = SPHERE
             num_sides = 1
             num_nod_side[0] = 1
-        elif topo[:3] == QUAD[:3]:
+        elif prefix == QUAD[:3]:
             el_type = QUAD
             num_sides = 4
             if nod_el == 4 or nod_el == 5:
@@ -1868,7 +1880,7 @@ class Exodus:
                 num_nod_side[3] = 4
             else:
                 raise ValueError("Element of type %s with %d nodes is invalid!" % (topo, nod_el))
-        elif topo[:3] == TRIANGLE[:3]:
+        elif prefix == TRIANGLE[:3]:
             el_type = TRIANGLE
             if ndim == 2:
                 num_sides = 3
@@ -1908,7 +1920,7 @@ class Exodus:
                     num_nod_side[4] = 4
                 else:
                     raise ValueError("Element of type %s with %d nodes is invalid!" % (topo, nod_el))
-        elif topo[:3] == SHELL[:3]:
+        elif prefix == SHELL[:3]:
             el_type = SHELL
             if nod_el == 2:
                 num_sides = 2
@@ -1932,7 +1944,7 @@ class Exodus:
                 num_nod_side[5] = 3
             else:
                 raise ValueError("Element of type %s with %d nodes is invalid!" % (topo, nod_el))
-        elif topo[:3] == HEX[:3]:
+        elif prefix == HEX[:3]:
             el_type = HEX
             num_sides = 6
             if nod_el == 8 or nod_el == 9:
@@ -1986,7 +1998,7 @@ class Exodus:
                 num_nod_side[5] = 16
             else:
                 raise ValueError("Element of type %s with %d nodes is invalid!" % (topo, nod_el))
-        elif topo[:3] == TETRA[:3]:
+        elif prefix == TETRA[:3]:
             el_type = TETRA
             num_sides = 4
             if nod_el == 4 or nod_el == 5:
@@ -2021,7 +2033,7 @@ class Exodus:
                 num_nod_side[3] = 13
             else:
                 raise ValueError("Element of type %s with %d nodes is invalid!" % (topo, nod_el))
-        elif topo[:3] == WEDGE[:3]:
+        elif prefix == WEDGE[:3]:
             el_type = WEDGE
             num_sides = 5
             if nod_el == 6:
@@ -2068,7 +2080,7 @@ class Exodus:
                 num_nod_side[4] = 13
             else:
                 raise ValueError("Element of type %s with %d nodes is invalid!" % (topo, nod_el))
-        elif topo[:3] == PYRAMID[:3]:
+        elif prefix == PYRAMID[:3]:
             el_type = PYRAMID
             num_sides = 5
             if nod_el == 5:
@@ -2097,7 +2109,7 @@ class Exodus:
                 num_nod_side[4] = 9
             else:
                 raise ValueError("Element of type %s with %d nodes is invalid!" % (topo, nod_el))
-        elif topo[:3] == BEAM[:3]:
+        elif prefix == BEAM[:3]:
             el_type = BEAM
             num_sides = 2
             if nod_el == 2:
@@ -2111,7 +2123,7 @@ class Exodus:
                 num_nod_side[1] = 4
             else:
                 raise ValueError("Element of type %s with %d nodes is invalid!" % (topo, nod_el))
-        elif topo[:3] == TRUSS[:3] or topo[:3] == BAR[:3] or topo[:3] == EDGE[:3]:
+        elif prefix == TRUSS[:3] or prefix == BAR[:3] or prefix == EDGE[:3]:
             el_type = TRUSS
             num_sides = 2
             if nod_el == 2 or nod_el == 3:
@@ -2120,7 +2132,7 @@ class Exodus:
             else:
                 raise ValueError("Element of type %s with %d nodes is invalid!" % (topo, nod_el))
         # Special case for null elements
-        elif topo[:3] == NULL[:3]:
+        elif prefix == NULL[:3]:
             el_type = NULL
             num_sides = 0
             num_nod_side[0] = 0
@@ -2227,8 +2239,8 @@ class Exodus:
         FOR INTERNAL USE ONLY!
         """
         # Some databases don't have attributes
-        if (DIM_NUM_ATT_IN_BLK % internal_id) in self.data.dimensions:
-            num = self.data.dimensions[DIM_NUM_ATT_IN_BLK % internal_id].size
+        if fmt(DIM_NUM_ATT_IN_BLK, internal_id) in self.data.dimensions:
+            num = self.data.dimensions[fmt(DIM_NUM_ATT_IN_BLK, internal_id)].size
         else:
             # No need to warn. If there are no attributes, the number is 0...
             num = 0
@@ -2252,9 +2264,10 @@ class Exodus:
             raise ValueError("Start index must be greater than 0")
         if count < 0:
             raise ValueError("Count must be a positive integer")
-        varname = VAR_ELEM_ATTRIB % internal_id
-        if varname in self.data.variables:
-            result = self.data.variables[varname][start - 1:start + count - 1, :]
+        variables = self.data.variables
+        varname = fmt(VAR_ELEM_ATTRIB, internal_id)
+        if varname in variables:
+            result = variables[varname][start - 1:start + count - 1, :]
         else:
             result = []
             warnings.warn("Element block {} has no attributes.".format(obj_id))
@@ -2283,7 +2296,8 @@ class Exodus:
         if num_attrib > 0:  # faster to check this than if the variable exists like in the function above this one
             if attrib_index < 1 or attrib_index > num_attrib:
                 raise ValueError("Attribute index out of range. Got {}".format(attrib_index))
-            result = self.data.variables[VAR_ELEM_ATTRIB % internal_id][start - 1:start + count - 1, attrib_index - 1]
+            varname = fmt(VAR_ELEM_ATTRIB, internal_id)
+            result = self.data.variables[varname][start - 1:start + count - 1, attrib_index - 1]
         else:
             result = []
             warnings.warn("Element block {} has no attributes.".format(obj_id))
@@ -2306,7 +2320,7 @@ class Exodus:
         Returns an empty array if the element block doesn't have attributes.
         """
         internal_id = self._lookup_id(ELEMBLOCK, obj_id)
-        size = self._int_get_elem_block_params(obj_id, internal_id)[0]
+        size = self._int_get_num_elem_in_block(obj_id, internal_id)
         return self._int_get_partial_one_elem_attrib(obj_id, internal_id, attrib_index, 1, size)
 
     def get_elem_attrib(self, obj_id):
@@ -2316,7 +2330,7 @@ class Exodus:
         Returns an empty array if the element block doesn't have attributes.
         """
         internal_id = self._lookup_id(ELEMBLOCK, obj_id)
-        size = self._int_get_elem_block_params(obj_id, internal_id)[0]
+        size = self._int_get_num_elem_in_block(obj_id, internal_id)
         return self._int_get_partial_elem_attrib(obj_id, internal_id, 1, size)
 
     def get_partial_elem_attrib(self, obj_id, start, count):
@@ -2341,7 +2355,7 @@ class Exodus:
         if num_attrib == 0:
             warnings.warn("Element block {} has no attributes.".format(obj_id))
         else:
-            varname = VAR_ELEM_ATTRIB_NAME % internal_id
+            varname = fmt(VAR_ELEM_ATTRIB_NAME, internal_id)
             # Older datasets don't have attribute names
             if varname in self.data.variables:
                 names = self.data.variables[varname][:]
@@ -2425,13 +2439,15 @@ class Exodus:
         prop = []
         # Search for the property for the right name
         # We don't use a for loop over the number of props because that would cost a second loop over the props
+        variables = self.data.variables
         n = 1
         while True:
-            if varname % n in self.data.variables:
-                propname = self.data.variables[varname % n].getncattr(ATTR_NAME)
+            var = variables.get(varname % n)
+            if var is not None:
+                propname = var.getncattr(ATTR_NAME)
                 if propname == name:
                     # we've found our property
-                    prop = self.data.variables[varname % n][:]
+                    prop = var[:]
                     break
                 else:
                     # check next property
@@ -2462,6 +2478,9 @@ class Exodus:
         :param obj_type: type of object
         :return: array of property names
         """
+        # A read only file never changes, so the names only have to be read once
+        if self.mode == 'r' and obj_type in self._property_names:
+            return self._property_names[obj_type].copy()
         if obj_type == NODESET:
             varname = VAR_NS_PROP
             num_props = self.num_node_set_prop
@@ -2474,9 +2493,11 @@ class Exodus:
         else:
             raise ValueError("Invalid variable type {}!".format(obj_type))
         # num_props = self._get_num_object_properties(varname)
-        result = numpy.empty([num_props], self._MAX_NAME_LENGTH_T)
-        for n in range(num_props):
-            result[n] = self.data.variables[varname % (n + 1)].getncattr(ATTR_NAME)
+        variables = self.data.variables
+        names = [variables[varname % (n + 1)].getncattr(ATTR_NAME) for n in range(num_props)]
+        result = numpy.array(names, self._MAX_NAME_LENGTH_T)
+        if self.mode == 'r':
+            self._property_names[obj_type] = result.copy()
         return result
 
     def get_node_set_property_names(self):
@@ -2510,29 +2531,32 @@ class Exodus:
             raise ValueError("Start index must be greater than 0")
         if count < 0:
             raise ValueError("Count must be a positive integer")
+        stop = start + count - 1
         dim_cnt = self.num_dim
-        num_nodes = self.num_nodes
-        if num_nodes == 0:
-            return []
+        variables = self.data.variables
         large = self.large_model
         if not large:
             try:
-                coord = self.data.variables[VAR_COORD][:, start - 1:start + count - 1]
+                coord = variables[VAR_COORD][:, start - 1:stop]
             except KeyError:
+                if self.num_nodes == 0:
+                    return []
                 raise KeyError("Failed to retrieve nodal coordinate array!")
         else:
             try:
-                coordx = self.data.variables[VAR_COORD_X][start - 1:start + count - 1]
+                coordx = variables[VAR_COORD_X][start - 1:stop]
             except KeyError:
+                if self.num_nodes == 0:
+                    return []
                 raise KeyError("Failed to retrieve x axis nodal coordinate array!")
             if dim_cnt > 1:
                 try:
-                    coordy = self.data.variables[VAR_COORD_Y][start - 1:start + count - 1]
+                    coordy = variables[VAR_COORD_Y][start - 1:stop]
                 except KeyError:
                     raise KeyError("Failed to retrieve y axis nodal coordinate array!")
                 if dim_cnt > 2:
                     try:
-                        coordz = self.data.variables[VAR_COORD_Z][start - 1:start + count - 1]
+                        coordz = variables[VAR_COORD_Z][start - 1:stop]
                     except KeyError:
                         raise KeyError("Failed to retrieve z axis nodal coordinate array!")
                     coord = numpy.array([coordx, coordy, coordz])
@@ -2556,19 +2580,22 @@ class Exodus:
             raise ValueError("Start index must be greater than 0")
         if count < 0:
             raise ValueError("Count must be a positive integer")
-        num_nodes = self.num_nodes
-        if num_nodes == 0:
-            return []
+        stop = start + count - 1
+        variables = self.data.variables
         large = self.large_model
         if not large:
             try:
-                coord = self.data.variables[VAR_COORD][0][start - 1:start + count - 1]
+                coord = variables[VAR_COORD][0, start - 1:stop]
             except KeyError:
+                if self.num_nodes == 0:
+                    return []
                 raise KeyError("Failed to retrieve nodal coordinate array!")
         else:
             try:
-                coord = self.data.variables[VAR_COORD_X][start - 1:start + count - 1]
+                coord = variables[VAR_COORD_X][start - 1:stop]
             except KeyError:
+                if self.num_nodes == 0:
+                    return []
                 raise KeyError("Failed to retrieve x axis nodal coordinate array!")
         return coord
 
@@ -2586,20 +2613,24 @@ class Exodus:
             raise ValueError("Start index must be greater than 0")
         if count < 0:
             raise ValueError("Count must be a positive integer")
-        dim_cnt = self.num_dim
-        num_nodes = self.num_nodes
-        if num_nodes == 0 or dim_cnt < 2:
+        stop = start + count - 1
+        if self.num_dim < 2:
             return []
+        variables = self.data.variables
         large = self.large_model
         if not large:
             try:
-                coord = self.data.variables[VAR_COORD][1][start - 1:start + count - 1]
+                coord = variables[VAR_COORD][1, start - 1:stop]
             except KeyError:
+                if self.num_nodes == 0:
+                    return []
                 raise KeyError("Failed to retrieve nodal coordinate array!")
         else:
             try:
-                coord = self.data.variables[VAR_COORD_Y][start - 1:start + count - 1]
+                coord = variables[VAR_COORD_Y][start - 1:stop]
             except KeyError:
+                if self.num_nodes == 0:
+                    return []
                 raise KeyError("Failed to retrieve y axis nodal coordinate array!")
         return coord
 
@@ -2617,20 +2648,24 @@ class Exodus:
             raise ValueError("Start index must be greater than 0")
         if count < 0:
             raise ValueError("Count must be a positive integer")
-        dim_cnt = self.num_dim
-        num_nodes = self.num_nodes
-        if num_nodes == 0 or dim_cnt < 3:
+        stop = start + count - 1
+        if self.num_dim < 3:
             return []
+        variables = self.data.variables
         large = self.large_model
         if not large:
             try:
-                coord = self.data.variables[VAR_COORD][2][start - 1:start + count - 1]
+                coord = variables[VAR_COORD][2, start - 1:stop]
             except KeyError:
+                if self.num_nodes == 0:
+                    return []
                 raise KeyError("Failed to retrieve nodal coordinate array!")
         else:
             try:
-                coord = self.data.variables[VAR_COORD_Z][start - 1:start + count - 1]
+                coord = variables[VAR_COORD_Z][start - 1:stop]
             except KeyError:
+                if self.num_nodes == 0:
+                    return []
                 raise KeyError("Failed to retrieve z axis nodal coordinate array!")
         return coord
 
@@ -2684,14 +2719,26 @@ class Exodus:
     ########################################################################
 
     def time_steps(self):
-        """Returns list of the time steps, 0-indexed"""
-        return [*range(self.num_time_steps)]
+        """Returns a range over the time steps, 0-indexed"""
+        return range(self.num_time_steps)
 
     def step_at_time(self, time):
         """Given a float time value, return the corresponding time step"""
-        for index, value in enumerate(self.get_all_times()):
-            if value == time:
+        # Reload the cached times only if the number of time steps has changed
+        if self._times is None or len(self._times) != self.num_time_steps:
+            self._times = numpy.ma.getdata(self.get_all_times())
+            self._times_sorted = bool(numpy.all(self._times[1:] >= self._times[:-1]))
+        times = self._times
+        # Time values are normally increasing, so a binary search finds the first matching step
+        if self._times_sorted:
+            index = int(numpy.searchsorted(times, time))
+            if index < len(times) and times[index] == time:
                 return index
+            return None
+        # Files whose times are not sorted need a full comparison to find the first match
+        matches = numpy.flatnonzero(times == time)
+        if len(matches) > 0:
+            return int(matches[0])
         return None
 
     def close(self):
@@ -2807,6 +2854,9 @@ class Exodus:
 
     def add_node_to_nodeset(self, node_id: int, identifier):
         """ add a node to an existing node set
+
+        The node is held until the node set is next read, changed or written. Prefer add_nodes_to_nodeset when adding
+        many nodes.
         Args:
             node_id: the node to add to the existing node set
             identifier: the node set being added to. Can be node set ID or node set name
@@ -3034,15 +3084,23 @@ class Exodus:
             raise PermissionError("Need to be in write or append mode to skin element into new sideset")
         self.ledger.skin(skin_id, skin_name, tri)
         
-    def write(self, path=None):
-        """Write out the Exodus object to a new file."""
+    def write(self, path=None, filter=None):
+        """
+        Write out the Exodus object to a new file.
+
+        :param path: path to write to, required in append mode
+        :param filter: name of a filter in IO_FILTERS, "zlib" or "bitshuffle", to compress coordinates and variables
+                       with. By default nothing is compressed
+        """
         if self.mode != 'w' and self.mode != 'a':
             raise PermissionError("Need to be in write or append mode to write")
         elif self.mode == 'a' and path is None:
             raise AttributeError("Must specify a new path when in append mode")
         elif self.mode == 'w' and path is not None:
             raise AttributeError("Do not specify a new path in write mode. Initialization path will be used")
-        self.ledger.write(path)
+        # check the filter before any file is created
+        util.check_filter(filter)
+        self.ledger.write(path, filter)
 
 
 # TODO some functions return numpy arrays, some return Python lists. Should be consistently one or the other.
@@ -3,20 +3,11 @@ import os
 
 class SampleFiles:
 
-    def __iter__(self):
-        self.directory = 'sample-files'
-        self.file_list = []
-        for filename in os.listdir(self.directory):
-            f = os.path.join(self.directory, filename)
-            if len(f.split('.')) > 1:
-                self.file_list.append(f)
-
-        self.index = 0
-        return self
+    directory = 'sample-files'
 
-    def __next__(self):
-        if self.index < len(self.file_list):
-            self.index += 1
-            return self.file_list[self.index-1]
-        else:
-            raise StopIteration
+    def __iter__(self):
+        # yield paths straight from the directory scan instead of building a list first
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if '.' in entry.name:
+                    yield entry.path
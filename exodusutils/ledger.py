@@ -1,3 +1,4 @@
+import os
 import netCDF4 as nc
 import numpy as np
 from .ns_ledger import NSLedger
@@ -9,17 +10,29 @@ from . import util
 
 class Ledger:
 
-    _FORMAT_MAP = {'EX_NETCDF4': 'NETCDF4',
-                   'EX_LARGE_MODEL': 'NETCDF3_64BIT_OFFSET',
-                   'EX_NORMAL_MODEL': 'NETCDF3_CLASSIC',
-                   'EX_64BIT_DATA': 'NETCDF3_64BIT_DATA'}
-    # Default values
-    _MAX_STR_LENGTH = 32
-    _MAX_STR_LENGTH_T = 'U32'
-    _MAX_NAME_LENGTH = 32
-    _MAX_LINE_LENGTH = 80
-    _MAX_LINE_LENGTH_T = 'U80'
-    _EXODUS_VERSION = 7.22
+    # HDF5 chunk cache used while writing a new file in append mode
+    _CHUNK_CACHE_SIZE = 64 * 1024 * 1024
+    _CHUNK_CACHE_NELEMS = 4001
+    _CHUNK_CACHE_PREEMPTION = 0.75
+    # Largest piece of a variable a_write holds in memory at once while copying it
+    _COPY_SLAB_BYTES = 16 * 1024 * 1024
+
+    # Dimensions and variables that a_write leaves for the node set, side set and element ledgers to write, or that
+    # it writes itself (QA records)
+    _SKIP_DIM_PREFIXES = ("num_nod_ns",  # ns ledger
+                          "num_side_ss", "num_df_ss", "num_sset_var",  # ss ledger
+                          "num_el_in_blk", "num_nod_per_el")  # elem ledger
+    _SKIP_DIM_EXACT = frozenset({"num_node_sets",  # ns ledger
+                                 "num_side_sets",  # ss ledger
+                                 "num_elem", "num_el_blk", "num_elem_var",  # elem ledger
+                                 "num_qa_rec"})
+    _SKIP_VAR_PREFIXES = ("ns_", "node_ns", "dist_fact_ns", "vals_nset_var", "nset_var_tab",  # ns ledger
+                          "ss_", "side_ss", "elem_ss", "dist_fact_ss", "vals_sset_var", "name_sset_var",
+                          "sset_var_tab",  # ss ledger
+                          "eb_", "connect", "vals_elem_var")  # elem ledger
+    # TODO -> elem_map is not for IDs
+    _SKIP_VAR_EXACT = frozenset({"elem_map", "elem_num_map", "name_elem_var", "elem_var_tab",  # elem ledger
+                                 "qa_records"})
 
     def __init__(self, ex):
         self.nodeset_ledger = NSLedger(ex)
@@ -100,6 +113,13 @@ class Ledger:
         """
         self.nodeset_ledger.add_node_to_nodeset(node_id, identifier)
 
+    def flush(self):
+        """
+        Apply nodes held back by add_node_to_nodeset to their nodesets
+        :return: None
+        """
+        self.nodeset_ledger.flush()
+
     def add_nodes_to_nodeset(self, node_ids, identifier):
         """
         Add many nodes to the specified nodeset
@@ -217,138 +237,218 @@ class Ledger:
         return self.element_ledger.add_element(block_id, nodelist)
 
     def skin_element_block(self, block_id, skin_id, skin_name, tri='shell'):
-        unique_faces = self.element_ledger.skin_block(block_id, tri)
-        el_list = []
-        face_list = []
-        df = []
-        for i in unique_faces:
-            e, f = i
-            el_list.append(e)
-            face_list.append(f)
-        self.sideset_ledger.add_sideset(el_list, face_list, skin_id, skin_name, df)
+        el_arr, face_arr = self.element_ledger.skin_block_arrays(block_id, tri)
+        self.sideset_ledger.add_sideset(el_arr, face_arr, skin_id, skin_name)
 
     def skin(self, skin_id, skin_name, tri='shell'):
         el_list, face_list = self.element_ledger.skin(tri)
-        df = []
         self.sideset_ledger.add_sideset(el_list, face_list, skin_id, skin_name)
 
 
-    def write(self, path):
+    def write(self, path, filter=None):
         """
         Write from the ledger
+        :param filter: name of a filter in IO_FILTERS to compress variables with, or None to write them uncompressed
         :return: None
         """
         if self.ex.mode == 'w':
-            self.w_write()
+            self.w_write(filter)
         elif self.ex.mode == 'a':
             if path is None:
                 raise OSError("no path specified")
-            self.a_write(path)
+            # copying into a new file streams through every chunk of every variable, so give it a bigger cache
+            with util.chunk_cache(self._CHUNK_CACHE_SIZE, self._CHUNK_CACHE_NELEMS, self._CHUNK_CACHE_PREEMPTION):
+                self.a_write(path, filter)
 
-    def w_write(self):
+    def w_write(self, filter=None):
         if 'len_name' not in self.ex.data.dimensions:
-            self.ex.data.createDimension('len_name', self._MAX_NAME_LENGTH + 1)
+            self.ex.data.createDimension('len_name', self.ex._MAX_NAME_LENGTH + 1)
         if 'four' not in self.ex.data.dimensions:
             self.ex.data.createDimension('four', 4)
 
-        # QA records
+        # All dimensions are created before any data is written. In classic format files, adding a dimension after
+        # data has been written makes netCDF rewrite the header and move the data after it.
         num_qa_rec = 1
         self.ex.data.createDimension('num_qa_rec', num_qa_rec)
+        self.nodeset_ledger.write_dimensions(self.ex.data)
+        self.sideset_ledger.write_dimensions(self.ex.data)
+        self.element_ledger.write_dimensions(self.ex.data)
+
+        # QA records
         var = self.ex.data.createVariable('qa_records', '|S1', (DIM_NUM_QA, DIM_FOUR, DIM_STRING_LENGTH))
-        qa = np.empty((num_qa_rec, 4, self.ex.max_allowed_name_length + 1), '|S1')  # add 1 for null terminator
-        qa[0] = util.generate_qa_rec(self.ex.max_string_length)
-        var[:] = qa
+        var[0] = util.generate_qa_rec(self.ex.max_string_length)
 
-        self.nodeset_ledger.write_dimensions(self.ex.data)
         self.nodeset_ledger.write_variables(self.ex.data)
-        self.sideset_ledger.write_dimensions(self.ex.data)
         self.sideset_ledger.write_variables(self.ex.data)
-        self.element_ledger.write_dimensions(self.ex.data)
-        self.element_ledger.write_variables(self.ex.data)
+        self.element_ledger.write_variables(self.ex.data, filter)
 
-    def a_write(self, path):
-        out = nc.Dataset(path, "w", clobber=False, format="NETCDF4")
-        old = self.ex.data
+    @staticmethod
+    def _storage_hints(src, out, filter=None):
+        """
+        Returns the chunking and compression keyword arguments to recreate a variable with in another dataset.
 
-        out.setncatts(old.__dict__)
+        Variables that were compressed in the source keep their own chunking and compression, except that a filter
+        replaces zlib on the variables `util.io_hints` compresses. Everything else gets the defaults from
+        `util.io_hints`.
 
-        # copy dimensions
-        for dimension in old.dimensions.keys():
+        :param src: variable being copied
+        :param out: dataset the copy will be created in
+        :param filter: name of a filter in IO_FILTERS to compress with, or None
+        :return: dictionary of keyword arguments for createVariable
+        """
+        hints = util.io_hints(out, src.name, src.dimensions, filter)
+        # classic format variables have no filters or chunks
+        filters = src.filters() or {}
+        if (filters.get('zlib') or filters.get('fletcher32')) and out.data_model.startswith('NETCDF4'):
+            # a filter only replaces zlib on the variables io_hints compresses, the rest keep their own zlib settings
+            if filters.get('zlib') and (filter in (None, 'zlib') or 'compression' not in hints):
+                hints = {'zlib': True, 'complevel': filters['complevel'], 'shuffle': filters['shuffle']}
+            hints['fletcher32'] = filters.get('fletcher32', False)
+            chunking = src.chunking()
+            if chunking is not None and chunking != 'contiguous':
+                # the copy's dimensions can be smaller than the source chunks, e.g. an unlimited time dimension that
+                # is copied with a fixed size
+                dims = [out.dimensions[dim] for dim in src.dimensions]
+                hints['chunksizes'] = [size if dim.isunlimited() else max(1, min(size, dim.size))
+                                       for size, dim in zip(chunking, dims)]
+        return hints
+
+    @classmethod
+    def _copy_variable_data(cls, src, dst):
+        """
+        Copies the data of one NetCDF variable into another with the same shape.
 
-            # ignore dimensions that will be written by ns ledger
-            if dimension == "num_node_sets" or dimension[:10] == "num_nod_ns":
-                continue
-            # ignore dimensions that will be written by ss ledger
-            if dimension == "num_side_sets" or dimension[:11] == "num_side_ss" or dimension[:9] == "num_df_ss"  or dimension[:12] == "num_sset_var":
-                continue
+        Large variables are copied in slabs along their first dimension, so only about _COPY_SLAB_BYTES of the
+        variable is in memory at a time. When a single entry along the first dimension is already larger than that, such
+        as one time step of a nodal variable on a large mesh, each entry is split along the second dimension as well.
+        Slabs are lined up with the destination's chunks when it is chunked.
 
-            # ignore dimensions that will be written by elem ledger
-            if dimension == "num_elem" or dimension == "num_el_blk" or dimension[:13] == "num_el_in_blk" \
-                    or dimension[:14] == "num_nod_per_el" or dimension == "num_elem_var":
-                continue
+        netCDF4 has no way to move compressed chunks between files as they are stored, so compressed data is always
+        decompressed and compressed again. Keeping the source chunking (see `_storage_hints`) means each chunk goes
+        through that round trip once.
 
-            # ignore for updating QA records
-            if dimension == 'num_qa_rec':
-                continue
+        :param src: variable to read from
+        :param dst: variable to write to
+        """
+        shape = src.shape
+        if len(shape) == 0 or shape[0] == 0:
+            dst[...] = src[...]
+            return
+        itemsize = np.dtype(src.dtype).itemsize
+        row_bytes = itemsize * int(np.prod(shape[1:]))
+        chunking = dst.chunking()
+        chunked = chunking != 'contiguous'
+        if row_bytes > cls._COPY_SLAB_BYTES and len(shape) > 1 and shape[1] > 0:
+            part = max(1, cls._COPY_SLAB_BYTES // max(1, itemsize * int(np.prod(shape[2:]))))
+            if chunked and part > chunking[1]:
+                part -= part % chunking[1]
+            for row in range(shape[0]):
+                for start in range(0, shape[1], part):
+                    dst[row, start:start + part] = src[row, start:start + part]
+            return
+        slab = max(1, cls._COPY_SLAB_BYTES // max(1, row_bytes))
+        if chunked and slab > chunking[0]:
+            slab -= slab % chunking[0]
+        for start in range(0, shape[0], slab):
+            dst[start:start + slab] = src[start:start + slab]
+
+    def a_write(self, path, filter=None):
+        # The new file is built variable by variable rather than by copying the old file and editing the copy. netCDF
+        # cannot delete a variable or resize a fixed dimension, and the ledgers may change both (num_elem, num_nod_ns*).
+        out = nc.Dataset(path, "w", clobber=False, format="NETCDF4")
+        try:
+            self._a_write_contents(out, filter)
+        except BaseException:
+            # don't leave a half written file behind, it would also block writing to the same path again
+            out.close()
+            os.remove(path)
+            raise
+        out.close()
 
-            out.createDimension(dimension, old.dimensions[dimension].size)
-            
-        if 'len_name' not in out.dimensions:
-            out.createDimension('len_name', self._MAX_NAME_LENGTH + 1)
+    def _a_write_contents(self, out, filter):
+        """Writes everything a_write puts in the new file. FOR INTERNAL USE ONLY!"""
+        # every variable is written in full below, so skip filling it first (the same as write mode, see ex_open.c)
+        out.set_fill_off()
+        old = self.ex.data
 
-        if 'len_string' not in out.dimensions:
-            out.createDimension('len_string', self._MAX_STR_LENGTH + 1)
+        old_dims = old.dimensions
+        old_vars = old.variables
 
-        if 'len_line' not in out.dimensions:
-            out.createDimension('len_line', self._MAX_LINE_LENGTH + 1)
+        out.setncatts({attr: old.getncattr(attr) for attr in old.ncattrs()})
 
-        self.nodeset_ledger.write_dimensions(out)
-        self.sideset_ledger.write_dimensions(out)
-        self.element_ledger.write_dimensions(out)
+        # copy dimensions, ignoring those that will be written by the other ledgers or for updating QA records
+        skip_prefixes = self._SKIP_DIM_PREFIXES
+        skip_exact = self._SKIP_DIM_EXACT
+        dims_to_copy = [(name, dim) for name, dim in old_dims.items()
+                        if not (name.startswith(skip_prefixes) or name in skip_exact)]
+        for name, dim in dims_to_copy:
+            out.createDimension(name, dim.size)
 
-        # copy variables
-        for var in old.variables:
+        # the string length dimensions are copied when the old file has them, so check against what was copied
+        copied = frozenset(name for name, _ in dims_to_copy)
+        if 'len_name' not in copied:
+            out.createDimension('len_name', self.ex._MAX_NAME_LENGTH + 1)
 
-            # ignore variables that will be written by ns ledger
-            if var[:3] == "ns_" or var[:7] == "node_ns" \
-                    or var[:12] == "dist_fact_ns":
-                continue
+        if 'len_string' not in copied:
+            out.createDimension('len_string', self.ex._MAX_STR_LENGTH + 1)
 
-            # ignore variables that will be written by ss ledger
-            if var[:3] == "ss_" or var[:7] == "side_ss" or var[:7] == "elem_ss" or var[:12] == "dist_fact_ss"\
-                or var[:13] == "vals_sset_var" or var[:13] == "name_sset_var" or var[:12] == "sset_var_tab":
-                continue
+        if 'len_line' not in copied:
+            out.createDimension('len_line', self.ex._MAX_LINE_LENGTH + 1)
 
-            #TODO -> elem_map is not for IDs
-            # ignore variables that will be written by elem ledger
-            if var[:3] == "eb_" or var == "elem_map" or var[:7] == "connect" or var == "elem_num_map" \
-                    or var == "name_elem_var" or var[:13] == "vals_elem_var" or var == "elem_var_tab":
-                continue
+        self.nodeset_ledger.write_dimensions(out)
+        self.sideset_ledger.write_dimensions(out)
+        self.element_ledger.write_dimensions(out)
 
-            if var == 'qa_records':
+        # copy variables
+        # All variables are defined before any data is copied, so the file's metadata is settled in one pass. The data
+        # copies stay on this thread: netCDF-C and HDF5 are not thread-safe, even for different variables.
+        copies = []
+        create_variable = out.createVariable
+        # ignore variables that will be written by the other ledgers or for updating QA records
+        skip_prefixes = self._SKIP_VAR_PREFIXES
+        skip_exact = self._SKIP_VAR_EXACT
+        for var, var_data in list(old_vars.items()):
+            if var.startswith(skip_prefixes) or var in skip_exact:
                 continue
 
-            var_data = old[var]
-
             # variable creation data
-            varname = var_data.name
-            datatype = var_data.dtype
-            dimensions = var_data.dimensions
-            out.createVariable(varname, datatype, dimensions)
-            out[varname].setncatts(old[varname].__dict__)
-            out[varname][:] = old[var][:]
-
+            attributes = {attr: var_data.getncattr(attr) for attr in var_data.ncattrs()}
+            out_var = create_variable(var_data.name, var_data.dtype, var_data.dimensions,
+                                      fill_value=attributes.pop('_FillValue', None),
+                                      **self._storage_hints(var_data, out, filter))
+            out_var.setncatts(attributes)
+            copies.append((var_data, out_var))
+
+        # The data is copied as stored, so skip masking, scaling and string conversion on both ends. Each variable
+        # gets its own settings back afterwards, since the QA records, the ledgers and the caller rely on them.
+        variables = [var for pair in copies for var in pair]
+        settings = [(var.mask, var.scale, var.chartostring) for var in variables]
+        for var in variables:
+            var.set_auto_mask(False)
+            var.set_auto_scale(False)
+            var.set_auto_chartostring(False)
+        try:
+            for var_data, out_var in copies:
+                self._copy_variable_data(var_data, out_var)
+        finally:
+            for var, (mask, scale, chartostring) in zip(variables, settings):
+                var.set_auto_mask(mask)
+                var.set_auto_scale(scale)
+                var.set_auto_chartostring(chartostring)
         
         # QA records
         num_qa_rec = self.ex.num_qa + 1
         out.createDimension(DIM_NUM_QA, num_qa_rec)
-        out.createVariable(VAR_QA, '|S1', (DIM_NUM_QA, DIM_FOUR, DIM_STRING_LENGTH))
-        qa = np.empty((num_qa_rec, 4, self.ex.max_string_length + 1), '|S1')  # add 1 for null terminator
-        qa[0:self.ex.num_qa] = old.variables[VAR_QA][:]
-        qa[-1] = util.generate_qa_rec(self.ex.max_string_length)
-        out['qa_records'][:] = qa
+        out_qa = out.createVariable(VAR_QA, '|S1', (DIM_NUM_QA, DIM_FOUR, DIM_STRING_LENGTH))
+        if self.ex.num_qa > 0:
+            # the old records are copied as raw characters, so skip building a masked array for them
+            old_qa = old_vars[VAR_QA]
+            mask = old_qa.mask
+            old_qa.set_auto_mask(False)
+            out_qa[:self.ex.num_qa] = old_qa[...]
+            old_qa.set_auto_mask(mask)
+        out_qa[self.ex.num_qa] = util.generate_qa_rec(self.ex.max_string_length)
 
         self.nodeset_ledger.write_variables(out)
         self.sideset_ledger.write_variables(out)
-        self.element_ledger.write_variables(out)
-        out.close()
+        self.element_ledger.write_variables(out, filter)
@@ -1,95 +1,88 @@
+import warnings
+from dataclasses import dataclass
+from typing import Optional
 import numpy as np
 from . import util
 
 
+@dataclass(eq=False)
+class _NodeSetEntry:
+    """Stores one node set tracked by the node set ledger."""
+    # user-defined id, as stored in ns_prop1
+    node_set_id: int
+    # user-specified name, "NodeSet <id>" if none was given
+    name: str
+    # name of the variable holding the node set in the original file (node_ns<internal id>), None if added later
+    source: Optional[str]
+    # sorted nodes of the node set, None while the node set is still only in the original file
+    nodes: Optional[np.ndarray]
+
+
 class NSLedger:
 
     def __init__(self, ex):
-        # maps the unique name assigned to each node set with the actual nodeset
-        # maps to None if node set exists in original file
-        self.node_set_map = {}
-        # inorder list of unique program-specified node set names
-        # integer value if node set is added to existing file
-        # name of form node_ns # if node set already exists
+        # inorder list of node sets, one entry per node set
         self.node_sets = []
-        # counter to assign unique program-specified names to node sets
-        self.new_node_set_name = 0
-
-        # keeps track of node set ids according to ns_prop1
-        # self.nodeset_ids[i] = j denotes nodeset of id j existing at index i
-        self.node_set_ids = []
-        # O(1) lookup for nodeset ids to ensure uniqueness
-        self.node_set_id_set = set()
-
-        # inorder list of user-specified node set names
-        self.node_set_names = []
-        # O(1) lookup for user-specified node set names
-        self.node_set_name_set = set()
+        # O(1) lookups from node set id and user-specified name to the node set's entry
+        self.node_set_id_lookup = {}
+        self.node_set_name_lookup = {}
         self.ex = ex
 
-        self.node_set_name_lookup = {}
+        # nodes added one at a time through add_node_to_nodeset, keyed by node set id
+        # applied in one batch by flush() before the node sets are next read, changed or written
+        self._pending_adds = {}
 
         # if no existing nodesets, no need to set up variables
         # beyond initialization
-        if 'num_node_sets' not in ex.data.dimensions.keys():
+        if 'num_node_sets' not in ex.data.dimensions:
             return
 
-        # setup nodeset map for existing nodesets
-        for i in range(ex.data.dimensions['num_node_sets'].size):
-            ns_title = "node_ns" + str(i+1)
-            self.node_sets.append(ns_title)
-            self.node_set_map[ns_title] = None
+        num_node_sets = ex.data.dimensions['num_node_sets'].size
 
         # setup support for ns_prop1 id map if it exists
-        if "ns_prop1" in ex.data.variables.keys():
-            for i in ex.data.variables['ns_prop1']:
-                self.node_set_ids.append(int(i))
-                self.node_set_id_set.add(int(i))
+        if "ns_prop1" in ex.data.variables:
+            # one read for all ids instead of one per node set
+            node_set_ids = np.asarray(ex.data.variables['ns_prop1'][:], dtype=np.int64).tolist()
         # if not, create id map for consistency
         else:
-            for i in range(len(self.node_sets)):
-                self.node_set_ids.append(i + 1)
-                self.node_set_id_set.add(i + 1)
+            node_set_ids = list(range(1, num_node_sets + 1))
 
         # setup user-specified node set names
-        if "ns_names" in ex.data.variables.keys():
-            i = 0
-            for name in ex.data.variables['ns_names']:
-                n = util.lineparse(name)
-                self.node_set_names.append(n)
-                self.node_set_name_set.add(n)
-                self.node_set_name_lookup[n] = self.node_set_ids[i]
-                i += 1
+        if "ns_names" in ex.data.variables:
+            # read every name in one go as raw characters, so no masked array is built
+            ns_names = ex.data.variables['ns_names']
+            mask = ns_names.mask
+            ns_names.set_auto_mask(False)
+            names = ns_names[:]
+            ns_names.set_auto_mask(mask)
+            node_set_names = [util.lineparse(name) for name in names]
         else:
-            for i in self.node_set_ids:
-                self.node_set_names.append("NodeSet %d" % i)
-                self.node_set_name_set.add("NodeSet %d" % i)
-                self.node_set_name_lookup["NodeSet %d" % i] = int(i)
+            node_set_names = ["NodeSet %d" % i for i in node_set_ids]
+
+        # existing node sets are read from the file when they are first changed
+        self.node_sets = [_NodeSetEntry(node_set_id, name, "node_ns%d" % i, None)
+                          for i, (node_set_id, name) in enumerate(zip(node_set_ids, node_set_names), 1)]
+        # the first node set wins if the file repeats an id, and the last one if it repeats a name
+        for entry in reversed(self.node_sets):
+            self.node_set_id_lookup[entry.node_set_id] = entry
+        self.node_set_name_lookup = {entry.name: entry for entry in self.node_sets}
 
     def add_nodeset(self, node_ids, node_set_id, node_set_name=""):
 
-        if node_set_id in self.node_set_id_set:
+        if node_set_id in self.node_set_id_lookup:
             raise KeyError("Nodeset ID already in use")
-        if node_set_name in self.node_set_name_set or "NodeSet %d" % node_set_id in self.node_set_name_set:
+        # unnamed node sets get a generated name, so only the name that will actually be stored has to be free
+        name = node_set_name or "NodeSet %d" % node_set_id
+        if name in self.node_set_name_lookup:
             raise KeyError("Nodeset name already in use")
 
-        self.node_sets.append(str(self.new_node_set_name))
-        self.node_set_map[str(self.new_node_set_name)] = np.unique(node_ids)
-        self.node_set_ids.append(node_set_id)
-        self.node_set_id_set.add(node_set_id)
-
-        if node_set_name == "":
-            self.node_set_names.append("NodeSet %d" % node_set_id)
-            self.node_set_name_set.add("NodeSet %d" % node_set_id)
-            self.node_set_name_lookup["NodeSet %d" % node_set_id] = int(node_set_id)
-        else:
-            self.node_set_names.append(node_set_name)
-            self.node_set_name_set.add(node_set_name)
-            self.node_set_name_lookup[node_set_name] = int(node_set_id)
-
-        self.new_node_set_name += 1
+        entry = _NodeSetEntry(node_set_id, name, None, np.unique(node_ids))
+        self.node_sets.append(entry)
+        self.node_set_id_lookup[node_set_id] = entry
+        self.node_set_name_lookup[name] = entry
 
     def remove_nodeset(self, identifier):
+        self.flush()
         if isinstance(identifier, str):
             return self._str_remove_nodeset(identifier)
         elif isinstance(identifier, int):
@@ -98,36 +91,27 @@ class NSLedger:
             raise TypeError("Identifier must be of type str or int")
 
     def _str_remove_nodeset(self, name):
-        node_set_id = self.node_set_name_lookup[name]
+        node_set_id = self.node_set_name_lookup[name].node_set_id
         return self._id_remove_nodeset(node_set_id)
 
     def _id_remove_nodeset(self, node_set_id):
-        node_set_num = self.find_nodeset_num(node_set_id)
+        entry = self.find_nodeset(node_set_id)
 
         # remove all references to removed node set
-        # O(1) with respect to the actual node sets
-        # O(n) with respect to number of changes in ledger
-        node_set_name = self.node_sets.pop(node_set_num)
-        removed_id = self.node_set_ids.pop(node_set_num)
-        self.node_set_id_set.remove(int(removed_id))
-        self.node_set_map.pop(node_set_name)
-
-        name = self.node_set_names.pop(node_set_num)
-        self.node_set_name_set.remove(name)
-        self.node_set_name_lookup.pop(name)
+        # O(n) with respect to number of node sets, for the position in the inorder list
+        self.node_sets.remove(entry)
+        del self.node_set_id_lookup[node_set_id]
+        if self.node_set_name_lookup.get(entry.name) is entry:
+            del self.node_set_name_lookup[entry.name]
 
     def merge_nodesets(self, new_id, node_set_id1, node_set_id2, delete=True):
-        if new_id in self.node_set_id_set:
+        if new_id in self.node_set_id_lookup:
             raise KeyError("NodeSet ID already in use")
 
         n1 = self.get_node_set(node_set_id1)
         n2 = self.get_node_set(node_set_id2)
-        n3 = []
-        for i in n1:
-            n3.append(i)
-        for i in n2:
-            if i not in n3:
-                n3.append(i)
+        # sorted and without duplicates, same as add_nodeset stores it
+        n3 = np.union1d(n1, n2)
 
         self.add_nodeset(n3, new_id)
         if delete:
@@ -135,6 +119,11 @@ class NSLedger:
             self.remove_nodeset(node_set_id2)
 
     def add_node_to_nodeset(self, node_id, identifier):
+        warnings.warn("add_node_to_nodeset is slow when called once per node, use add_nodes_to_nodeset to add many "
+                      "nodes at once", PendingDeprecationWarning, stacklevel=2)
+        # the node is only applied at the next flush, so reject anything that is not a single node id now
+        if not isinstance(node_id, (int, np.integer)):
+            raise TypeError("Node id must be of type int")
         if isinstance(identifier, str):
             return self._str_add_node_to_nodeset(node_id, identifier)
         elif isinstance(identifier, int):
@@ -143,16 +132,29 @@ class NSLedger:
             raise TypeError("Identifier must be of type str or int")
 
     def _str_add_node_to_nodeset(self, node_id, name):
-        node_set_id = self.node_set_name_lookup[name]
+        node_set_id = self.node_set_name_lookup[name].node_set_id
         return self._id_add_node_to_nodeset(node_id, node_set_id)
 
     def _id_add_node_to_nodeset(self, node_id, node_set_id):
-        self.add_nodes_to_nodeset(np.array(node_id), node_set_id)
+        # check the node set exists now, but hold the node until the next flush
+        self.find_nodeset(node_set_id)
+        self._pending_adds.setdefault(node_set_id, []).append(int(node_id))
+
+    def flush(self):
+        """Adds all nodes held back by add_node_to_nodeset to their node sets"""
+        # each node set's nodes are only dropped from the queue once they have been added, so a failure leaves them
+        # and every node set after it queued
+        pending = self._pending_adds
+        while pending:
+            node_set_id = next(iter(pending))
+            self._id_add_nodes_to_nodeset(np.array(pending[node_set_id]), node_set_id)
+            del pending[node_set_id]
 
     def remove_node_from_nodeset(self, node_id, node_set_id):
-        self.remove_nodes_from_nodeset(np.array(node_id), node_set_id)
+        self.remove_nodes_from_nodeset(np.asarray([node_id]), node_set_id)
 
     def add_nodes_to_nodeset(self, node_ids, identifier):
+        self.flush()
         if isinstance(identifier, str):
             return self._str_add_nodes_to_nodeset(node_ids, identifier)
         elif isinstance(identifier, int):
@@ -161,27 +163,25 @@ class NSLedger:
             raise TypeError("Identifier must be of type str or int")
 
     def _str_add_nodes_to_nodeset(self, node_ids, name):
-        node_set_id = self.node_set_name_lookup[name]
+        node_set_id = self.node_set_name_lookup[name].node_set_id
         return self._id_add_nodes_to_nodeset(node_ids, node_set_id)
 
     # node_ids must be array-like per numpy
     def _id_add_nodes_to_nodeset(self, node_ids, node_set_id):
-        node_set_num = self.find_nodeset_num(node_set_id)
-
-        # determine whether nodeset exists in memory or still only exists in the exodus object
-        # needs to be pulled into memory regardless
-        program_name = self.node_sets[node_set_num]
-        curr_node_set = self.node_set_map[program_name]
-        if curr_node_set is None:
-            curr_node_set = self.ex.data[program_name][:]
-            program_name = str(self.new_node_set_name)
-            self.node_set_map[program_name] = curr_node_set
-            self.new_node_set_name += 1
-
-        new_node_set = np.unique(np.append(curr_node_set, node_ids))
-        self.node_set_map[program_name] = new_node_set
+        entry = self.find_nodeset(node_set_id)
+        curr_node_set = self._load_nodes(entry)
+
+        # the stored node set is already sorted without duplicates, so only the new nodes need sorting before they
+        # are inserted in place, instead of sorting the whole combined array again
+        node_ids = np.unique(node_ids)
+        pos = np.searchsorted(curr_node_set, node_ids)
+        present = np.zeros(len(node_ids), dtype=bool)
+        inside = pos < len(curr_node_set)
+        present[inside] = curr_node_set[pos[inside]] == node_ids[inside]
+        entry.nodes = np.insert(curr_node_set, pos[~present], node_ids[~present])
 
     def remove_nodes_from_nodeset(self, node_ids, identifier):
+        self.flush()
         if isinstance(identifier, str):
             return self._str_remove_nodes_from_nodeset(node_ids, identifier)
         elif isinstance(identifier, int):
@@ -190,28 +190,59 @@ class NSLedger:
             raise TypeError("Identifier must be of type str or int")
 
     def _str_remove_nodes_from_nodeset(self, node_ids, name):
-        node_set_id = self.node_set_name_lookup[name]
+        node_set_id = self.node_set_name_lookup[name].node_set_id
         return self._id_remove_nodes_from_nodeset(node_ids, node_set_id)
 
     def _id_remove_nodes_from_nodeset(self, node_ids, node_set_id):
-        node_set_num = self.find_nodeset_num(node_set_id)
-
-        # determine whether node set exists in memory or still only exists in the exodus object
-        # needs to be pulled into memory regardless
-        program_name = self.node_sets[node_set_num]
-        curr_node_set = self.node_set_map[program_name]
-        if curr_node_set is None:
-            curr_node_set = self.ex.data[program_name][:]
-            program_name = str(self.new_node_set_name)
-            self.node_set_map[program_name] = curr_node_set
-            self.new_node_set_name += 1
-
-        new_node_set = np.setdiff1d(curr_node_set, node_ids)
+        entry = self.find_nodeset(node_set_id)
+        curr_node_set = self._load_nodes(entry)
+
+        # node sets held in memory are sorted without duplicates, so setdiff1d does not need to sort them again
+        new_node_set = np.setdiff1d(curr_node_set, node_ids, assume_unique=True)
         if len(curr_node_set) - len(new_node_set) != len(node_ids):
             raise IndexError("One or more nodes could not be found in NodeSet " + str(node_set_id))
-        self.node_set_map[program_name] = new_node_set
+        entry.nodes = new_node_set
+
+    def _load_nodes(self, entry):
+        """
+        Returns the nodes of a node set, reading them from the original file if they are not in memory yet.
+
+        FOR INTERNAL USE ONLY!
+        """
+        if entry.nodes is None:
+            # node sets in the file are not necessarily sorted, so sort them once as they are pulled into memory
+            entry.nodes = np.unique(self.ex.data[entry.source][:])
+        return entry.nodes
+
+    def _source_positions(self, entry):
+        """
+        Returns where each node of a changed node set was in the node set in the original file, or -1 for nodes that
+        were added since.
+
+        FOR INTERNAL USE ONLY!
+        """
+        old_nodes, first = np.unique(self.ex.data[entry.source][:], return_index=True)
+        if len(old_nodes) == 0:
+            return np.full(len(entry.nodes), -1)
+        # both node arrays are sorted, so one binary search finds every node
+        pos = np.minimum(np.searchsorted(old_nodes, entry.nodes), len(old_nodes) - 1)
+        return np.where(old_nodes[pos] == entry.nodes, first[pos], -1)
+
+    @staticmethod
+    def _remap(values, positions, default):
+        """
+        Returns values given per node of a node set in the original file, rearranged for the nodes the node set has
+        now. Nodes that were added since get ``default``.
+
+        FOR INTERNAL USE ONLY!
+        """
+        result = np.full(values.shape[:-1] + (len(positions),), default, dtype=values.dtype)
+        kept = positions >= 0
+        result[..., kept] = values[..., positions[kept]]
+        return result
 
     def write_dimensions(self, data):
+        self.flush()
         # if no node sets exist, no writing needs to be performed
         if len(self.node_sets) == 0:
             return
@@ -219,20 +250,19 @@ class NSLedger:
         # create num_node_sets dimension
         data.createDimension("num_node_sets", len(self.node_sets))
 
-        for i in range(len(self.node_sets)):
+        for i, entry in enumerate(self.node_sets):
             # if node set exists in old file, copy directly
-            node_set_name = self.node_sets[i]
-            if self.node_set_map[node_set_name] is None:
-                dimension = self.ex.data.variables[node_set_name].dimensions[0]
+            if entry.nodes is None:
+                dimension = self.ex.data.variables[entry.source].dimensions[0]
                 data.createDimension("num_nod_ns" + str(i + 1),
                                      self.ex.data.dimensions[dimension].size)
 
             # else, create according to np array
             else:
-                data.createDimension("num_nod_ns" + str(i + 1),
-                                     len(self.node_set_map[node_set_name]))
+                data.createDimension("num_nod_ns" + str(i + 1), len(entry.nodes))
 
     def write_variables(self, data):
+        self.flush()
 
         # if no node sets exist, no writing needs to be performed
         if len(self.node_sets) == 0:
@@ -241,58 +271,79 @@ class NSLedger:
         # add ns_prop1 data
         data.createVariable("ns_prop1", "int32", dimensions="num_node_sets")
         data['ns_prop1'].setncattr('name', 'ID')
-        data['ns_prop1'][:] = np.array(self.node_set_ids)
+        data['ns_prop1'][:] = np.fromiter((entry.node_set_id for entry in self.node_sets), dtype=np.int32,
+                                          count=len(self.node_sets))
 
         # add ns_name data
-        data.createVariable("ns_names", "|S1", dimensions=("num_node_sets", "len_name"))
-        for i in range(len(self.node_set_names)):
-            data['ns_names'][i] = util.convert_string(self.node_set_names[i], self.ex.max_allowed_name_length)
+        ns_names = data.createVariable("ns_names", "|S1", dimensions=("num_node_sets", "len_name"))
+        # stack the rows and write them with one call instead of one write per name
+        length = self.ex.max_allowed_name_length
+        ns_names[:] = np.ma.vstack([util.convert_string(entry.name, length) for entry in self.node_sets])
 
-        # add node set data
-        for i in range(len(self.node_sets)):
-            node_set_name = self.node_sets[i]
-            # if node set exists in old file, copy directly
-            if self.node_set_map[node_set_name] is None:
-
-                data.createVariable("node_ns" + str(i+1), "int32",
-                                    dimensions=("num_nod_ns" + str(i+1)))
-
-                # copy data
-                data["node_ns" + str(i+1)][:] = self.ex.data[node_set_name][:]
+        # default distribution factors for every node set that has none, grown to the largest set seen so far
+        ones = np.ones(0, dtype=np.float64)
+        num_ns_var = data.dimensions['num_nset_var'].size if 'num_nset_var' in data.dimensions else 0
+        var_tab = np.zeros((len(self.node_sets), num_ns_var), dtype=np.int32)
 
-                if "dist_fact_ns" + node_set_name[-1:] in self.ex.data.variables.keys():
-                    data.createVariable("dist_fact_ns" + str(i+1), "float64", dimensions=("num_nod_ns" + str(i+1)))
-                    data["dist_fact_ns" + str(i+1)][:] = self.ex.data["dist_fact_ns" + node_set_name[-1:]][:]
+        # add node set data
+        old_vars = self.ex.data.variables
+        copy_variable_data = self.ex.ledger._copy_variable_data
+        for i, entry in enumerate(self.node_sets):
+            suffix = str(i + 1)
+            dim = "num_nod_ns" + suffix
+            node_ns = data.createVariable("node_ns" + suffix, "int32", dimensions=dim)
+            dist_fact = data.createVariable("dist_fact_ns" + suffix, "float64", dimensions=dim)
+
+            if entry.nodes is None:
+                # unchanged node set from the old file, copy it directly in slabs rather than reading it all at once
+                copy_variable_data(old_vars[entry.source], node_ns)
+            else:
+                node_ns[:] = entry.nodes
+            # node sets that were changed keep the factors and variable values of the nodes they had in the old file
+            positions = None if entry.nodes is None or entry.source is None else self._source_positions(entry)
+
+            # existing node sets are named node_ns<internal id>, their factors dist_fact_ns<internal id> and their
+            # variables vals_nset_var<var>ns<internal id>
+            old_num = None if entry.source is None else entry.source[len("node_ns"):]
+            old_dist_fact = None if old_num is None else "dist_fact_ns" + old_num
+            if old_dist_fact in old_vars and positions is None:
+                copy_variable_data(old_vars[old_dist_fact], dist_fact)
+            elif old_dist_fact in old_vars:
+                dist_fact[:] = self._remap(old_vars[old_dist_fact][:], positions, 1.0)
+            else:
+                ns_size = data.dimensions[dim].size
+                if ns_size > ones.size:
+                    ones = np.ones(ns_size, dtype=np.float64)
+                dist_fact[:] = ones[:ns_size]
+
+            for v in range(num_ns_var):
+                old_vals = None if old_num is None else old_vars.get("vals_nset_var%dns%s" % (v + 1, old_num))
+                if old_vals is None:
+                    continue
+                vals = data.createVariable("vals_nset_var%dns%s" % (v + 1, suffix), old_vals.dtype,
+                                           dimensions=(old_vals.dimensions[0], dim),
+                                           **self.ex.ledger._storage_hints(old_vals, data))
+                if positions is None:
+                    copy_variable_data(old_vals, vals)
                 else:
-                    data.createVariable("dist_fact_ns" + str(i + 1), "float64", dimensions=("num_nod_ns" + str(i + 1)))
-                    ns_size = data.dimensions['num_nod_ns' + str(i+1)].size
-                    data["dist_fact_ns" + str(i+1)][:] = np.ones(ns_size, dtype=np.float64)[:]
+                    # like new sides in a side set, nodes added to a node set get 0 for their variables
+                    vals[:] = self._remap(old_vals[:], positions, 0)
+                var_tab[i, v] = 1
 
-            # else, create according to np array
-            else:
-                data.createVariable("node_ns" + str(i+1), "int32",
-                                    dimensions=("num_nod_ns" + str(i+1)))
-                data["node_ns"+str(i+1)][:] = self.node_set_map[node_set_name][:]
-                data.createVariable("dist_fact_ns" + str(i + 1), "float64", dimensions=("num_nod_ns" + str(i + 1)))
-                ns_size = data.dimensions['num_nod_ns' + str(i + 1)].size
-                data["dist_fact_ns" + str(i + 1)][:] = np.ones(ns_size, dtype=np.float64)[:]
+        if num_ns_var > 0:
+            data.createVariable("nset_var_tab", "int32", dimensions=("num_node_sets", "num_nset_var"))
+            data['nset_var_tab'][:] = var_tab
 
         # TODO: add ns_status
 
-    def find_nodeset_num(self, node_set_id):
-        node_set_num = -1
-        # search for node set that corresponds with given ID
-        for i in range(len(self.node_set_ids)):
-            if self.node_set_ids[i] == node_set_id:
-                node_set_num = i
-                break
-
-        # raise IndexError if no node set is found
-        if node_set_num == -1:
+    def find_nodeset(self, node_set_id):
+        """Returns the ledger entry of the node set with given ID."""
+        # raise KeyError if no node set is found
+        try:
+            return self.node_set_id_lookup[node_set_id]
+        except KeyError:
             raise KeyError("Cannot find node set with ID " + str(node_set_id))
 
-        return node_set_num
-
     #############################################
     #                                           #
     #          Read Shadow Methods              #
@@ -303,6 +354,7 @@ class NSLedger:
         return len(self.node_sets)
 
     def get_node_set(self, identifier):
+        self.flush()
         if isinstance(identifier, str):
             return self._str_get_node_set(identifier)
         elif isinstance(identifier, int):
@@ -311,20 +363,20 @@ class NSLedger:
             raise TypeError("Identifier must be of type str or int")
 
     def _str_get_node_set(self, name):
-        node_set_id = self.node_set_name_lookup[name]
+        node_set_id = self.node_set_name_lookup[name].node_set_id
         return self._id_get_node_set(node_set_id)
 
     def _id_get_node_set(self, node_set_id):
-        num = self.find_nodeset_num(node_set_id)
-        name = self.node_sets[num]
-        if name not in self.node_set_map.keys():
-            raise KeyError(f"Node Set {node_set_id} does not exist")
-
-        if self.node_set_map[name] is None:
-            return np.array(self.ex.data[name])
-        return np.array(self.node_set_map[name])
+        entry = self.find_nodeset(node_set_id)
+        if entry.nodes is None:
+            return np.array(self.ex.data[entry.source])
+        # stored node sets are replaced rather than changed in place, so hand out a read-only view instead of a copy
+        node_set = entry.nodes.view()
+        node_set.flags.writeable = False
+        return node_set
 
     def get_partial_node_set(self, identifier, start, count):
+        self.flush()
         if isinstance(identifier, str):
             return self._str_get_partial_node_set(identifier, start, count)
         elif isinstance(identifier, int):
@@ -333,27 +385,22 @@ class NSLedger:
             raise TypeError("Identifier must be of type str or int")
 
     def _str_get_partial_node_set(self, node_set_name, start, count):
-        node_set_id = self.node_set_name_lookup[node_set_name]
+        node_set_id = self.node_set_name_lookup[node_set_name].node_set_id
         print(node_set_id)
         return self._id_get_partial_node_set(node_set_id, start, count)
 
     def _id_get_partial_node_set(self, node_set_id, start, count):
-        num = self.find_nodeset_num(node_set_id)
-        name = self.node_sets[num]
-        if name not in self.node_set_map.keys():
-            raise KeyError(f"Node Set {node_set_id} does not exist")
-
-        if self.node_set_map[name] is None:
-            return np.unique(self.ex.data[name])[start - 1:start + count - 1]
-        return np.unique(self.node_set_map[name])[start - 1:start + count - 1]
+        entry = self.find_nodeset(node_set_id)
+        if entry.nodes is None:
+            return np.unique(self.ex.data[entry.source])[start - 1:start + count - 1]
+        return entry.nodes[start - 1:start + count - 1].copy()
 
     def get_node_set_id_map(self):
         """ Returns the id map for node sets (ns_prop1). """
-        return np.array(self.node_set_ids)
+        return np.array([entry.node_set_id for entry in self.node_sets])
 
     def get_node_set_name(self, node_set_id):
-        num = self.find_nodeset_num(node_set_id)
-        return self.node_set_names[num]
+        return self.find_nodeset(node_set_id).name
 
     def get_node_set_names(self):
-        return np.array(self.node_set_names)
+        return np.array([entry.name for entry in self.node_sets])
@@ -87,11 +87,10 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
     num_qa_rec = input.num_qa + 1
     output.createDimension(DIM_NUM_QA, num_qa_rec)
     var = output.createVariable(VAR_QA, '|S1', (DIM_NUM_QA, DIM_FOUR, DIM_STRING_LENGTH))
-    qa = numpy.empty((num_qa_rec, 4, input.max_string_length + 1), '|S1')  # add 1 for null terminator
+    # copy the existing records straight into the new variable, then add ours at the end
     if VAR_QA in input.data.variables:
-        qa[0:input.num_qa] = input.data.variables[VAR_QA][:]
-    qa[-1] = util.generate_qa_rec(input.max_string_length)
-    var[:] = qa
+        var[0:input.num_qa] = input.data.variables[VAR_QA][:]
+    var[-1] = util.generate_qa_rec(input.max_string_length)
 
     # Info records
     output.createDimension(DIM_NUM_INFO, input.num_info)
@@ -149,9 +148,9 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
             var = output.createVariable(VAR_EB_STATUS, input.int, DIM_NUM_EB)
             var[:] = input.data.variables[VAR_EB_STATUS][selected_block_indices]
 
-        block_id_map = input.data.variables[VAR_EB_PROP % 1]
+        block_id_map = input.data.variables[fmt(VAR_EB_PROP, 1)]
         # EB ID map / prop1
-        var = output.createVariable(VAR_EB_PROP % 1, input.int, DIM_NUM_EB)
+        var = output.createVariable(fmt(VAR_EB_PROP, 1), input.int, DIM_NUM_EB)
         var.setncattr(ATTR_NAME, 'ID')
         if 'ID' in prop_selector.eb_prop:
             # Keep ID map
@@ -168,8 +167,8 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
                 continue
             n = 1
             while True:
-                if VAR_EB_PROP % n in input.data.variables:
-                    name = input.data.variables[VAR_EB_PROP % n].getncattr(ATTR_NAME)
+                if fmt(VAR_EB_PROP, n) in input.data.variables:
+                    name = input.data.variables[fmt(VAR_EB_PROP, n)].getncattr(ATTR_NAME)
                     if propname == name:
                         # we've found our property
                         propids[n] = propname
@@ -187,8 +186,8 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
         for i in range(2, input.num_elem_block_prop + 1):
             if i in propids.keys():
                 propid += 1  # id of current property in output
-                var = output.createVariable(VAR_EB_PROP % propid, input.int, DIM_NUM_EB)
-                var[:] = input.data.variables[VAR_EB_PROP % i][selected_block_indices]
+                var = output.createVariable(fmt(VAR_EB_PROP, propid), input.int, DIM_NUM_EB)
+                var[:] = input.data.variables[fmt(VAR_EB_PROP, i)][selected_block_indices]
                 var.setncattr(ATTR_NAME, propids[i])
 
         # Figure out which variables we're keeping
@@ -222,31 +221,31 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
                 eb = idmap[input_id]  # selector of current block in output
 
                 # Dimensions
-                dim_num_el_in_blk = DIM_NUM_EL_IN_BLK % output_id
+                dim_num_el_in_blk = fmt(DIM_NUM_EL_IN_BLK, output_id)
                 output.createDimension(dim_num_el_in_blk, len(eb.elements))
-                dim_nod_per_el = DIM_NUM_NOD_PER_EL % output_id
+                dim_nod_per_el = fmt(DIM_NUM_NOD_PER_EL, output_id)
                 output.createDimension(dim_nod_per_el, nod_per_el)
 
                 # Connectivity list
-                var = output.createVariable(VAR_CONNECT % output_id, input.int, (dim_num_el_in_blk, dim_nod_per_el))
+                var = output.createVariable(fmt(VAR_CONNECT, output_id), input.int, (dim_num_el_in_blk, dim_nod_per_el))
                 var.setncattr(ATTR_ELEM_TYPE, topology)
-                var[:] = input.data.variables[VAR_CONNECT % input_id][eb.elements, :]
-                output_elem_indices.extend([x + sum_elem for x in eb.elements])
+                connect = input.data.variables[fmt(VAR_CONNECT, input_id)][eb.elements, :]
+                var[:] = connect
+                # selections are numpy arrays, so shift them all at once rather than element by element
+                output_elem_indices.extend((numpy.asarray(eb.elements, dtype=numpy.int64) + sum_elem).tolist())
                 # Compress the masked array
-                thing = input.data.variables[VAR_CONNECT % input_id][eb.elements, :]
-                thing = thing.compressed()
-                added_nodes.update(thing)
+                added_nodes.update(connect.compressed())
 
                 # EB attributes
                 if len(eb.attributes) > 0:
-                    dim_att_in_blk = DIM_NUM_ATT_IN_BLK % output_id
+                    dim_att_in_blk = fmt(DIM_NUM_ATT_IN_BLK, output_id)
                     output.createDimension(dim_att_in_blk, len(eb.attributes))
-                    var = output.createVariable(VAR_ELEM_ATTRIB % output_id, input.float,
+                    var = output.createVariable(fmt(VAR_ELEM_ATTRIB, output_id), input.float,
                                                 (dim_num_el_in_blk, dim_att_in_blk))
-                    var[:] = input.data.variables[VAR_ELEM_ATTRIB % input_id][eb.elements, eb.attributes]
-                    var = output.createVariable(VAR_ELEM_ATTRIB_NAME % output_id, '|S1',
+                    var[:] = input.data.variables[fmt(VAR_ELEM_ATTRIB, input_id)][eb.elements, eb.attributes]
+                    var = output.createVariable(fmt(VAR_ELEM_ATTRIB_NAME, output_id), '|S1',
                                                 (dim_att_in_blk, DIM_NAME_LENGTH))
-                    var[:] = input.data.variables[VAR_ELEM_ATTRIB_NAME % input_id][eb.attributes]
+                    var[:] = input.data.variables[fmt(VAR_ELEM_ATTRIB_NAME, input_id)][eb.attributes]
 
                 # Variable data and truth table filling
                 if has_variables:
@@ -256,11 +255,11 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
                         row[out_var_idx] = 1  # Set true in truth table row
                         # We only want to copy over variable values if we're keeping time steps
                         if has_time_steps:
-                            var = output.createVariable(VAR_VALS_ELEM_VAR % (out_var_idx + 1, output_id),
+                            var = output.createVariable(fmt(VAR_VALS_ELEM_VAR, out_var_idx + 1, output_id),
                                                         input.float,
                                                         (DIM_NUM_TIME_STEP, dim_num_el_in_blk))
-                            var[:] = input.data.variables[VAR_VALS_ELEM_VAR % (j + 1, input_id)][time_step_indices,
-                                                                                                 eb.elements]
+                            var[:] = input.data.variables[fmt(VAR_VALS_ELEM_VAR, j + 1, input_id)][
+                                time_step_indices, eb.elements]
                     var_truth_tab[output_id - 1] = row  # put row in table
             # Keep track of how many elements we've looked at
             sum_elem += num_el
@@ -319,9 +318,9 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
             var = output.createVariable(VAR_SS_STATUS, input.int, DIM_NUM_SS)
             var[:] = input.data.variables[VAR_SS_STATUS][selected_set_indices]
 
-        set_id_map = input.data.variables[VAR_SS_PROP % 1]
+        set_id_map = input.data.variables[fmt(VAR_SS_PROP, 1)]
         # SS ID map / prop1
-        var = output.createVariable(VAR_SS_PROP % 1, input.int, DIM_NUM_SS)
+        var = output.createVariable(fmt(VAR_SS_PROP, 1), input.int, DIM_NUM_SS)
         var.setncattr(ATTR_NAME, 'ID')
         if 'ID' in prop_selector.ss_prop:
             # Keep ID map
@@ -338,8 +337,8 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
                 continue
             n = 1
             while True:
-                if VAR_SS_PROP % n in input.data.variables:
-                    name = input.data.variables[VAR_SS_PROP % n].getncattr(ATTR_NAME)
+                if fmt(VAR_SS_PROP, n) in input.data.variables:
+                    name = input.data.variables[fmt(VAR_SS_PROP, n)].getncattr(ATTR_NAME)
                     if propname == name:
                         # we've found our property
                         propids[n] = propname
@@ -357,8 +356,8 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
         for i in range(2, input.num_side_set_prop + 1):
             if i in propids.keys():
                 propid += 1  # id of current property in output
-                var = output.createVariable(VAR_SS_PROP % propid, input.int, DIM_NUM_SS)
-                var[:] = input.data.variables[VAR_SS_PROP % i][selected_set_indices]
+                var = output.createVariable(fmt(VAR_SS_PROP, propid), input.int, DIM_NUM_SS)
+                var[:] = input.data.variables[fmt(VAR_SS_PROP, i)][selected_set_indices]
                 var.setncattr(ATTR_NAME, propids[i])
 
         # Figure out which variables we're keeping
@@ -388,12 +387,12 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
                 sel = idmap[input_id]  # selector of current block in output
 
                 # Dimensions
-                dim_num_side_ss = DIM_NUM_SIDE_SS % output_id
+                dim_num_side_ss = fmt(DIM_NUM_SIDE_SS, output_id)
                 output.createDimension(dim_num_side_ss, len(sel.sides))
 
                 # Element list
-                var = output.createVariable(VAR_ELEM_SS % output_id, input.int, dim_num_side_ss)
-                to_add = input.data.variables[VAR_ELEM_SS % input_id][sel.sides]
+                var = output.createVariable(fmt(VAR_ELEM_SS, output_id), input.int, dim_num_side_ss)
+                to_add = input.data.variables[fmt(VAR_ELEM_SS, input_id)][sel.sides]
                 converted_to_add = []
                 for id in to_add:
                     try:
@@ -416,21 +415,21 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
                             .format(difference))
 
                 # Side list
-                var = output.createVariable(VAR_SIDE_SS % output_id, input.int, dim_num_side_ss)
-                var[:] = input.data.variables[VAR_SIDE_SS % input_id][sel.sides]
+                var = output.createVariable(fmt(VAR_SIDE_SS, output_id), input.int, dim_num_side_ss)
+                var[:] = input.data.variables[fmt(VAR_SIDE_SS, input_id)][sel.sides]
 
                 # Distribution factors
-                if VAR_DF_SS % input_id in input.data.variables:
-                    dim_num_df_ss = DIM_NUM_DF_SS % output_id
+                if fmt(VAR_DF_SS, input_id) in input.data.variables:
+                    dim_num_df_ss = fmt(DIM_NUM_DF_SS, output_id)
                     node_count_list = input.get_side_set_node_count_list(input_id)
                     # Count how many nodes are on the selected sides only
                     num_nodes_selected = sum(node_count_list[sel.sides])
                     output.createDimension(dim_num_df_ss, num_nodes_selected)
 
-                    var = output.createVariable(VAR_DF_SS % output_id, input.float, dim_num_df_ss)
+                    var = output.createVariable(fmt(VAR_DF_SS, output_id), input.float, dim_num_df_ss)
                     # Now for the fun part...
                     # Grab the old dist facts
-                    old_df = input.data.variables[VAR_DF_SS % input_id]
+                    old_df = input.data.variables[fmt(VAR_DF_SS, input_id)]
                     # Create an array for the new ones
                     output_df = numpy.empty(num_nodes_selected, input.float)
                     # We're going to iterate over each side in the side set and get the number of nodes that side has.
@@ -459,9 +458,9 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
                         row[out_var_idx] = 1  # Set true in truth table row
                         # We only want to copy over variable values if we're keeping time steps
                         if has_time_steps:
-                            var = output.createVariable(VAR_VALS_SS_VAR % (out_var_idx + 1, output_id), input.float,
+                            var = output.createVariable(fmt(VAR_VALS_SS_VAR, out_var_idx + 1, output_id), input.float,
                                                         (DIM_NUM_TIME_STEP, dim_num_side_ss))
-                            var[:] = input.data.variables[VAR_VALS_SS_VAR % (j + 1, input_id)][
+                            var[:] = input.data.variables[fmt(VAR_VALS_SS_VAR, j + 1, input_id)][
                                 time_step_indices, sel.sides]
                     var_truth_tab[output_id - 1] = row  # put row in table
     # END SIDE SET PROCESSING
@@ -496,9 +495,9 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
             var = output.createVariable(VAR_NS_STATUS, input.int, DIM_NUM_NS)
             var[:] = input.data.variables[VAR_NS_STATUS][selected_set_indices]
 
-        set_id_map = input.data.variables[VAR_NS_PROP % 1]
+        set_id_map = input.data.variables[fmt(VAR_NS_PROP, 1)]
         # NS ID map / prop1
-        var = output.createVariable(VAR_NS_PROP % 1, input.int, DIM_NUM_NS)
+        var = output.createVariable(fmt(VAR_NS_PROP, 1), input.int, DIM_NUM_NS)
         var.setncattr(ATTR_NAME, 'ID')
         if 'ID' in prop_selector.ns_prop:
             # Keep ID map
@@ -515,8 +514,8 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
                 continue
             n = 1
             while True:
-                if VAR_NS_PROP % n in input.data.variables:
-                    name = input.data.variables[VAR_NS_PROP % n].getncattr(ATTR_NAME)
+                if fmt(VAR_NS_PROP, n) in input.data.variables:
+                    name = input.data.variables[fmt(VAR_NS_PROP, n)].getncattr(ATTR_NAME)
                     if propname == name:
                         # we've found our property
                         propids[n] = propname
@@ -534,8 +533,8 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
         for i in range(2, input.num_node_set_prop + 1):
             if i in propids.keys():
                 propid += 1  # id of current property in output
-                var = output.createVariable(VAR_NS_PROP % propid, input.int, DIM_NUM_NS)
-                var[:] = input.data.variables[VAR_NS_PROP % i][selected_set_indices]
+                var = output.createVariable(fmt(VAR_NS_PROP, propid), input.int, DIM_NUM_NS)
+                var[:] = input.data.variables[fmt(VAR_NS_PROP, i)][selected_set_indices]
                 var.setncattr(ATTR_NAME, propids[i])
 
         # Figure out which variables we're keeping
@@ -567,18 +566,18 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
                 ns = idmap[input_id]  # selector of current set in output
 
                 # Dimensions
-                dim_num_node_ns = DIM_NUM_NODE_NS % output_id
+                dim_num_node_ns = fmt(DIM_NUM_NODE_NS, output_id)
                 output.createDimension(dim_num_node_ns, len(ns.nodes))
 
                 # Node list
-                var = output.createVariable(VAR_NODE_NS % output_id, input.int, dim_num_node_ns)
-                var[:] = input.data.variables[VAR_NODE_NS % input_id][ns.nodes]
-                added_nodes.update(input.data.variables[VAR_NODE_NS % input_id][ns.nodes])
+                var = output.createVariable(fmt(VAR_NODE_NS, output_id), input.int, dim_num_node_ns)
+                var[:] = input.data.variables[fmt(VAR_NODE_NS, input_id)][ns.nodes]
+                added_nodes.update(input.data.variables[fmt(VAR_NODE_NS, input_id)][ns.nodes])
 
                 # Distribution factors
-                if VAR_DF_NS % input_id in input.data.variables:
-                    var = output.createVariable(VAR_DF_NS % output_id, input.float, dim_num_node_ns)
-                    var[:] = input.data.variables[VAR_DF_NS % input_id][ns.nodes]
+                if fmt(VAR_DF_NS, input_id) in input.data.variables:
+                    var = output.createVariable(fmt(VAR_DF_NS, output_id), input.float, dim_num_node_ns)
+                    var[:] = input.data.variables[fmt(VAR_DF_NS, input_id)][ns.nodes]
 
                 # Variable data and truth table filling
                 if has_variables:
@@ -588,10 +587,10 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
                         row[out_var_idx] = 1  # Set true in truth table row
                         # We only want to copy over variable values if we're keeping time steps
                         if has_time_steps:
-                            var = output.createVariable(VAR_VALS_NS_VAR % (out_var_idx + 1, output_id), input.float,
+                            var = output.createVariable(fmt(VAR_VALS_NS_VAR, out_var_idx + 1, output_id), input.float,
                                                         (DIM_NUM_TIME_STEP, dim_num_node_ns))
-                            var[:] = input.data.variables[VAR_VALS_NS_VAR % (j + 1, input_id)][time_step_indices,
-                                                                                               ns.nodes]
+                            var[:] = input.data.variables[fmt(VAR_VALS_NS_VAR, j + 1, input_id)][
+                                time_step_indices, ns.nodes]
                     var_truth_tab[output_id - 1] = row  # put row in table
     # END OF NODE SET PROCESSING
 
@@ -617,9 +616,9 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
     # Node set node lists
     if DIM_NUM_NS in output.dimensions:  # only if we have node sets
         for i in range(1, output.dimensions[DIM_NUM_NS].size + 1):
-            var = output.variables[VAR_NODE_NS % i]
+            var = output.variables[fmt(VAR_NODE_NS, i)]
             vararr = var[:]
-            num_nodes = output.dimensions[DIM_NUM_NODE_NS % i].size
+            num_nodes = output.dimensions[fmt(DIM_NUM_NODE_NS, i)].size
             new_var = numpy.empty(num_nodes, input.int)
             for j in range(num_nodes):
                 new_var[j] = old_new_node_id_map[vararr[j]]
@@ -628,10 +627,10 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
     # Element block connectivity lists
     if DIM_NUM_EB in output.dimensions:  # only if we have element blocks
         for i in range(1, output.dimensions[DIM_NUM_EB].size + 1):
-            var = output.variables[VAR_CONNECT % i]
+            var = output.variables[fmt(VAR_CONNECT, i)]
             vararr = var[:]
-            num_elem = output.dimensions[DIM_NUM_EL_IN_BLK % i].size
-            num_node = output.dimensions[DIM_NUM_NOD_PER_EL % i].size
+            num_elem = output.dimensions[fmt(DIM_NUM_EL_IN_BLK, i)].size
+            num_node = output.dimensions[fmt(DIM_NUM_NOD_PER_EL, i)].size
             new_var = numpy.empty((num_elem, num_node), input.int)
             for j in range(num_elem):
                 for k in range(num_node):
@@ -684,7 +683,7 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
     # Nodal Variables
     if len(nod_vars) > 0:
         if input.large_model:
-            if VAR_VALS_NOD_VAR_LARGE % 1 not in input.data.variables:
+            if fmt(VAR_VALS_NOD_VAR_LARGE, 1) not in input.data.variables:
                 raise ValueError("Nodal variables selected, but no nodal variables exist!")
         else:
             if VAR_VALS_NOD_VAR_SMALL not in input.data.variables:
@@ -694,9 +693,9 @@ def output_subset(input: Exodus, path: str, title: str, eb_selectors: List[Eleme
         if input.large_model:
             output_id = 1
             for id in nod_vars:
-                var = output.createVariable(VAR_VALS_NOD_VAR_LARGE % output_id, input.float, (DIM_NUM_TIME_STEP,
+                var = output.createVariable(fmt(VAR_VALS_NOD_VAR_LARGE, output_id), input.float, (DIM_NUM_TIME_STEP,
                                                                                               DIM_NUM_NODES))
-                var[:] = input.data.variables[VAR_VALS_NOD_VAR_LARGE % id][time_step_indices, added_nodes_indices]
+                var[:] = input.data.variables[fmt(VAR_VALS_NOD_VAR_LARGE, id)][time_step_indices, added_nodes_indices]
                 output_id += 1
         else:
             var = output.createVariable(VAR_VALS_NOD_VAR_SMALL, input.float, (DIM_NUM_TIME_STEP, DIM_NUM_NOD_VAR,
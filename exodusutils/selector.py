@@ -9,7 +9,9 @@ from __future__ import annotations  # use the magic of python 3.7 to let use wri
 from typing import TYPE_CHECKING
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 import warnings
+import numpy
 from .constants import *
 
 # Give us some handy type checking without creating cyclic imports at runtime
@@ -22,6 +24,9 @@ if TYPE_CHECKING:  # evaluates to false at runtime
 class _ObjectSelector(ABC):
     """Abstract base class of all selectors."""
 
+    # Selectors are made one per object, so use slots rather than a __dict__ per instance
+    __slots__ = ("exodus", "obj_id", "obj_type")
+
     def __init__(self, exodus: Exodus, obj_id: int, obj_type: ObjectType):
         self.exodus = exodus
         self.obj_id = obj_id
@@ -30,16 +35,76 @@ class _ObjectSelector(ABC):
         # probably needs an abstract update method for when exodus changes
 
 
+def _dedup_sort_validate(values, lo, hi, name, range_error):
+    """
+    Sorts and removes duplicates from a list of 1-based indices, then converts them to 0-based. FOR INTERNAL USE ONLY!
+
+    :param values: the 1-based indices the user passed in (a sequence, array, set or any other iterable)
+    :param lo: smallest valid index
+    :param hi: largest valid index
+    :param name: what the indices refer to, used in the duplicate warning
+    :param range_error: message of the IndexError raised when an index is out of range
+    :return: sorted 0-based indices as an int64 numpy array, empty if no indices were given
+    """
+    # numpy can only convert sequences and arrays directly, anything else (sets, generators) is iterated over
+    given = numpy.asarray(values, dtype=numpy.int64) if isinstance(values, (Sequence, numpy.ndarray)) \
+        else numpy.fromiter(values, dtype=numpy.int64)
+    if given.size == 0:
+        # same as selecting nothing with None
+        return given.reshape(0)
+    # already sorted without duplicates (e.g. a previous selection), so skip the sort in numpy.unique
+    unique = given if numpy.all(given[1:] > given[:-1]) else numpy.unique(given)
+    # unique is sorted, so only the ends need checking
+    if unique[0] < lo or unique[-1] > hi:
+        raise IndexError(range_error)
+    if unique.size != given.size:
+        warnings.warn("Duplicate %s were automatically removed." % name)
+    return unique - 1
+
+
+def _select_variables(variables, obj_id, num_var, get_number, get_truth_table, label):
+    """
+    Returns the 0-based variable indices a selector keeps, checked against the object's truth table.
+    FOR INTERNAL USE ONLY!
+
+    :param variables: ``...``, ``None``, or the 1-based variable indices the user passed in
+    :param obj_id: the id of the object being selected from
+    :param num_var: number of variables of this object type
+    :param get_number: function returning the internal number of an object from its id
+    :param get_truth_table: function returning the truth table for this object type
+    :param label: name of the object type, used in errors
+    :return: selected 0-based variable indices as an int64 numpy array
+    """
+    if variables is None:
+        return numpy.empty(0, dtype=numpy.int64)
+    if variables is ...:
+        # The indices of every variable set in the truth table
+        tab = get_truth_table()[get_number(obj_id) - 1]
+        return numpy.flatnonzero(numpy.asarray(tab[:num_var], dtype=bool)).astype(numpy.int64)
+    selected = _dedup_sort_validate(variables, 1, num_var, "variables", "variable index out of range!")
+    # Get the truth table, unless there is nothing to check against it
+    if len(selected) > 0:
+        tab = numpy.asarray(get_truth_table()[get_number(obj_id) - 1], dtype=bool)
+        # If any selected variable is not in the truth table, throw an error
+        unset = ~tab[selected]
+        if unset.any():
+            raise ValueError("variable %d is not set for %s %d!" % (selected[unset][0], label, obj_id))
+    return selected
+
+
 # TODO name support for variables?
 class ElementBlockSelector(_ObjectSelector):
     """Selects a subset of an element block's components."""
 
+    __slots__ = ("elements", "variables", "attributes")
+
     def __init__(self, exodus: Exodus, obj_id: int, elements=..., variables=..., attributes=...):
         """
         Create a new selector object for an element block.
 
         Pass in ``...`` to select everything, ``None`` to select nothing, or a list of specific values.
-        Lists will be sorted upon entry to maintain element order consistency.
+        Lists will be sorted upon entry to maintain element order consistency. The selected indices are stored 0-based
+        as int64 numpy arrays, which are empty when nothing is selected.
 
         ``elements``, ``variables``, and ``attributes`` take 1-based indices, meaning to select the first and second
         element you would pass in the list [1, 2].
@@ -55,85 +120,50 @@ class ElementBlockSelector(_ObjectSelector):
         _ObjectSelector.__init__(self, exodus, obj_id, ELEMBLOCK)
 
         if elements is None:
-            self.elements = []
+            self.elements = numpy.empty(0, dtype=numpy.int64)
         elif elements is ...:
             num_elem, _, _, _ = exodus.get_elem_block_params(obj_id)
-            self.elements = list(range(num_elem))
+            self.elements = numpy.arange(num_elem, dtype=numpy.int64)
         else:
-            # Order of elements does not matter, so we can convert the lists to sets back to lists to remove duplicates
-            self.elements = list(set(elements))
-            self.elements.sort()
+            # Order of elements does not matter, so duplicates are removed and the rest sorted
             num_elem, _, _, _ = exodus.get_elem_block_params(obj_id)
-            if len(self.elements) > 0 and (self.elements[0] < 1 or self.elements[-1] > num_elem):
-                raise IndexError("elements out of range!")
-            self.elements = [x - 1 for x in self.elements]
-            if len(self.elements) != len(elements):
-                warnings.warn("Duplicate elements were automatically removed.")
-
-        if variables is None:
-            self.variables = []
-        elif variables is ...:
-            # Get the truth table
-            internal_id = exodus.get_elem_block_number(obj_id)
-            tab = exodus.get_elem_block_truth_table()[internal_id - 1]
-            self.variables = []
-            # Go over every variable. If it's in the truth table, add its index to the variables list
-            for i in range(exodus.num_elem_block_var):
-                if tab[i]:
-                    self.variables.append(i)
-        else:
-            self.variables = list(set(variables))
-            self.variables.sort()
-            if len(self.variables) > 0 and (self.variables[0] < 1 or self.variables[-1] > exodus.num_elem_block_var):
-                raise IndexError("variable index out of range!")
-            self.variables = [x - 1 for x in self.variables]
-            # Get the truth table
-            internal_id = exodus.get_elem_block_number(obj_id)
-            tab = exodus.get_elem_block_truth_table()[internal_id - 1]
-            # Go over selected variables. If it's not in the truth table, throw an error
-            for idx in self.variables:
-                if not tab[idx]:
-                    raise ValueError("variable %d is not set for element block %d!" % (idx, obj_id))
-            if len(self.variables) != len(variables):
-                warnings.warn("Duplicate variables were automatically removed.")
+            self.elements = _dedup_sort_validate(elements, 1, num_elem, "elements", "elements out of range!")
+
+        self.variables = _select_variables(variables, obj_id, exodus.num_elem_block_var, exodus.get_elem_block_number,
+                                           exodus.get_elem_block_truth_table, "element block")
 
         if attributes is None:
-            self.attributes = []
+            self.attributes = numpy.empty(0, dtype=numpy.int64)
         elif attributes is ...:
-            self.attributes = list(range(exodus.get_num_elem_attrib(obj_id)))
+            self.attributes = numpy.arange(exodus.get_num_elem_attrib(obj_id), dtype=numpy.int64)
         else:
             if len(attributes) == 0:
-                self.attributes = []
+                self.attributes = numpy.empty(0, dtype=numpy.int64)
             elif all(isinstance(n, int) for n in attributes):
-                self.attributes = list(set(attributes))
-                self.attributes.sort()
-                if self.attributes[0] < 1 or self.attributes[-1] > exodus.get_num_elem_attrib(obj_id):
-                    raise IndexError("attribute index out of range!")
-                if len(self.attributes) != len(attributes):
-                    warnings.warn("Duplicate attributes were automatically removed.")
-                self.attributes = [x - 1 for x in self.attributes]
+                self.attributes = _dedup_sort_validate(attributes, 1, exodus.get_num_elem_attrib(obj_id), "attributes",
+                                                       "attribute index out of range!")
             elif all(isinstance(n, str) for n in attributes):
                 name_list = list(exodus.get_elem_attrib_names(obj_id))
-                unique_attributes = list(set(attributes))
+                unique_attributes = set(attributes)
                 self.attributes = []
                 # Make sure that the names the user provided are valid
-                for name in unique_attributes:
-                    if name not in name_list:
-                        raise ValueError("Provided attribute %s does not exist!" % name)
+                missing = unique_attributes.difference(name_list)
+                if missing:
+                    raise ValueError("Provided attribute %s does not exist!" % next(iter(missing)))
                 # Add the index of all attributes with the given names to the list
                 # Exodus doesn't seem to enforce needing unique attribute names, so this gets around that weird rule
                 # and will warn the user if the file has multiple attributes with the same name.
-                selected_names = []
+                selected_names = set()
                 dupes = False
-                for i in range(len(name_list)):
-                    if name_list[i] in unique_attributes:
+                for i, name in enumerate(name_list):
+                    if name in unique_attributes:
                         self.attributes.append(i)
-                        if name_list[i] not in selected_names:
-                            selected_names.append(name_list[i])
+                        if name not in selected_names:
+                            selected_names.add(name)
                         else:
                             dupes = True
                 # Doing things this way already sorts the attributes
-                # self.attributes.sort()
+                self.attributes = numpy.array(self.attributes, dtype=numpy.int64)
                 if len(unique_attributes) != len(attributes):
                     warnings.warn("Duplicate attributes were automatically removed.")
                 if dupes:
@@ -145,12 +175,15 @@ class ElementBlockSelector(_ObjectSelector):
 class NodeSetSelector(_ObjectSelector):
     """Selects a subset of a node set's components."""
 
+    __slots__ = ("nodes", "variables")
+
     def __init__(self, exodus: Exodus, obj_id: int, nodes=..., variables=...):
         """
         Create a new selector object for a node set.
 
         Pass in ``...`` to select everything, ``None`` to select nothing, or a list of specific values.
-        Lists will be sorted upon entry to maintain node order consistency.
+        Lists will be sorted upon entry to maintain node order consistency. The selected indices are stored 0-based as
+        int64 numpy arrays, which are empty when nothing is selected.
 
         ``nodes`` and ``variables`` take 1-based indices, meaning to select the first and second node you would pass in
         the list [1, 2].
@@ -163,57 +196,30 @@ class NodeSetSelector(_ObjectSelector):
         _ObjectSelector.__init__(self, exodus, obj_id, NODESET)
 
         if nodes is None:
-            self.nodes = []
+            self.nodes = numpy.empty(0, dtype=numpy.int64)
         elif nodes is ...:
             num_nod, _ = exodus.get_node_set_params(obj_id)
-            self.nodes = list(range(num_nod))
+            self.nodes = numpy.arange(num_nod, dtype=numpy.int64)
         else:
-            self.nodes = list(set(nodes))
-            self.nodes.sort()
             num_nod, _ = exodus.get_node_set_params(obj_id)
-            if len(self.nodes) > 0 and (self.nodes[0] < 1 or self.nodes[-1] > num_nod):
-                raise IndexError("nodes out of range!")
-            self.nodes = [x - 1 for x in self.nodes]
-            if len(self.nodes) != len(nodes):
-                warnings.warn("Duplicate nodes were automatically removed.")
-
-        if variables is None:
-            self.variables = []
-        elif variables is ...:
-            # Get the truth table
-            internal_id = exodus.get_node_set_number(obj_id)
-            tab = exodus.get_node_set_truth_table()[internal_id - 1]
-            self.variables = []
-            # Go over every variable. If it's in the truth table, add its index to the variables list
-            for i in range(exodus.num_node_set_var):
-                if tab[i]:
-                    self.variables.append(i)
-        else:
-            self.variables = list(set(variables))
-            self.variables.sort()
-            if len(self.variables) > 0 and (self.variables[0] < 1 or self.variables[-1] > exodus.num_node_set_var):
-                raise IndexError("variable index out of range!")
-            self.variables = [x - 1 for x in self.variables]
-            # Get the truth table
-            internal_id = exodus.get_node_set_number(obj_id)
-            tab = exodus.get_node_set_truth_table()[internal_id - 1]
-            # Go over selected variables. If it's not in the truth table, throw an error
-            for idx in self.variables:
-                if not tab[idx]:
-                    raise ValueError("variable %d is not set for node set %d!" % (idx, obj_id))
-            if len(self.variables) != len(variables):
-                warnings.warn("Duplicate variables were automatically removed.")
+            self.nodes = _dedup_sort_validate(nodes, 1, num_nod, "nodes", "nodes out of range!")
+
+        self.variables = _select_variables(variables, obj_id, exodus.num_node_set_var, exodus.get_node_set_number,
+                                           exodus.get_node_set_truth_table, "node set")
 
 
 class SideSetSelector(_ObjectSelector):
     """Selects a subset of a side set's components."""
 
+    __slots__ = ("sides", "variables")
+
     def __init__(self, exodus: Exodus, obj_id: int, sides=..., variables=...):
         """
         Create a new selector object for a side set.
 
         Pass in ``...`` to select everything, ``None`` to select nothing, or a list of specific values.
-        Lists will be sorted upon entry to maintain node order consistency.
+        Lists will be sorted upon entry to maintain node order consistency. The selected indices are stored 0-based as
+        int64 numpy arrays, which are empty when nothing is selected.
 
         ``sides`` and ``variables`` take 1-based indices, meaning to select the first and second side you would pass in
          the list [1, 2].
@@ -226,51 +232,23 @@ class SideSetSelector(_ObjectSelector):
         _ObjectSelector.__init__(self, exodus, obj_id, SIDESET)
 
         if sides is None:
-            self.sides = []
+            self.sides = numpy.empty(0, dtype=numpy.int64)
         elif sides is ...:
             num_el, _ = exodus.get_side_set_params(obj_id)
-            self.sides = list(range(num_el))
+            self.sides = numpy.arange(num_el, dtype=numpy.int64)
         else:
-            self.sides = list(set(sides))
-            self.sides.sort()
             num_el, _ = exodus.get_side_set_params(obj_id)
-            if len(sides) > 0 and (self.sides[0] < 1 or self.sides[-1] > num_el):
-                raise IndexError("sides out of range!")
-            self.sides = [x - 1 for x in self.sides]
-            if len(self.sides) != len(sides):
-                warnings.warn("Duplicate sides were automatically removed.")
-
-        if variables is None:
-            self.variables = []
-        elif variables is ...:
-            # Get the truth table
-            internal_id = exodus.get_side_set_number(obj_id)
-            tab = exodus.get_side_set_truth_table()[internal_id - 1]
-            self.variables = []
-            # Go over every variable. If it's in the truth table, add its index to the variables list
-            for i in range(exodus.num_side_set_var):
-                if tab[i]:
-                    self.variables.append(i)
-        else:
-            self.variables = list(set(variables))
-            self.variables.sort()
-            if len(self.variables) > 0 and (self.variables[0] < 1 or self.variables[-1] > exodus.num_side_set_var):
-                raise IndexError("variable index out of range!")
-            self.variables = [x - 1 for x in self.variables]
-            # Get the truth table
-            internal_id = exodus.get_side_set_number(obj_id)
-            tab = exodus.get_side_set_truth_table()[internal_id - 1]
-            # Go over selected variables. If it's not in the truth table, throw an error
-            for idx in self.variables:
-                if not tab[idx]:
-                    raise ValueError("variable %d is not set for side set %d!" % (idx, obj_id))
-            if len(self.variables) != len(variables):
-                warnings.warn("Duplicate variables were automatically removed.")
+            self.sides = _dedup_sort_validate(sides, 1, num_el, "sides", "sides out of range!")
+
+        self.variables = _select_variables(variables, obj_id, exodus.num_side_set_var, exodus.get_side_set_number,
+                                           exodus.get_side_set_truth_table, "side set")
 
 
 class PropertySelector:
     """Select a subset of object properties."""
 
+    __slots__ = ("exodus", "eb_prop", "ns_prop", "ss_prop")
+
     def __init__(self, exodus: Exodus, eb_prop=..., ns_prop=..., ss_prop=...):
         """
         Create a new object property selector.
@@ -287,11 +265,11 @@ class PropertySelector:
         elif eb_prop is ...:
             self.eb_prop = exodus.get_elem_block_property_names()
         else:
-            self.eb_prop = list(set(eb_prop))
-            props = exodus.get_elem_block_property_names()
-            for propname in self.eb_prop:
-                if propname not in props:
-                    raise ValueError("Provided element block property %s does not exist!" % propname)
+            unique_props = set(eb_prop)
+            missing = unique_props.difference(exodus.get_elem_block_property_names())
+            if missing:
+                raise ValueError("Provided element block property %s does not exist!" % next(iter(missing)))
+            self.eb_prop = list(unique_props)
             if len(self.eb_prop) != len(eb_prop):
                 warnings.warn("Duplicate properties found in eb_prop were automatically removed.")
 
@@ -300,11 +278,11 @@ class PropertySelector:
         elif ns_prop is ...:
             self.ns_prop = exodus.get_node_set_property_names()
         else:
-            self.ns_prop = list(set(ns_prop))
-            props = exodus.get_node_set_property_names()
-            for propname in self.ns_prop:
-                if propname not in props:
-                    raise ValueError("Provided node set property %s does not exist!" % propname)
+            unique_props = set(ns_prop)
+            missing = unique_props.difference(exodus.get_node_set_property_names())
+            if missing:
+                raise ValueError("Provided node set property %s does not exist!" % next(iter(missing)))
+            self.ns_prop = list(unique_props)
             if len(self.ns_prop) != len(ns_prop):
                 warnings.warn("Duplicate properties found in ns_prop were automatically removed.")
 
@@ -313,10 +291,10 @@ class PropertySelector:
         elif ss_prop is ...:
             self.ss_prop = exodus.get_side_set_property_names()
         else:
-            self.ss_prop = list(set(ss_prop))
-            props = exodus.get_side_set_property_names()
-            for propname in self.ss_prop:
-                if propname not in props:
-                    raise ValueError("Provided node set property %s does not exist!" % propname)
+            unique_props = set(ss_prop)
+            missing = unique_props.difference(exodus.get_side_set_property_names())
+            if missing:
+                raise ValueError("Provided node set property %s does not exist!" % next(iter(missing)))
+            self.ss_prop = list(unique_props)
             if len(self.ss_prop) != len(ss_prop):
                 warnings.warn("Duplicate properties found in ss_prop were automatically removed.")
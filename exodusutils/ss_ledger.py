@@ -117,11 +117,7 @@ class SSLedger:
         # Need to check variable array size
 
         # need to convert elem_ids to internal ids
-        map = self.ex.get_elem_id_map()
-        converted_elem_ids = []
-        for id in elem_ids:
-            internal_id = np.where(map == id)[0][0] + 1 # conversion, add 1 to the index to get internal id
-            converted_elem_ids.append(internal_id)
+        converted_elem_ids = self._convert_elem_ids(elem_ids)
 
         # if no variables specified and it requires variables, just use 0
         # this is a 3-d array of num_var by time_step by num_sides
@@ -144,7 +140,7 @@ class SSLedger:
         # append row of num_ss_var 1s to bottom of ss_var_tab array
         if (self.num_ss_var > 0):
             # If there are no sideset variables, no need to update the truth table
-            self.ss_var_tab = np.vstack([self.ss_var_tab, np.ones(self.num_ss_var)])
+            self.ss_var_tab = np.vstack([self.ss_var_tab, np.ones(self.num_ss_var, self.ex.int)])
 
         if (dist_fact is None):
             self.num_dist_fact.append(0)
@@ -165,6 +161,17 @@ class SSLedger:
         
         self.num_ss += 1 
     """
+    Converts user-defined element ids to internal (1-based) element ids using a single reverse lookup table
+    instead of searching the element id map once per element.
+    """
+    def _convert_elem_ids(self, elem_ids):
+        id_dict = self.ex.get_reverse_elem_id_dict()
+        try:
+            return np.fromiter((id_dict[id] for id in elem_ids), self.ex.int, len(elem_ids))
+        except KeyError as e:
+            raise IndexError("Could not find element with id {}!".format(e.args[0])) from None
+
+    """
     Removes an existing sideset. Must specify id of sideset for removal.
     """
     #TODO Replaced start of this with find_sideset_num, we should check that this still works
@@ -218,11 +225,7 @@ class SSLedger:
                 self.ss_vars[ndx].append(self.ex.data["vals_sset_var" + str(i + 1) + "ss" + str(ndx + 1)])
 
         # need to convert elem_ids to internal ids
-        map = self.ex.get_elem_id_map()
-        converted_elem_ids = []
-        for id in elem_ids:
-            internal_id = np.where(map == id)[0][0] + 1
-            converted_elem_ids.append(internal_id)
+        converted_elem_ids = self._convert_elem_ids(elem_ids)
         
         num_df_per_side = self.num_dist_fact[ndx] / self.ss_sizes[ndx]
         if (dist_facts is None and self.num_dist_fact[ndx] > 0): # if no df specified and we have df in this sideset
@@ -273,11 +276,7 @@ class SSLedger:
 
         # convert elem_ids
         # need to convert elem_ids to internal ids
-        map = self.ex.get_elem_id_map()
-        converted_elem_ids = []
-        for id in elem_ids:
-            internal_id = np.where(map == id)[0][0] + 1
-            converted_elem_ids.append(internal_id)
+        converted_elem_ids = self._convert_elem_ids(elem_ids)
 
         # create set of tuples of side and elem ids for quick lookup
         tuple_set = set()
@@ -885,7 +884,8 @@ class SSLedger:
                 data.createVariable("vals_sset_var" + str(j + 1) + "ss" + str(i + 1), "float64", dimensions=("time_step", "num_side_ss" + str(i + 1)))
                 # need to copy over from old file if has not been loaded in yet
                 if (self.ss_vars[i] is None):
-                    data["vals_sset_var" + str(j + 1) + "ss" + str(i + 1)][:] = self.ex.data["vals_sset_var" + str(j + 1) + "ss" + str(i + 1)][:]
+                    var_name = "vals_sset_var" + str(j + 1) + "ss" + str(i + 1)
+                    self.ex.ledger._copy_variable_data(self.ex.data[var_name], data[var_name])
                 else:
                     data["vals_sset_var" + str(j + 1) + "ss" + str(i + 1)][:] = self.ss_vars[i][j]
 
@@ -910,7 +910,7 @@ class SSLedger:
 
             
 
-    # (Based on find_nodeset_num in ns_ledger)
+    # (Based on find_nodeset in ns_ledger)
     """
     Find the index in the sideset ledgers arrays for a given sideset id. 
     """
@@ -1,9 +1,12 @@
 """Contains common functions used in the Python Exodus Library."""
 
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 import numpy as np
-from netCDF4 import stringtoarr
-from .constants import LIB_NAME
+import netCDF4
+from netCDF4 import get_chunk_cache, set_chunk_cache
+from .constants import LIB_NAME, IO_HINTS, IO_FILTERS
 from ._version import __version__
 
 
@@ -12,22 +15,31 @@ def c_print(line):
     print(lineparse(line))
 
 
+def _cstring(raw):
+    """Decodes bytes holding a C string, which ends at the first null. FOR INTERNAL USE ONLY!"""
+    return raw.split(b'\x00', 1)[0].decode('ascii', errors='replace')
+
+
 def lineparse(line):
     """Returns the Python string form of a C character array."""
-    s = ""
-    for c in line:
-        if str(c) != '--':
-            s += str(c)[2]
-
-    return s
+    chars = np.ma.filled(line, b'')
+    if chars.dtype.kind != 'S':
+        # not raw characters (e.g. already converted to str), so go character by character
+        return "".join(str(c) for c in chars if str(c) != '--')
+    # masked characters were filled with nulls above, so the string also ends at the first masked character
+    return _cstring(chars.tobytes())
 
 
 def arrparse(array, size, type):
     """Returns a Python string array from an array of C 'strings'."""
-    result = np.empty([size], type)
-    for i in range(size):
-        result[i] = lineparse(array[i])
-    return result
+    raw = np.ma.filled(array[:size], b'')
+    if raw.ndim != 2 or raw.shape[1] == 0:
+        return np.empty([size], type)
+    # each string ends at its first null (masked characters were filled with nulls above), so blank out the rest
+    raw = np.where(np.cumsum(raw == b'', axis=1) > 0, b'', raw)
+    # View each row of characters as one fixed-width byte string so the decode happens in a single pass
+    flat = np.ascontiguousarray(raw).view('S%d' % raw.shape[1]).reshape(-1)
+    return np.char.decode(flat, 'ascii', errors='replace').astype(type)
 
 
 def convert_string(s, length):
@@ -39,21 +51,92 @@ def convert_string(s, length):
     :return: character array
     """
     length += 1  # we've got to add the null character
-    arr = np.empty(length, '|S1')
-    for i in range(len(s)):
-        arr[i] = s[i]
-
-    mask = np.empty(length, bool)
-    for i in range(length):
-        if i < len(s):
-            mask[i] = False
-        else:
-            mask[i] = True
+    if len(s) > length:
+        raise IndexError("string '{}' is longer than {} characters".format(s, length))
+    # pad with nulls so nothing after the string is left uninitialized
+    arr = np.frombuffer(s.encode('ascii').ljust(length, b'\x00'), '|S1').copy()
+    mask = np.arange(length) >= len(s)
 
     out = np.ma.core.MaskedArray(arr, mask)
     return out
 
 
+@lru_cache(maxsize=None)
+def _io_hint_entry(name):
+    """Returns the IO_HINTS entry whose prefix matches a variable name, or None. FOR INTERNAL USE ONLY!"""
+    for prefix, hints in IO_HINTS.items():
+        if name.startswith(prefix):
+            return hints
+    return None
+
+
+def check_filter(filter):
+    """
+    Raises ValueError if a filter name is not in IO_FILTERS or this netCDF4 installation cannot use it.
+
+    :param filter: name of a filter in IO_FILTERS, or None
+    """
+    if filter is not None and filter not in IO_FILTERS:
+        raise ValueError("Unknown filter {}! Must be one of {}".format(filter, list(IO_FILTERS)))
+    # blosc support was added in netCDF4 1.6, and has to be compiled in
+    if filter not in (None, 'zlib') and not getattr(netCDF4, '__has_blosc_support__', False):
+        raise ValueError("The {} filter is not available in this netCDF4 installation!".format(filter))
+
+
+def io_hints(data, name, dimensions, filter=None):
+    """
+    Returns the chunking and compression keyword arguments to pass to createVariable for a NetCDF4 variable.
+
+    :param data: dataset the variable will be created in
+    :param name: name of the variable
+    :param dimensions: names of the variable's dimensions
+    :param filter: name of a filter in IO_FILTERS to compress with, or None to leave the variable uncompressed
+    :return: dictionary of keyword arguments, empty if there are no hints for this variable
+    """
+    check_filter(filter)
+    # chunking and compression are only supported by the HDF5-based formats
+    if not data.data_model.startswith('NETCDF4'):
+        return {}
+    hints = _io_hint_entry(name)
+    if hints is None:
+        return {}
+    # compression settings are only passed on when a filter is asked for, see below
+    kwargs = {key: value for key, value in hints.items()
+              if key not in ('chunksizes_fn', 'zlib', 'shuffle', 'complevel')}
+    if 'chunksizes_fn' in hints and not isinstance(dimensions, str):
+        shape = tuple(data.dimensions[dim].size for dim in dimensions)
+        # chunks can't be empty, so variables with no entries yet are left contiguous
+        if all(n > 0 for n in shape[1:]) and (shape[0] > 0 or data.dimensions[dimensions[0]].isunlimited()):
+            kwargs['chunksizes'] = hints['chunksizes_fn'](shape)
+    if filter == 'zlib' and hints.get('zlib'):
+        kwargs.update(zlib=True, shuffle=hints.get('shuffle', False), complevel=hints.get('complevel', 4))
+    elif filter is not None and hints.get('zlib'):
+        # blosc support was added in netCDF4 1.6 and also needs the HDF5 plugin to be installed
+        if not getattr(data, 'has_blosc_filter', lambda: False)():
+            raise ValueError("The {} filter is not available in this netCDF4 installation!".format(filter))
+        kwargs.update(IO_FILTERS[filter])
+    return kwargs
+
+
+@contextmanager
+def chunk_cache(size, nelems, preemption):
+    """
+    Context manager that changes the HDF5 chunk cache used for NetCDF4 files opened or created inside it.
+
+    The previous cache settings are restored on exit.
+
+    :param size: cache size in bytes
+    :param nelems: number of chunk slots in the cache
+    :param preemption: preemption value between 0 and 1, see the netCDF-C documentation
+    """
+    previous = get_chunk_cache()
+    set_chunk_cache(size, nelems, preemption)
+    try:
+        yield
+    finally:
+        set_chunk_cache(*previous)
+
+
 def generate_qa_rec(length):
     """
     Returns a QA record ready to add to a file.
@@ -61,10 +144,11 @@ def generate_qa_rec(length):
     :param length: length of a string (do not add 1)
     :return: qa record
     """
-    rec = np.empty((4, length + 1), '|S1')
-    rec[0] = stringtoarr(LIB_NAME, length+1)
-    rec[1] = stringtoarr(__version__, length+1)
     t = datetime.now()
-    rec[2] = stringtoarr(t.strftime("%m/%d/%y"), length+1)
-    rec[3] = stringtoarr(t.strftime("%X"), length+1)
-    return rec
+    fields = [LIB_NAME, __version__, t.strftime("%m/%d/%y"), t.strftime("%X")]
+    # numpy would silently cut off anything longer than the fixed width below
+    for field in fields:
+        if len(field) > length + 1:
+            raise ValueError("QA record field '{}' is longer than {} characters".format(field, length + 1))
+    # numpy pads each field with nulls to the fixed width, then the view splits the rows into characters
+    return np.array(fields, dtype='S%d' % (length + 1)).view('|S1').reshape(4, length + 1)
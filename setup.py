@@ -10,5 +10,8 @@ setup(
     name="PythonExodusUtilities",
     version=v['__version__'],
     packages=["exodusutils"],
-    install_requires=['netCDF4', 'numpy']
+    package_data={"exodusutils": ["README.md"]},
+    install_requires=['netCDF4', 'numpy'],
+    # also byte-compile with docstrings stripped, for interpreters run with -OO
+    options={"install": {"optimize": 2}}
 )
@@ -7,7 +7,9 @@ from exodusutils.exodus import Exodus
 from exodusutils import util
 from exodusutils.iterate import SampleFiles
 from exodusutils.constants import *
+import os
 import re
+import shutil
 
 
 # Disables all warnings in this module
@@ -268,6 +270,105 @@ def test_new_qa_record(tmpdir):
     assert lastTimeForm
 
 
+def test_generate_qa_rec():
+    rec = util.generate_qa_rec(32)
+    assert rec.shape == (4, 33)
+    assert util.lineparse(rec[0]) == LIB_NAME
+    # fields that do not fit are an error rather than being cut off
+    with pytest.raises(ValueError):
+        util.generate_qa_rec(len(LIB_NAME) - 2)
+
+
+def test_parse_c_strings():
+    line = np.ma.MaskedArray(np.array([b'a', b'b', b'c', b'd', b'e'], dtype='|S1'),
+                             mask=[False, False, True, False, False])
+    # the string ends at the first masked or null character
+    assert util.lineparse(line) == "ab"
+    assert util.lineparse(np.array([b'a', b'\x00', b'b'], dtype='|S1')) == "a"
+    # characters that are not ASCII are replaced instead of failing the decode
+    assert util.lineparse(np.array([b'a', b'\xe9', b'b'], dtype='|S1')) == "a\ufffdb"
+
+    names = np.ma.MaskedArray(np.array([[b'x', b'y', b'z'], [b'\xe9', b'q', b'\x00']], dtype='|S1'),
+                              mask=[[False, True, False], [False, False, False]])
+    assert list(util.arrparse(names, 2, '<U3')) == ["x", "\ufffdq"]
+
+
+def test_write_uncompressed_by_default(tmpdir):
+    exofile = Exodus('sample-files/can.ex2', 'a')
+    exofile.write(str(tmpdir) + '\\test.ex2')
+    exofile.close()
+
+    exofile = Exodus(str(tmpdir) + '\\test.ex2', 'r')
+    for name in ('coord', 'vals_nod_var', 'vals_elem_var1eb1'):
+        assert not exofile.data.variables[name].filters()['zlib']
+    exofile.close()
+
+
+def test_write_zlib_filter(tmpdir):
+    exofile = Exodus('sample-files/can.ex2', 'a')
+    exofile.write(str(tmpdir) + '\\test.ex2', filter='zlib')
+    exofile.close()
+
+    exofile = Exodus(str(tmpdir) + '\\test.ex2', 'r')
+    original = Exodus('sample-files/can.ex2', 'r')
+    for name in ('coord', 'vals_nod_var', 'vals_elem_var1eb1'):
+        assert exofile.data.variables[name].filters()['zlib']
+        assert np.array_equal(exofile.data.variables[name][:], original.data.variables[name][:])
+    # variables without zlib settings in IO_HINTS stay uncompressed
+    assert not exofile.data.variables['connect1'].filters()['zlib']
+    original.close()
+    exofile.close()
+
+
+def test_write_keeps_variable_settings(tmpdir):
+    exofile = Exodus('sample-files/can.ex2', 'a')
+    coord = exofile.data.variables['coord']
+    coord.set_auto_mask(False)
+    exofile.write(str(tmpdir) + '\\test.ex2')
+    # the copy turns conversions off while it runs, then puts back each variable's own settings
+    assert not coord.mask
+    assert coord.scale
+    assert exofile.data.variables['time_whole'].mask
+    exofile.close()
+
+
+def test_write_unknown_filter(tmpdir):
+    exofile = Exodus('sample-files/can.ex2', 'a')
+    with pytest.raises(ValueError):
+        exofile.write(str(tmpdir) + '\\test.ex2', filter='bogus')
+    # nothing was created, so writing to the same path again works
+    assert not os.path.exists(str(tmpdir) + '\\test.ex2')
+    exofile.write(str(tmpdir) + '\\test.ex2')
+    exofile.close()
+
+
+def test_write_filter_keeps_source_zlib(tmpdir):
+    # copy can.ex2 into a NetCDF4 file with every variable compressed
+    source = str(tmpdir) + '\\source.ex2'
+    with Dataset('sample-files/can.ex2') as src, Dataset(source, 'w', format='NETCDF4') as dst:
+        if not dst.has_blosc_filter():
+            pytest.skip("blosc filter not available")
+        dst.setncatts(src.__dict__)
+        for dim in src.dimensions.values():
+            dst.createDimension(dim.name, None if dim.isunlimited() else dim.size)
+        for var in src.variables.values():
+            copy = dst.createVariable(var.name, var.dtype, var.dimensions, zlib=True, complevel=2)
+            copy.setncatts(var.__dict__)
+            copy[...] = var[...]
+
+    exofile = Exodus(source, 'a')
+    exofile.write(str(tmpdir) + '\\test.ex2', filter='bitshuffle')
+    exofile.close()
+
+    with Dataset(str(tmpdir) + '\\test.ex2') as out, Dataset(source) as src:
+        # time_whole has no IO_HINTS entry, so it keeps its zlib compression
+        assert out.variables['time_whole'].filters()['zlib']
+        assert out.variables['time_whole'].filters()['complevel'] == 2
+        assert out.variables['coord'].filters()['blosc']
+        for name in ('time_whole', 'coord'):
+            assert np.array_equal(out.variables[name][:], src.variables[name][:])
+
+
 #############################################################################
 #                                                                           #
 #                            NodeSet Tests                                  #
@@ -448,6 +549,37 @@ def test_add_duplicate_nodes(tmpdir):
     assert np.array_equal(np.array([10, 11, 12]), data['node_ns1'])
 
 
+def test_add_node_to_nodeset_pending(tmpdir):
+    exofile = Exodus(str(tmpdir) + '\\test.ex2', 'w')
+
+    exofile.add_nodeset([10, 11, 12], 99)
+    exofile.add_nodeset([1, 2], 98)
+    with pytest.warns(PendingDeprecationWarning):
+        exofile.add_node_to_nodeset(15, 99)
+    exofile.add_node_to_nodeset(13, 'NodeSet 99')
+    with pytest.raises(KeyError):
+        exofile.add_node_to_nodeset(14, 97)
+    with pytest.raises(TypeError):
+        exofile.add_node_to_nodeset([14], 99)
+    exofile.add_node_to_nodeset(3, 98)
+
+    # nodes held back are applied before the node set is read or changed
+    assert np.array_equal(exofile.get_node_set(99), np.array([10, 11, 12, 13, 15]))
+    assert np.array_equal(exofile.get_node_set(98), np.array([1, 2, 3]))
+    exofile.add_node_to_nodeset(16, 99)
+    exofile.remove_nodes_from_nodeset([16], 99)
+    assert np.array_equal(exofile.get_node_set(99), np.array([10, 11, 12, 13, 15]))
+
+    # and before the node sets are written
+    exofile.add_node_to_nodeset(4, 98)
+    exofile.write()
+    exofile.close()
+    exofile = Exodus(str(tmpdir) + '\\test.ex2', 'r')
+    assert np.array_equal(exofile.get_node_set(98), np.array([1, 2, 3, 4]))
+    assert np.array_equal(exofile.get_node_set(99), np.array([10, 11, 12, 13, 15]))
+    exofile.close()
+
+
 def test_merge_ns_with_duplicate_nodes(tmpdir):
     exofile = Exodus(str(tmpdir) + '\\test.ex2', 'w')
     exofile.add_nodeset([12, 11, 10], 1)
@@ -497,6 +629,76 @@ def test_remove_duplicate_nodes(tmpdir):
         exofile.remove_nodes_from_nodeset([8, 8], 2)
 
 
+def test_remove_nodes_from_existing_nodeset():
+    exofile = Exodus('sample-files/output_test.ex2', 'a')
+    original = exofile.get_node_set(1)
+    exofile.remove_nodes_from_nodeset([original[0], original[5]], 1)
+
+    # the change is kept for node sets read from the file too
+    assert np.array_equal(exofile.get_node_set(1), np.setdiff1d(original, [original[0], original[5]]))
+    exofile.close()
+
+
+def test_add_nodes_to_existing_nodeset():
+    exofile = Exodus('sample-files/output_test.ex2', 'a')
+    original = exofile.get_node_set(1)
+    exofile.add_nodes_to_nodeset([original[3], 1, 100000, 1], 1)
+
+    assert np.array_equal(exofile.get_node_set(1), np.union1d(original, [1, 100000]))
+    exofile.close()
+
+
+def test_remove_nodes_from_existing_nodeset_write(tmpdir):
+    exofile = Exodus('sample-files/cube_with_data.exo', 'a')
+    old_nodes = exofile.get_node_set(3)
+    old_vals = exofile.get_node_set_var_at_time(3, 1, 1)
+    removed = [old_nodes[0], old_nodes[4]]
+    exofile.remove_nodes_from_nodeset(removed, 3)
+    exofile.write(str(tmpdir) + '\\test.exo')
+    exofile.close()
+
+    exofile = Exodus(str(tmpdir) + '\\test.exo', 'r')
+    nodes = exofile.get_node_set(3)
+    assert np.array_equal(nodes, np.setdiff1d(old_nodes, removed))
+    assert exofile.data.dimensions['num_nod_ns1'].size == len(old_nodes) - 2
+    expected_vals = dict(zip(old_nodes.tolist(), old_vals.tolist()))
+    assert np.array_equal(exofile.get_node_set_var_at_time(3, 1, 1), [expected_vals[n] for n in nodes.tolist()])
+    exofile.close()
+
+
+def test_add_nodes_to_existing_nodeset_write(tmpdir):
+    # give the node set distinct distribution factors, so the test can tell whether they are kept
+    source = str(tmpdir) + '\\source.exo'
+    shutil.copy('sample-files/cube_with_data.exo', source)
+    with Dataset(source, 'a') as data:
+        data['dist_fact_ns1'][:] = np.arange(1, 10)
+
+    exofile = Exodus(source, 'a')
+    old_nodes = exofile.get_node_set(3)
+    old_df = exofile.get_node_set_df(3)
+    old_vals = exofile.get_node_set_var_at_time(3, 1, 1)
+    exofile.add_nodes_to_nodeset([1, 2, 3], 3)
+    exofile.write(str(tmpdir) + '\\test.exo')
+    exofile.close()
+
+    exofile = Exodus(str(tmpdir) + '\\test.exo', 'r')
+    original = Exodus('sample-files/cube_with_data.exo', 'r')
+    nodes = exofile.get_node_set(3)
+    assert np.array_equal(nodes, np.union1d(old_nodes, [1, 2, 3]))
+    # nodes from the file keep their distribution factors and variable values, added nodes get 1 and 0
+    expected_df = dict(zip(old_nodes.tolist(), old_df.tolist()))
+    expected_vals = dict(zip(old_nodes.tolist(), old_vals.tolist()))
+    assert np.array_equal(exofile.get_node_set_df(3), [expected_df.get(n, 1.0) for n in nodes.tolist()])
+    assert np.array_equal(exofile.get_node_set_var_at_time(3, 1, 1),
+                          [expected_vals.get(n, 0.0) for n in nodes.tolist()])
+    # the other node set is copied unchanged
+    assert np.array_equal(exofile.get_node_set(6), original.get_node_set(6))
+    assert np.array_equal(exofile.get_node_set_var_at_time(6, 1, 2), original.get_node_set_var_at_time(6, 1, 2))
+    assert np.array_equal(exofile.get_node_set_truth_table(), original.get_node_set_truth_table())
+    original.close()
+    exofile.close()
+
+
 def test_basic_ns_append(tmpdir):
     exofile = Exodus('sample-files/can.ex2', 'a')
     exofile.add_nodeset([1, 2, 3, 4, 5], 10)
@@ -920,6 +1122,49 @@ def test_skin_can(tmpdir):
     assert len(ss[1]) == 5584
 
 
+def test_skin_element_block_can(tmpdir):
+    exofile = Exodus('sample-files/can.ex2', 'a')
+    block_id = int(exofile.get_elem_block_id_map()[0])
+    exofile.skin_element_block(block_id, 3313, "Block Skin")
+    exofile.write(str(tmpdir) + '\\test.ex2')
+    exofile.close()
+
+    written = Exodus(str(tmpdir) + '\\test.ex2', 'r')
+    original = Exodus('sample-files/can.ex2', 'r')
+    assert original.num_side_sets + 1 == written.num_side_sets
+    elems, sides = written.get_side_set(3313)
+    assert len(elems) == len(sides) > 0
+    # every side of the skin belongs to an element of the skinned block
+    num_elem_in_block = original.get_elem_block_params(block_id)[0]
+    assert np.all(elems <= num_elem_in_block)
+    original.close()
+    written.close()
+
+
+def test_step_at_time():
+    exofile = Exodus('sample-files/can.ex2', 'r')
+    times = exofile.get_all_times()
+    for step in range(exofile.num_time_steps):
+        assert exofile.step_at_time(times[step]) == step
+    assert exofile.step_at_time(-1.0) is None
+    exofile.close()
+
+
+def test_step_at_time_unsorted(tmpdir):
+    path = str(tmpdir) + '\\test.ex2'
+    shutil.copy('sample-files/can.ex2', path)
+    with Dataset(path, 'a') as data:
+        num_steps = data.dimensions['time_step'].size
+        data['time_whole'][:] = np.concatenate(([2, 0, 1, 2], np.arange(5, num_steps + 1)))
+
+    # times that repeat out of order give the first step with that time
+    exofile = Exodus(path, 'r')
+    assert exofile.step_at_time(2.0) == 0
+    assert exofile.step_at_time(1.0) == 2
+    assert exofile.step_at_time(5.0) == 4
+    assert exofile.step_at_time(-1.0) is None
+    exofile.close()
+
 
 # Below tests are based on what can be read according to current C Exodus API.
 # The contents, names, and number of tests are subject to change as work on the library progresses
@@ -16,7 +16,7 @@ def test_ns_selector():
     # Default selector
     ns = NodeSetSelector(input_file, ns_id)
     assert len(ns.nodes) == num_nod_ns
-    assert ns.nodes == list(range(num_nod_ns))
+    assert np.array_equal(ns.nodes, np.arange(num_nod_ns))
     # Number of variables selected should be the number of 1s in the truth table
     assert len(ns.variables) == num_var_ns
     # Assert that the variables selected are the same ones as are true in the truth table
@@ -25,13 +25,20 @@ def test_ns_selector():
 
     # None selector
     ns = NodeSetSelector(input_file, ns_id, None, None)
-    assert ns.nodes == []
-    assert ns.variables == []
+    assert np.array_equal(ns.nodes, [])
+    assert np.array_equal(ns.variables, [])
 
     # Empty list selector
     ns = NodeSetSelector(input_file, ns_id, [], [])
-    assert ns.nodes == []
-    assert ns.variables == []
+    assert np.array_equal(ns.nodes, [])
+    assert np.array_equal(ns.variables, [])
+    assert ns.nodes.dtype == np.int64 and ns.variables.dtype == np.int64
+
+    # Sets and generators are accepted too
+    ns = NodeSetSelector(input_file, ns_id, nodes={3, 1, 2})
+    assert np.array_equal(ns.nodes, [0, 1, 2])
+    ns = NodeSetSelector(input_file, ns_id, nodes=(n for n in [2, 1]))
+    assert np.array_equal(ns.nodes, [0, 1])
 
     # Out of bounds selectors
     with pytest.raises(IndexError):
@@ -64,7 +71,7 @@ def test_ns_selector():
     ns = NodeSetSelector(input_file, ns_id, [1, 3, 2, 5], [2, 1])
 
     assert np.array_equal(nod_ns[ns.nodes], [22, 16, 4, 19])
-    assert ns.variables == [0, 1]
+    assert np.array_equal(ns.variables, [0, 1])
 
     input_file.close()
 
@@ -82,7 +89,7 @@ def test_ss_selector():
     # Default selector
     ss = SideSetSelector(input_file, ss_id)
     assert len(ss.sides) == num_elem_ss
-    assert ss.sides == list(range(num_elem_ss))
+    assert np.array_equal(ss.sides, np.arange(num_elem_ss))
     # Number of variables selected should be the number of 1s in the truth table
     assert len(ss.variables) == num_var_ss
     # Assert that the variables selected are the same ones as are true in the truth table
@@ -91,13 +98,13 @@ def test_ss_selector():
 
     # None selector
     ss = SideSetSelector(input_file, ss_id, None, None)
-    assert ss.sides == []
-    assert ss.variables == []
+    assert np.array_equal(ss.sides, [])
+    assert np.array_equal(ss.variables, [])
 
     # Empty list selector
     ss = SideSetSelector(input_file, ss_id, [], [])
-    assert ss.sides == []
-    assert ss.variables == []
+    assert np.array_equal(ss.sides, [])
+    assert np.array_equal(ss.variables, [])
 
     # Out of bounds selectors
     with pytest.raises(IndexError):
@@ -132,7 +139,7 @@ def test_ss_selector():
 
     assert np.array_equal(elem_ss[ss.sides], [5, 7])
     assert np.array_equal(side_ss[ss.sides], [6, 6])
-    assert ss.variables == [0, 1]
+    assert np.array_equal(ss.variables, [0, 1])
 
     input_file.close()
 
@@ -150,26 +157,26 @@ def test_eb_selector():
     # Default selector
     eb = ElementBlockSelector(input_file, eb_id)
     assert len(eb.elements) == num_elem_eb
-    assert eb.elements == list(range(num_elem_eb))
+    assert np.array_equal(eb.elements, np.arange(num_elem_eb))
     # Number of variables selected should be the number of 1s in the truth table
     assert len(eb.variables) == num_var_eb
     # Assert that the variables selected are the same ones as are true in the truth table
     for idx in eb.variables:
         assert tab_eb[idx]
     assert len(eb.attributes) == num_attr_eb
-    assert eb.attributes == list(range(num_attr_eb))
+    assert np.array_equal(eb.attributes, np.arange(num_attr_eb))
 
     # None selector
     eb = ElementBlockSelector(input_file, eb_id, None, None, None)
-    assert eb.elements == []
-    assert eb.variables == []
-    assert eb.attributes == []
+    assert np.array_equal(eb.elements, [])
+    assert np.array_equal(eb.variables, [])
+    assert np.array_equal(eb.attributes, [])
 
     # Empty list selector
     eb = ElementBlockSelector(input_file, eb_id, [], [], [])
-    assert eb.elements == []
-    assert eb.variables == []
-    assert eb.attributes == []
+    assert np.array_equal(eb.elements, [])
+    assert np.array_equal(eb.variables, [])
+    assert np.array_equal(eb.attributes, [])
 
     # Out of bounds selectors
     with pytest.raises(IndexError):
@@ -221,8 +228,8 @@ def test_eb_selector():
 
     assert np.array_equal(connect[eb.elements], [[6262, 6253, 6263], [6134, 6143, 6133], [6375, 6366, 6376],
                                                  [6307, 6298, 6308], [6327, 6336, 6326]])
-    assert eb.variables == [0]
-    assert eb.attributes == [0]
+    assert np.array_equal(eb.variables, [0])
+    assert np.array_equal(eb.attributes, [0])
 
     input_file.close()
 
@@ -234,7 +241,7 @@ def test_eb_selector():
     # Selector with attribute names
     with pytest.warns(Warning):  # We expect a warning that biplane has multiple attributes with the same name
         eb = ElementBlockSelector(input_file, eb_id, attributes=[''])
-        assert eb.attributes == [0, 1, 2, 3, 4, 5, 6]
+        assert np.array_equal(eb.attributes, [0, 1, 2, 3, 4, 5, 6])
     # Duplicate attribute names in list
     with pytest.warns(Warning):
         eb = ElementBlockSelector(input_file, eb_id, attributes=['', ''])